@@ -198,3 +198,27 @@ async def startup_event():
     from backend.api.routes.ws import start_cleanup_task
 
     start_cleanup_task()
+
+    # Start bot AI workers now rather than on the first bot turn
+    from backend.engine.bot_executor import get_bot_executor
+
+    get_bot_executor().warm_up()
+
+    # Open event storage now rather than on the first stored event
+    from backend.api.services.event_store import event_store
+
+    await event_store.open()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Run cleanup tasks when the application stops.
+    """
+    from backend.api.services.event_store import event_store
+    from backend.engine.bot_executor import shutdown_bot_executors
+
+    shutdown_bot_executors()
+
+    # Commit any events still queued and release storage connections
+    await event_store.close()
@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 
 from backend.api.services.event_store import event_store
 from backend.api.services.log_buffer import log_buffer, LogLevel
+from backend.api.routes.streaming import streaming_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +54,9 @@ async def get_room_events(
                 }
             )
 
-        # Get event statistics
-        stats = await event_store.get_event_stats()
-        room_stats = stats.get("room_stats", {}).get(room_id, 0)
+        # Get the room's event count from the room index
+        room_index = event_store.get_room_index(room_id)
+        room_stats = room_index["event_count"] if room_index else 0
 
         return {
             "room_id": room_id,
@@ -174,15 +175,13 @@ async def export_room_history(room_id: str):
         room_id: The room identifier
 
     Returns:
-        Complete room history with timeline and analysis
+        Complete room history with timeline and analysis (streamed in
+        chunks, so long games don't have to fit in memory)
     """
-    try:
-        history = await event_store.export_room_history(room_id)
-        return history
-
-    except Exception as e:
-        logger.error(f"Error exporting history for room {room_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await streaming_json_response(
+        event_store.stream_room_history(room_id),
+        f"Error exporting history for room {room_id}",
+    )
 
 
 @router.get("/stats")
@@ -1,6 +1,7 @@
 # backend/api/routes/routes.py
 
 import asyncio
+import json
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -24,6 +25,7 @@ from backend.engine.state_machine.core import ActionType, GameAction
 
 # Import debug routes
 from . import debug
+from .streaming import streaming_json_response
 
 # Import EventStore for recovery endpoints
 try:
@@ -291,30 +293,51 @@ async def get_all_room_events(
         limit: Optional limit on number of events
 
     Returns:
-        Dict: All events for the room
+        Dict: All events for the room (streamed in chunks, so long games
+        don't have to fit in memory)
     """
     if not EVENT_STORE_AVAILABLE or not event_store:
         raise HTTPException(status_code=501, detail="Event store not available")
 
-    try:
-        events = await event_store.get_room_events(room_id, limit)
+    return await streaming_json_response(
+        _stream_room_events(room_id, limit), "Failed to retrieve all events"
+    )
 
-        return {
-            "success": True,
-            "room_id": room_id,
-            "event_count": len(events),
-            "events": [event.to_dict() for event in events],
-            "analysis": {
-                "first_event": events[0].created_at if events else None,
-                "last_event": events[-1].created_at if events else None,
-                "event_types": list(set(event.event_type for event in events)),
-            },
-        }
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to retrieve all events: {str(e)}"
-        )
+async def _stream_room_events(room_id: str, limit: Optional[int]):
+    """Yield the get_all_room_events document as JSON text chunks"""
+    event_count = 0
+    first_event = last_event = None
+    event_types: Dict[str, None] = {}  # Ordered set
+    batch: List[str] = []
+
+    # Read the first event before the header, so open, flush and query
+    # errors fail the request with a 500 instead of truncating the body
+    events = event_store.iter_events(room_id, limit=limit)
+    event = await anext(events, None)
+
+    yield f'{{"success": true, "room_id": {json.dumps(room_id)}, "events": ['
+    while event is not None:
+        batch.append(("" if event_count == 0 else ", ") + json.dumps(event.to_dict()))
+        event_count += 1
+        if first_event is None:
+            first_event = event.created_at
+        last_event = event.created_at
+        event_types[event.event_type] = None
+        if len(batch) >= 200:
+            yield "".join(batch)
+            batch.clear()
+        event = await anext(events, None)
+
+    analysis = {
+        "first_event": first_event,
+        "last_event": last_event,
+        "event_types": list(event_types),
+    }
+    batch.append(
+        f'], "event_count": {event_count}, "analysis": {json.dumps(analysis)}}}'
+    )
+    yield "".join(batch)
 
 
 @router.get("/event-store/stats")
@@ -607,6 +630,22 @@ async def health_metrics():
         metrics.append(f"liap_websocket_connections_total {total_connections}")
         metrics.append(f"liap_websocket_pending_messages_total {total_pending}")
 
+        # Broadcast queue metrics (per room)
+        for queue_room_id, queue in socket_manager.broadcast_queues.items():
+            queue_stats = queue.get_stats()
+            labels = f'{{room_id="{queue_room_id}"}}'
+            metrics.append(f"liap_broadcast_queue_depth{labels} {queue_stats['depth']}")
+            metrics.append(
+                f"liap_broadcast_dropped_total{labels} {queue_stats['dropped']}"
+            )
+            metrics.append(
+                f"liap_broadcast_coalesced_total{labels} {queue_stats['coalesced']}"
+            )
+        metrics.append(
+            f"liap_broadcast_slow_consumers_closed_total "
+            f"{socket_manager.slow_consumers_closed}"
+        )
+
         # Room metrics
         room_count = len(room_manager.rooms)
         active_games = sum(1 for room in room_manager.rooms.values() if room.started)
@@ -742,6 +781,38 @@ async def rate_limit_stats():
         )
 
 
+@router.get("/bot/stats")
+async def bot_stats():
+    """
+    Get bot AI statistics
+
+    Returns:
+        Dict: Bot decision cache, batching and executor latency statistics,
+              and bot configuration
+    """
+    try:
+        from backend.config.bot_config import get_bot_config
+        from backend.engine.async_bot_strategy import async_bot_strategy
+        from backend.engine.bot_executor import get_executor_stats
+        from backend.engine.bot_scheduler import get_decision_scheduler
+
+        scheduler = get_decision_scheduler()
+
+        return {
+            "success": True,
+            "timestamp": time.time(),
+            "decision_cache": async_bot_strategy.get_cache_stats(),
+            "executor": get_executor_stats(),
+            "batching": scheduler.get_stats() if scheduler else {},
+            "config": get_bot_config().to_dict(),
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get bot stats: {str(e)}"
+        )
+
+
 @router.get("/system/stats")
 async def system_stats():
     """
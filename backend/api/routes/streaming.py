@@ -0,0 +1,49 @@
+# backend/api/routes/streaming.py
+
+"""
+Helpers for streaming large JSON documents from REST routes.
+"""
+
+import logging
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+
+async def streaming_json_response(
+    chunks: AsyncIterator[str], error_detail: str = "Failed to stream response"
+) -> StreamingResponse:
+    """
+    Wrap an async iterator of JSON text chunks in a StreamingResponse.
+
+    The first chunk is produced before the response starts, so failures
+    during setup (lookups, replay) still become a normal HTTP 500. Once
+    streaming has begun the status can't change; a later error is logged
+    and ends the (then truncated) body.
+
+    Args:
+        chunks: Consecutive pieces of one JSON document
+        error_detail: Message prefix for the HTTP 500 raised on setup failure
+
+    Returns:
+        StreamingResponse: application/json response streaming the chunks
+    """
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = ""
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{error_detail}: {str(e)}")
+
+    async def body() -> AsyncIterator[str]:
+        yield first_chunk
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            logger.error(f"{error_detail} (mid-stream): {e}")
+
+    return StreamingResponse(body(), media_type="application/json")
@@ -350,13 +350,23 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
 
             # Handle reliable message delivery events
             if event_name == "ack":
-                # Handle message acknowledgment
+                # Handle message acknowledgment: a single sequence, or a batch
+                # (cumulative "up_to" plus selective "ranges") in one pass
                 sequence = event_data.get("sequence")
+                up_to = event_data.get("up_to")
+                ranges = event_data.get("ranges")
                 client_id = event_data.get("client_id", "unknown")
 
-                if sequence is not None:
-                    from backend.socket_manager import socket_manager
+                from backend.socket_manager import _socket_manager as socket_manager
 
+                if up_to is not None or ranges:
+                    ranges = [tuple(ack_range) for ack_range in ranges or []]
+                    if sequence is not None:
+                        ranges.append((sequence, sequence))
+                    await socket_manager.handle_acks(
+                        room_id, up_to, ranges, client_id, registered_ws
+                    )
+                elif sequence is not None:
                     await socket_manager.handle_ack(room_id, sequence, client_id)
                 continue
 
@@ -364,7 +374,7 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
                 # Handle client synchronization request
                 client_id = event_data.get("client_id", "unknown")
 
-                from backend.socket_manager import socket_manager
+                from backend.socket_manager import _socket_manager as socket_manager
 
                 await socket_manager.request_client_sync(
                     room_id, registered_ws, client_id
@@ -751,13 +761,13 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
                                     for action in room.game_state_machine.get_allowed_actions()
                                 ]
 
-                                # Add player hands data
+                                # Add player data; only the reconnecting
+                                # player's own hand is sent (as "private")
                                 players_data = {}
+                                own_hand = []
                                 if room.game and hasattr(room.game, "players"):
                                     for player in room.game.players:
-                                        player_name = getattr(
-                                            player, "name", str(player)
-                                        )
+                                        name = getattr(player, "name", str(player))
                                         player_hand = []
 
                                         # Get player's hand
@@ -766,8 +776,10 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
                                                 str(piece) for piece in player.hand
                                             ]
 
-                                        players_data[player_name] = {
-                                            "hand": player_hand,
+                                        if name == player_name:
+                                            own_hand = player_hand
+
+                                        players_data[name] = {
                                             "hand_size": len(player_hand),
                                             "zero_declares_in_a_row": getattr(
                                                 player, "zero_declares_in_a_row", 0
@@ -792,6 +804,7 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str):
                                             "phase_data": phase_data,
                                             "players": players_data,
                                             "round": current_round,
+                                            "private": {"hand": own_hand},
                                         },
                                     }
                                 )
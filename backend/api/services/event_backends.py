@@ -0,0 +1,337 @@
+"""
+Storage backends for the event store
+
+EventStore owns numbering, payload encoding, the room index and replay; a
+backend only stores rows and snapshots and answers queries about them.
+Backends:
+- "sqlite":   time-partitioned SQLite files on local disk (event_sqlite)
+- "memory":   a bounded in-memory ring buffer, for tests and benchmarks
+- "postgres": PostgreSQL through an asyncpg-style pool (event_postgres),
+              so several server processes can share one event log
+
+Backends several processes write at once derive from SharedEventBackend,
+which adds sequence number reservation.
+
+Rows are tuples in the order of EVENT_COLUMNS. Writes are queued by
+append() and made durable by flush(); read methods return rows with the
+payload already decoded.
+"""
+
+import bisect
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from backend.api.services.event_codec import decode_payload
+from backend.api.services.event_partitions import RoomRange
+from backend.config.event_store_config import EVENT_BACKENDS
+
+EVENT_COLUMNS = (
+    "sequence",
+    "room_id",
+    "event_type",
+    "payload",
+    "player_id",
+    "timestamp",
+    "created_at",
+    "room_sequence",
+)
+
+EventRow = Tuple[Any, ...]
+
+
+class EventBackend(ABC):
+    """Base class: storage for event rows, room snapshots and retention"""
+
+    name = "base"
+    # True for SharedEventBackend: several processes write one log, so
+    # global and per-room sequence numbers are reserved from the backend
+    # instead of counted locally
+    shared = False
+
+    @abstractmethod
+    async def open(self) -> Tuple[int, Dict[str, RoomRange]]:
+        """
+        Prepare storage.
+
+        Returns:
+            Tuple: (last stored sequence, per-room ranges of stored events)
+        """
+
+    def partition_key(self, timestamp: float) -> float:
+        """Retention unit an event written at `timestamp` falls into."""
+        return 0.0
+
+    @abstractmethod
+    def append(self, row: EventRow) -> None:
+        """Queue one event row for the next commit."""
+
+    def take_evicted(self) -> Dict[str, int]:
+        """Per-room counts of events evicted on write since the last call."""
+        return {}
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Wait until every row appended so far is committed."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Commit pending rows and release connections."""
+
+    @abstractmethod
+    async def read_events(
+        self,
+        room_id: str,
+        after_sequence: int,
+        event_type: Optional[str],
+        limit: int,
+    ) -> List[EventRow]:
+        """Up to `limit` of a room's rows after `after_sequence`, in order."""
+
+    @abstractmethod
+    async def read_payload(self, sequence: int) -> Optional[Any]:
+        """Decoded payload of the event with this sequence (None if gone)."""
+
+    @abstractmethod
+    async def stored_room_range(self, room_id: str) -> Optional[RoomRange]:
+        """Sequence ranges and count of a room's committed events."""
+
+    @abstractmethod
+    async def room_sequences(self, room_id: str) -> List[int]:
+        """Room sequence numbers of a room's committed events, in order."""
+
+    @abstractmethod
+    async def room_event_types(self, room_id: str) -> List[str]:
+        """A room's event types in order of first appearance."""
+
+    @abstractmethod
+    async def query_stats(self, since_timestamp: float) -> Dict[str, Any]:
+        """Events per type ("event_type_stats") and since a time ("events_last_24h")."""
+
+    @abstractmethod
+    async def load_snapshot(self, room_id: str) -> Optional[str]:
+        """A room's stored state snapshot (JSON text), if any."""
+
+    @abstractmethod
+    def save_snapshot(
+        self, room_id: str, sequence: int, state: str, timestamp: float
+    ) -> None:
+        """Queue a room state snapshot (JSON text) for the next commit."""
+
+    @abstractmethod
+    async def snapshot_rooms(self) -> List[str]:
+        """Rooms that have a stored snapshot."""
+
+    @abstractmethod
+    def delete_snapshot(self, room_id: str) -> None:
+        """Queue removal of a room's snapshot."""
+
+    @abstractmethod
+    async def drop_before(self, cutoff_timestamp: float) -> Dict[str, int]:
+        """
+        Remove old events (at the backend's retention granularity).
+
+        Returns:
+            Dict: Number of events removed per room
+        """
+
+    @abstractmethod
+    async def ping(self) -> None:
+        """Raise if storage is unreachable."""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend-specific statistics."""
+        return {"backend": self.name}
+
+
+class SharedEventBackend(EventBackend):
+    """Base class for backends that several server processes write at once"""
+
+    shared = True
+
+    @abstractmethod
+    async def reserve_sequences(self, count: int) -> int:
+        """Reserve `count` global sequence numbers; return the first."""
+
+    @abstractmethod
+    async def reserve_room_sequence(self, room_id: str) -> int:
+        """Reserve the next room sequence number for a room."""
+
+
+class MemoryEventBackend(EventBackend):
+    """
+    In-memory ring buffer holding the newest `capacity` events.
+
+    Nothing is persisted; appending past capacity evicts the oldest event
+    (reported through take_evicted). Payloads are kept encoded, so reads
+    cost the same decoding work as the disk backends.
+    """
+
+    name = "memory"
+
+    def __init__(self, capacity: int = 100_000):
+        self.capacity = capacity
+        self._rows: Deque[EventRow] = deque()
+        self._by_room: Dict[str, Deque[EventRow]] = {}
+        self._by_sequence: Dict[int, EventRow] = {}
+        self._snapshots: Dict[str, Tuple[int, str, float]] = {}
+        self._evicted: Counter = Counter()
+        self.total_evicted = 0
+
+    async def open(self) -> Tuple[int, Dict[str, RoomRange]]:
+        last_sequence = self._rows[-1][0] if self._rows else 0
+        rooms = {}
+        for room_id in self._by_room:
+            rooms[room_id] = await self.stored_room_range(room_id)
+        return last_sequence, rooms
+
+    def append(self, row: EventRow) -> None:
+        self._rows.append(row)
+        self._by_room.setdefault(row[1], deque()).append(row)
+        self._by_sequence[row[0]] = row
+        while len(self._rows) > self.capacity:
+            self._remove_oldest()
+
+    def _remove_oldest(self) -> EventRow:
+        row = self._rows.popleft()
+        room_rows = self._by_room[row[1]]
+        room_rows.popleft()
+        if not room_rows:
+            del self._by_room[row[1]]
+        del self._by_sequence[row[0]]
+        self._evicted[row[1]] += 1
+        self.total_evicted += 1
+        return row
+
+    def take_evicted(self) -> Dict[str, int]:
+        if not self._evicted:
+            return {}
+        evicted, self._evicted = dict(self._evicted), Counter()
+        return evicted
+
+    async def flush(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    @staticmethod
+    def _decoded(row: EventRow) -> EventRow:
+        return row[:3] + (decode_payload(row[3]),) + row[4:]
+
+    async def read_events(
+        self,
+        room_id: str,
+        after_sequence: int,
+        event_type: Optional[str],
+        limit: int,
+    ) -> List[EventRow]:
+        room_rows = self._by_room.get(room_id)
+        if not room_rows:
+            return []
+        start = bisect.bisect_right(room_rows, after_sequence, key=lambda r: r[0])
+        rows = []
+        for index in range(start, len(room_rows)):
+            row = room_rows[index]
+            if event_type and row[2] != event_type:
+                continue
+            rows.append(self._decoded(row))
+            if len(rows) >= limit:
+                break
+        return rows
+
+    async def read_payload(self, sequence: int) -> Optional[Any]:
+        row = self._by_sequence.get(sequence)
+        return decode_payload(row[3]) if row else None
+
+    async def stored_room_range(self, room_id: str) -> Optional[RoomRange]:
+        room_rows = self._by_room.get(room_id)
+        if not room_rows:
+            return None
+        return RoomRange(
+            first_sequence=room_rows[0][0],
+            last_sequence=room_rows[-1][0],
+            event_count=len(room_rows),
+            first_room_sequence=room_rows[0][7],
+            last_room_sequence=room_rows[-1][7],
+        )
+
+    async def room_sequences(self, room_id: str) -> List[int]:
+        return [row[7] for row in self._by_room.get(room_id, ())]
+
+    async def room_event_types(self, room_id: str) -> List[str]:
+        return list(dict.fromkeys(row[2] for row in self._by_room.get(room_id, ())))
+
+    async def query_stats(self, since_timestamp: float) -> Dict[str, Any]:
+        type_counts = Counter(row[2] for row in self._rows)
+        return {
+            "events_last_24h": sum(1 for row in self._rows if row[5] > since_timestamp),
+            "event_type_stats": dict(type_counts.most_common()),
+        }
+
+    async def load_snapshot(self, room_id: str) -> Optional[str]:
+        snapshot = self._snapshots.get(room_id)
+        return snapshot[1] if snapshot else None
+
+    def save_snapshot(
+        self, room_id: str, sequence: int, state: str, timestamp: float
+    ) -> None:
+        self._snapshots[room_id] = (sequence, state, timestamp)
+
+    async def snapshot_rooms(self) -> List[str]:
+        return list(self._snapshots)
+
+    def delete_snapshot(self, room_id: str) -> None:
+        self._snapshots.pop(room_id, None)
+
+    async def drop_before(self, cutoff_timestamp: float) -> Dict[str, int]:
+        # Rows are in sequence order, which is also time order
+        while self._rows and self._rows[0][5] < cutoff_timestamp:
+            self._remove_oldest()
+        return self.take_evicted()
+
+    async def ping(self) -> None:
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "capacity": self.capacity,
+            "stored_events": len(self._rows),
+            "evicted_events": self.total_evicted,
+            "snapshots": len(self._snapshots),
+        }
+
+
+def create_event_backend(name: str, **options: Any) -> EventBackend:
+    """
+    Create the storage backend with the given name.
+
+    Args:
+        name: One of EVENT_BACKENDS
+        **options: Constructor arguments for that backend
+
+    Raises:
+        ValueError: If the backend is unknown or its package isn't installed
+    """
+    if name == "sqlite":
+        from backend.api.services.event_sqlite import SqliteEventBackend
+
+        return SqliteEventBackend(**options)
+    if name == "memory":
+        return MemoryEventBackend(**options)
+    if name == "postgres":
+        from backend.api.services.event_postgres import PostgresEventBackend
+
+        return PostgresEventBackend(**options)
+    raise ValueError(f"Unknown event store backend: {name}")
+
+
+__all__ = [
+    "EVENT_BACKENDS",
+    "EVENT_COLUMNS",
+    "EventBackend",
+    "MemoryEventBackend",
+    "SharedEventBackend",
+    "create_event_backend",
+]
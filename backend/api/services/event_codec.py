@@ -0,0 +1,259 @@
+"""
+Payload encoding for the event store
+
+Event payloads can be stored as:
+- "json":        plain JSON text (human readable, the original format)
+- "msgpack":     MessagePack (requires the msgpack package)
+- "zlib":        JSON compressed with zlib and a shared dictionary
+- "zstd":        JSON compressed with zstd and a shared dictionary
+                 (requires the zstandard package)
+
+Binary encodings start with a one-byte codec id, so rows written with
+any codec (including legacy JSON text rows) decode transparently.
+
+This module also provides the patch format used to store phase_change
+payloads as diffs against the room's previous phase_change.
+"""
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Union
+
+from backend.config.event_store_config import PAYLOAD_CODECS
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+EncodedPayload = Union[str, bytes]
+
+# Strings that recur in almost every payload (event keys, phase names,
+# piece names). Compressors seed their window with this, so even small
+# payloads compress well. Never edit it in place: stored rows depend on
+# it. Add a new version with a new codec id instead.
+SHARED_DICTIONARY_V1 = (
+    '{"phase": "preparation", "phase": "round_start", "phase": "declaration", '
+    '"phase": "turn", "phase": "turn_results", "phase": "scoring", '
+    '"phase": "game_over", "phase": "waiting", "phase_data": {}, '
+    '"players": {"name": "", "is_bot": true, "is_bot": false, '
+    '"avatar_color": null, "hand": [], "hand_size": 8, '
+    '"zero_declares_in_a_row": 0, "declared": 0, "captured_piles": 0, '
+    '"score": 0}, "reason": "", "sequence": 0, "timestamp": 0, '
+    '"action_type": "play_pieces", "action_type": "declare", '
+    '"player_name": "", "sequence_id": 0, "payload": {"pieces": []}, '
+    '"updates": {}, "old_phase": null, "new_phase": "", "game_context": {}, '
+    '"round_number": 1, "turn_number": 0, "current_player": "", '
+    '"declarations": {}, "declaration_order": [], "turn_order": [], '
+    '"required_piece_count": null, "current_turn_starter": "", '
+    '"weak_players": [], "redeal_multiplier": 1, "round_scores": {}, '
+    '"GENERAL_RED(14)", "GENERAL_BLACK(13)", "ADVISOR_RED(12)", '
+    '"ADVISOR_BLACK(11)", "ELEPHANT_RED(10)", "ELEPHANT_BLACK(9)", '
+    '"CHARIOT_RED(8)", "CHARIOT_BLACK(7)", "HORSE_RED(6)", "HORSE_BLACK(5)", '
+    '"CANNON_RED(4)", "CANNON_BLACK(3)", "SOLDIER_RED(2)", "SOLDIER_BLACK(1)"'
+).encode("utf-8")
+
+
+class PayloadCodec(ABC):
+    """Base class: converts payload dicts to stored values and back"""
+
+    name = "base"
+    codec_id: Optional[int] = None  # Prefix byte for binary encodings
+
+    @abstractmethod
+    def encode(self, payload: Any) -> EncodedPayload:
+        """Convert a payload to its stored form."""
+
+    @abstractmethod
+    def decode(self, data: EncodedPayload) -> Any:
+        """Convert a stored value back to its payload."""
+
+
+class JsonCodec(PayloadCodec):
+    """Plain JSON text"""
+
+    name = "json"
+
+    def encode(self, payload: Any) -> EncodedPayload:
+        return json.dumps(payload)
+
+    def decode(self, data: EncodedPayload) -> Any:
+        return json.loads(data)
+
+
+class MsgpackCodec(PayloadCodec):
+    """MessagePack binary encoding"""
+
+    name = "msgpack"
+    codec_id = 1
+
+    def encode(self, payload: Any) -> EncodedPayload:
+        return bytes((self.codec_id,)) + msgpack.packb(payload, use_bin_type=True)
+
+    def decode(self, data: EncodedPayload) -> Any:
+        return msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+
+
+class ZlibCodec(PayloadCodec):
+    """JSON compressed with zlib, using the shared dictionary"""
+
+    name = "zlib"
+    codec_id = 2
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, payload: Any) -> EncodedPayload:
+        compressor = zlib.compressobj(self.level, zdict=SHARED_DICTIONARY_V1)
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        compressed = compressor.compress(raw) + compressor.flush()
+        return bytes((self.codec_id,)) + compressed
+
+    def decode(self, data: EncodedPayload) -> Any:
+        decompressor = zlib.decompressobj(zdict=SHARED_DICTIONARY_V1)
+        raw = decompressor.decompress(data[1:]) + decompressor.flush()
+        return json.loads(raw)
+
+
+class ZstdCodec(PayloadCodec):
+    """JSON compressed with zstd, using the shared dictionary"""
+
+    name = "zstd"
+    codec_id = 3
+
+    def __init__(self, level: int = 3):
+        dictionary = zstandard.ZstdCompressionDict(
+            SHARED_DICTIONARY_V1, dict_type=zstandard.DICT_TYPE_RAWCONTENT
+        )
+        self._compressor = zstandard.ZstdCompressor(level=level, dict_data=dictionary)
+        self._decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+
+    def encode(self, payload: Any) -> EncodedPayload:
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return bytes((self.codec_id,)) + self._compressor.compress(raw)
+
+    def decode(self, data: EncodedPayload) -> Any:
+        return json.loads(self._decompressor.decompress(data[1:]))
+
+
+_codecs: Dict[str, PayloadCodec] = {}
+
+
+def get_codec(name: str) -> PayloadCodec:
+    """
+    Get the codec with the given name.
+
+    Raises:
+        ValueError: If the codec is unknown or its package isn't installed
+    """
+    if name not in _codecs:
+        if name == "json":
+            _codecs[name] = JsonCodec()
+        elif name == "zlib":
+            _codecs[name] = ZlibCodec()
+        elif name == "msgpack":
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("msgpack codec requires the msgpack package")
+            _codecs[name] = MsgpackCodec()
+        elif name == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ValueError("zstd codec requires the zstandard package")
+            _codecs[name] = ZstdCodec()
+        else:
+            raise ValueError(f"Unknown payload codec: {name}")
+    return _codecs[name]
+
+
+_CODEC_NAMES_BY_ID = {
+    MsgpackCodec.codec_id: "msgpack",
+    ZlibCodec.codec_id: "zlib",
+    ZstdCodec.codec_id: "zstd",
+}
+
+
+def decode_payload(data: EncodedPayload) -> Any:
+    """Decode a stored payload written by any codec."""
+    if isinstance(data, str):
+        return json.loads(data)
+    codec_name = _CODEC_NAMES_BY_ID.get(data[0])
+    if codec_name is None:
+        # Text stored as a blob by an older writer
+        return json.loads(data)
+    return get_codec(codec_name).decode(data)
+
+
+# ------------------------------------------------------------------
+# Payload diffs
+# ------------------------------------------------------------------
+DIFF_KEY = "__diff__"
+
+
+def make_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a patch that turns `old` into `new`.
+
+    Nested dicts are patched recursively; any other changed value is
+    replaced whole.
+
+    Returns:
+        dict: {"set": {...}, "unset": [...], "patch": {key: nested patch}},
+        with empty parts omitted
+    """
+    changed: Dict[str, Any] = {}
+    nested: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            changed[key] = value
+            continue
+        old_value = old[key]
+        if old_value == value:
+            continue
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            nested[key] = make_patch(old_value, value)
+        else:
+            changed[key] = value
+    removed: List[str] = [key for key in old if key not in new]
+
+    patch: Dict[str, Any] = {}
+    if changed:
+        patch["set"] = changed
+    if nested:
+        patch["patch"] = nested
+    if removed:
+        patch["unset"] = removed
+    return patch
+
+
+def apply_patch(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a new dict: `base` with `patch` (from make_patch) applied."""
+    result = dict(base)
+    for key in patch.get("unset", ()):
+        result.pop(key, None)
+    for key, nested in patch.get("patch", {}).items():
+        old_value = result.get(key)
+        result[key] = apply_patch(
+            old_value if isinstance(old_value, dict) else {}, nested
+        )
+    result.update(patch.get("set", {}))
+    return result
+
+
+__all__ = [
+    "PAYLOAD_CODECS",
+    "PayloadCodec",
+    "get_codec",
+    "decode_payload",
+    "make_patch",
+    "apply_patch",
+    "DIFF_KEY",
+]
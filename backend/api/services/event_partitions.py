@@ -0,0 +1,520 @@
+"""
+Time partitions for the event store
+
+Events are written to one SQLite file per time window (hour or day) in a
+partition directory, so retention drops whole files instead of running a
+DELETE over one large table. Each partition file keeps a small
+room_ranges table (first/last sequence and event count per room) that is
+updated in the same transaction as its events; at startup those tables
+are loaded into an in-memory room -> partition index used to route reads.
+
+Besides the global sequence, every event carries a per-room sequence
+(room_sequence: 1, 2, 3... within its room). Files written before
+per-room numbering are backfilled when first loaded.
+
+Events stored before partitioning (the game_events table in the main
+database file) are exposed as a read-only "legacy" partition.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PARTITION_WINDOWS = {"hour": 3600, "day": 86400}
+LEGACY_PARTITION = "legacy"
+
+
+@dataclass
+class RoomRange:
+    """Sequence ranges and event count of one room (within one partition)"""
+
+    first_sequence: int
+    last_sequence: int
+    event_count: int
+    first_room_sequence: int = 0
+    last_room_sequence: int = 0
+
+
+@dataclass
+class PartitionInfo:
+    """One partition file and the events it holds"""
+
+    name: str
+    path: str
+    start_ts: float
+    end_ts: float
+    first_sequence: int = 0
+    last_sequence: int = 0
+    event_count: int = 0
+    rooms: Dict[str, RoomRange] = field(default_factory=dict)
+
+
+def init_partition_schema(
+    conn: sqlite3.Connection, room_offsets: Optional[Dict[str, int]] = None
+) -> None:
+    """
+    Create the events and room_ranges tables in a partition file
+
+    Args:
+        conn: Connection to the partition file
+        room_offsets: Last room_sequence per room in earlier partitions,
+            used to number the events of a file written before per-room
+            sequences existed
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS game_events (
+            sequence INTEGER PRIMARY KEY,
+            room_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            player_id TEXT,
+            timestamp REAL NOT NULL,
+            created_at TEXT NOT NULL,
+            room_sequence INTEGER
+        )
+    """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_room_sequence ON game_events(room_id, sequence)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS room_ranges (
+            room_id TEXT PRIMARY KEY,
+            first_sequence INTEGER NOT NULL,
+            last_sequence INTEGER NOT NULL,
+            event_count INTEGER NOT NULL,
+            first_room_sequence INTEGER NOT NULL DEFAULT 0,
+            last_room_sequence INTEGER NOT NULL DEFAULT 0
+        )
+    """
+    )
+    if not _has_column(conn, "room_ranges", "last_room_sequence"):
+        conn.execute(
+            "ALTER TABLE room_ranges"
+            " ADD COLUMN first_room_sequence INTEGER NOT NULL DEFAULT 0"
+        )
+        conn.execute(
+            "ALTER TABLE room_ranges"
+            " ADD COLUMN last_room_sequence INTEGER NOT NULL DEFAULT 0"
+        )
+    if number_room_events(conn, room_offsets or {}):
+        conn.execute(
+            """
+            UPDATE room_ranges SET
+                first_room_sequence = (
+                    SELECT MIN(room_sequence) FROM game_events e
+                    WHERE e.room_id = room_ranges.room_id
+                ),
+                last_room_sequence = (
+                    SELECT MAX(room_sequence) FROM game_events e
+                    WHERE e.room_id = room_ranges.room_id
+                )
+        """
+        )
+    conn.commit()
+
+
+def _has_column(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def number_room_events(
+    conn: sqlite3.Connection, room_offsets: Dict[str, int]
+) -> bool:
+    """
+    Backfill room_sequence in a file written before per-room sequences
+
+    Returns:
+        bool: True if the file needed numbering
+    """
+    migrated = False
+    if not _has_column(conn, "game_events", "room_sequence"):
+        conn.execute("ALTER TABLE game_events ADD COLUMN room_sequence INTEGER")
+        rooms = [
+            row[0] for row in conn.execute("SELECT DISTINCT room_id FROM game_events")
+        ]
+        for room_id in rooms:
+            sequences = conn.execute(
+                "SELECT sequence FROM game_events WHERE room_id = ? ORDER BY sequence",
+                (room_id,),
+            ).fetchall()
+            offset = room_offsets.get(room_id, 0)
+            conn.executemany(
+                "UPDATE game_events SET room_sequence = ? WHERE sequence = ?",
+                [
+                    (offset + index, sequence)
+                    for index, (sequence,) in enumerate(sequences, start=1)
+                ],
+            )
+        migrated = True
+        logger.info(f"Numbered per-room sequences for {len(rooms)} rooms")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_room_room_sequence"
+        " ON game_events(room_id, room_sequence)"
+    )
+    return migrated
+
+
+_UPSERT_ROOM_RANGE_SQL = """
+    INSERT INTO room_ranges (
+        room_id, first_sequence, last_sequence, event_count,
+        first_room_sequence, last_room_sequence
+    )
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(room_id) DO UPDATE SET
+        last_sequence = excluded.last_sequence,
+        event_count = event_count + excluded.event_count,
+        last_room_sequence = excluded.last_room_sequence
+"""
+
+
+def summarize_rows(rows: Iterable[Tuple]) -> Dict[str, RoomRange]:
+    """Per-room ranges of a batch of event rows (sequence, room_id, ...)"""
+    ranges: Dict[str, RoomRange] = {}
+    for row in rows:
+        sequence, room_id, room_sequence = row[0], row[1], row[7]
+        room_range = ranges.get(room_id)
+        if room_range is None:
+            ranges[room_id] = RoomRange(
+                sequence, sequence, 1, room_sequence, room_sequence
+            )
+        else:
+            room_range.last_sequence = sequence
+            room_range.last_room_sequence = room_sequence
+            room_range.event_count += 1
+    return ranges
+
+
+def write_room_ranges(
+    conn: sqlite3.Connection, ranges: Dict[str, RoomRange]
+) -> None:
+    """Merge a batch's room ranges into a partition (same transaction as rows)"""
+    conn.executemany(
+        _UPSERT_ROOM_RANGE_SQL,
+        [
+            (
+                room_id,
+                r.first_sequence,
+                r.last_sequence,
+                r.event_count,
+                r.first_room_sequence,
+                r.last_room_sequence,
+            )
+            for room_id, r in ranges.items()
+        ],
+    )
+
+
+class PartitionManager:
+    """
+    Registry of event partitions and the room -> partition index.
+
+    Shared by the writer thread (which creates partitions and records
+    committed batches) and readers (which route queries), so all access
+    goes through a lock.
+    """
+
+    def __init__(self, main_db_path: str, directory: str, window: str = "day"):
+        self.main_db_path = main_db_path
+        self.directory = directory
+        self.window = window
+        self.window_seconds = PARTITION_WINDOWS[window]
+        self._partitions: Dict[str, PartitionInfo] = {}
+        self._room_index: Dict[str, Dict[str, RoomRange]] = {}
+        self._lock = threading.Lock()
+        self._current_start = 0.0  # Writes never go to an earlier window
+
+    # ------------------------------------------------------------------
+    # Naming
+    # ------------------------------------------------------------------
+    def window_start(self, timestamp: float) -> float:
+        """Start of the partition window containing `timestamp`."""
+        return float(int(timestamp // self.window_seconds) * self.window_seconds)
+
+    def _name_for(self, start_ts: float) -> str:
+        fmt = "%Y%m%d%H" if self.window == "hour" else "%Y%m%d"
+        return datetime.fromtimestamp(start_ts, tz=timezone.utc).strftime(fmt)
+
+    def _start_for(self, name: str) -> float:
+        fmt = "%Y%m%d%H" if len(name) == 10 else "%Y%m%d"
+        return datetime.strptime(name, fmt).replace(tzinfo=timezone.utc).timestamp()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        """Load every partition's room ranges (and any legacy events)."""
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        partitions: List[PartitionInfo] = []
+
+        legacy = self._load_legacy()
+        if legacy:
+            partitions.append(legacy)
+
+        # Running last room_sequence per room, for numbering old files
+        room_offsets: Dict[str, int] = {
+            room_id: r.last_room_sequence
+            for room_id, r in (legacy.rooms.items() if legacy else ())
+        }
+        for entry in sorted(os.listdir(self.directory)):
+            if not entry.endswith(".db"):
+                continue
+            name = entry[:-3]
+            try:
+                start_ts = self._start_for(name)
+            except ValueError:
+                continue
+            # Window size comes from the name, so changing the setting is safe
+            window = 3600 if len(name) == 10 else 86400
+            info = PartitionInfo(
+                name=name,
+                path=os.path.join(self.directory, entry),
+                start_ts=start_ts,
+                end_ts=start_ts + window,
+            )
+            conn = sqlite3.connect(info.path)
+            init_partition_schema(conn, room_offsets)
+            for row in conn.execute(
+                "SELECT room_id, first_sequence, last_sequence, event_count,"
+                " first_room_sequence, last_room_sequence FROM room_ranges"
+            ):
+                info.rooms[row[0]] = RoomRange(*row[1:])
+                room_offsets[row[0]] = row[5]
+            conn.close()
+            self._summarize(info)
+            partitions.append(info)
+
+        with self._lock:
+            self._partitions = {info.name: info for info in partitions}
+            self._rebuild_room_index()
+            latest = max((p.start_ts for p in partitions), default=0.0)
+            self._current_start = latest
+        logger.info(
+            f"Loaded {len(partitions)} event partitions from {self.directory}"
+        )
+
+    def _load_legacy(self) -> Optional[PartitionInfo]:
+        """Events stored in the main database before partitioning"""
+        conn = sqlite3.connect(self.main_db_path)
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='game_events'"
+            ).fetchone()
+            if not exists:
+                return None
+            if number_room_events(conn, {}):
+                conn.commit()
+            rows = conn.execute(
+                """
+                SELECT room_id, MIN(sequence), MAX(sequence), COUNT(*),
+                       MIN(room_sequence), MAX(room_sequence),
+                       MIN(timestamp), MAX(timestamp)
+                FROM game_events GROUP BY room_id
+            """
+            ).fetchall()
+        finally:
+            conn.close()
+        if not rows:
+            return None
+        info = PartitionInfo(
+            name=LEGACY_PARTITION,
+            path=self.main_db_path,
+            start_ts=min(row[6] for row in rows),
+            end_ts=max(row[7] for row in rows),
+        )
+        for row in rows:
+            info.rooms[row[0]] = RoomRange(*row[1:6])
+        self._summarize(info)
+        return info
+
+    @staticmethod
+    def _summarize(info: PartitionInfo) -> None:
+        if info.rooms:
+            info.first_sequence = min(r.first_sequence for r in info.rooms.values())
+            info.last_sequence = max(r.last_sequence for r in info.rooms.values())
+            info.event_count = sum(r.event_count for r in info.rooms.values())
+
+    def _rebuild_room_index(self) -> None:
+        self._room_index = {}
+        for info in self._ordered():
+            for room_id, room_range in info.rooms.items():
+                self._room_index.setdefault(room_id, {})[info.name] = room_range
+
+    def _ordered(self) -> List[PartitionInfo]:
+        return sorted(self._partitions.values(), key=lambda p: p.first_sequence)
+
+    # ------------------------------------------------------------------
+    # Writer side
+    # ------------------------------------------------------------------
+    def partition_for_write(self, timestamp: float) -> PartitionInfo:
+        """Partition for an event written now (creating it if needed)."""
+        with self._lock:
+            start_ts = max(self.window_start(timestamp), self._current_start)
+            self._current_start = start_ts
+            name = self._name_for(start_ts)
+            info = self._partitions.get(name)
+            if info is None:
+                info = PartitionInfo(
+                    name=name,
+                    path=os.path.join(self.directory, f"{name}.db"),
+                    start_ts=start_ts,
+                    end_ts=start_ts + self.window_seconds,
+                )
+                self._partitions[name] = info
+            return info
+
+    def record_commit(self, name: str, ranges: Dict[str, RoomRange]) -> None:
+        """Fold a committed batch's room ranges into the index."""
+        with self._lock:
+            info = self._partitions.get(name)
+            if info is None:
+                return  # Dropped meanwhile
+            for room_id, batch_range in ranges.items():
+                room_range = info.rooms.get(room_id)
+                if room_range is None:
+                    room_range = RoomRange(
+                        batch_range.first_sequence,
+                        0,
+                        0,
+                        batch_range.first_room_sequence,
+                    )
+                    info.rooms[room_id] = room_range
+                    self._room_index.setdefault(room_id, {})[name] = room_range
+                room_range.last_sequence = batch_range.last_sequence
+                room_range.last_room_sequence = batch_range.last_room_sequence
+                room_range.event_count += batch_range.event_count
+                if not info.first_sequence:
+                    info.first_sequence = batch_range.first_sequence
+                info.last_sequence = max(info.last_sequence, batch_range.last_sequence)
+                info.event_count += batch_range.event_count
+
+    # ------------------------------------------------------------------
+    # Reader side
+    # ------------------------------------------------------------------
+    def partitions_for_room(
+        self, room_id: str, after_sequence: int = 0
+    ) -> List[PartitionInfo]:
+        """Partitions holding the room's events after `after_sequence`, in order."""
+        with self._lock:
+            ranges = self._room_index.get(room_id, {})
+            partitions = [
+                self._partitions[name]
+                for name, room_range in ranges.items()
+                if room_range.last_sequence > after_sequence
+                and name in self._partitions
+            ]
+        return sorted(partitions, key=lambda p: p.first_sequence)
+
+    def partition_for_sequence(self, sequence: int) -> Optional[PartitionInfo]:
+        """Partition holding the event with this global sequence number."""
+        with self._lock:
+            for info in self._partitions.values():
+                if info.first_sequence <= sequence <= info.last_sequence:
+                    return info
+        return None
+
+    def room_ranges(self, room_id: str) -> List[RoomRange]:
+        """The room's ranges in every partition, in sequence order."""
+        with self._lock:
+            return sorted(
+                self._room_index.get(room_id, {}).values(),
+                key=lambda r: r.first_sequence,
+            )
+
+    def room_totals(self) -> Dict[str, RoomRange]:
+        """Each room's ranges and event count across all partitions."""
+        with self._lock:
+            totals: Dict[str, RoomRange] = {}
+            for room_id, ranges in self._room_index.items():
+                ordered = sorted(ranges.values(), key=lambda r: r.first_sequence)
+                totals[room_id] = RoomRange(
+                    first_sequence=ordered[0].first_sequence,
+                    last_sequence=ordered[-1].last_sequence,
+                    event_count=sum(r.event_count for r in ordered),
+                    first_room_sequence=ordered[0].first_room_sequence,
+                    last_room_sequence=ordered[-1].last_room_sequence,
+                )
+            return totals
+
+    def is_registered(self, info: PartitionInfo) -> bool:
+        """Whether queries may still read `info` (it hasn't been detached)."""
+        with self._lock:
+            registered = self._partitions.get(info.name)
+            return registered is not None and registered.path == info.path
+
+    def get(self, name: str) -> Optional[PartitionInfo]:
+        """The partition with this name, if it exists."""
+        with self._lock:
+            return self._partitions.get(name)
+
+    def all_partitions(self) -> List[PartitionInfo]:
+        """Every partition holding committed events, in sequence order."""
+        with self._lock:
+            return [info for info in self._ordered() if info.event_count]
+
+    def last_sequence(self) -> int:
+        with self._lock:
+            return max((p.last_sequence for p in self._partitions.values()), default=0)
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    def detach_older_than(self, cutoff_ts: float) -> List[PartitionInfo]:
+        """
+        Remove partitions whose whole window ends before `cutoff_ts` from the
+        registry and index, so no new query routes to them.
+
+        The legacy partition is never detached (it lives in the main file).
+        """
+        with self._lock:
+            expired = [
+                info
+                for info in self._partitions.values()
+                if info.name != LEGACY_PARTITION
+                and info.end_ts <= cutoff_ts
+                and info.start_ts < self._current_start
+            ]
+            for info in expired:
+                del self._partitions[info.name]
+            if expired:
+                self._rebuild_room_index()
+        return expired
+
+    def refresh_legacy(self) -> None:
+        """Re-read the legacy partition after rows were deleted from it."""
+        legacy = self._load_legacy()
+        with self._lock:
+            self._partitions.pop(LEGACY_PARTITION, None)
+            if legacy:
+                self._partitions[LEGACY_PARTITION] = legacy
+            self._rebuild_room_index()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get partition statistics."""
+        partitions = self.all_partitions()
+        return {
+            "window": self.window,
+            "directory": self.directory,
+            "partitions": len(partitions),
+            "oldest": partitions[0].name if partitions else None,
+            "newest": partitions[-1].name if partitions else None,
+            "rooms_indexed": len(self._room_index),
+        }
+
+
+def remove_partition_files(path: str) -> None:
+    """Delete a partition file and its WAL/shared-memory files."""
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,432 @@
+"""
+PostgreSQL backend for the event store
+
+Keeps the event log in a shared PostgreSQL database, so several server
+processes can write one log. Talks to the database through an
+asyncpg-style connection pool: pool.acquire() yields connections with
+execute/fetch/fetchrow/fetchval, transaction() and
+copy_records_to_table(). Pass `pool_factory` to use something other than
+asyncpg.create_pool (e.g. a local stand-in in tests).
+
+Writes are buffered on the event loop and bulk-inserted with COPY every
+`batch_size` events or `batch_interval_ms`. Global sequence numbers are
+handed out in blocks by a row-locked allocator, and room sequence numbers
+one at a time by a per-room allocator row, so processes writing the same
+room never collide.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from backend.api.services.event_backends import (
+    EVENT_COLUMNS,
+    EventRow,
+    SharedEventBackend,
+)
+from backend.api.services.event_codec import decode_payload
+from backend.api.services.event_partitions import RoomRange
+
+try:
+    import asyncpg
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS game_events (
+        sequence BIGINT PRIMARY KEY,
+        room_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        payload BYTEA NOT NULL,
+        player_id TEXT,
+        timestamp DOUBLE PRECISION NOT NULL,
+        created_at TEXT NOT NULL,
+        room_sequence BIGINT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_room_sequence ON game_events (room_id, sequence)",
+    "CREATE INDEX IF NOT EXISTS idx_event_timestamp ON game_events (timestamp)",
+    """
+    CREATE TABLE IF NOT EXISTS room_snapshots (
+        room_id TEXT PRIMARY KEY,
+        sequence BIGINT NOT NULL,
+        state TEXT NOT NULL,
+        timestamp DOUBLE PRECISION NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS event_sequence_allocator (
+        id INTEGER PRIMARY KEY,
+        next_sequence BIGINT NOT NULL
+    )
+    """,
+    """
+    INSERT INTO event_sequence_allocator (id, next_sequence)
+    SELECT 1, COALESCE(MAX(sequence), 0) + 1 FROM game_events
+    ON CONFLICT (id) DO NOTHING
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS room_sequence_allocator (
+        room_id TEXT PRIMARY KEY,
+        last_room_sequence BIGINT NOT NULL
+    )
+    """,
+    """
+    INSERT INTO room_sequence_allocator (room_id, last_room_sequence)
+    SELECT room_id, MAX(room_sequence) FROM game_events GROUP BY room_id
+    ON CONFLICT (room_id) DO NOTHING
+    """,
+)
+
+_SELECT_EVENTS = (
+    "SELECT sequence, room_id, event_type, payload, player_id, timestamp,"
+    " created_at, room_sequence FROM game_events"
+)
+
+
+class PostgresEventBackend(SharedEventBackend):
+    """Event log in PostgreSQL, shared by every server process"""
+
+    name = "postgres"
+
+    def __init__(
+        self,
+        dsn: str = "",
+        pool_size: int = 5,
+        batch_size: int = 256,
+        batch_interval_ms: float = 20,
+        pool_factory: Optional[Callable[..., Awaitable[Any]]] = None,
+    ):
+        if pool_factory is None and not ASYNCPG_AVAILABLE:
+            raise ValueError("postgres backend requires the asyncpg package")
+        self.dsn = dsn
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval_ms / 1000.0
+        self._pool_factory = pool_factory or asyncpg.create_pool
+        self._pool: Any = None
+
+        # Write buffer, drained by the writer task
+        self._rows: List[Tuple] = []
+        self._statements: List[Tuple[str, Tuple]] = []
+        self._flush_waiters: List[asyncio.Future] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        # Statistics
+        self.events_queued = 0
+        self.events_committed = 0
+        self.events_failed = 0
+        self.commits = 0
+
+    async def open(self) -> Tuple[int, Dict[str, RoomRange]]:
+        self._pool = await self._pool_factory(
+            dsn=self.dsn, min_size=1, max_size=self.pool_size
+        )
+        async with self._pool.acquire() as conn:
+            for statement in _SCHEMA:
+                await conn.execute(statement)
+            last_sequence = await conn.fetchval("SELECT MAX(sequence) FROM game_events")
+            rows = await conn.fetch(
+                """
+                SELECT room_id, MIN(sequence), MAX(sequence), COUNT(*),
+                       MIN(room_sequence), MAX(room_sequence)
+                FROM game_events GROUP BY room_id
+                """
+            )
+        self._wakeup = asyncio.Event()
+        self._writer_task = asyncio.create_task(self._run_writer())
+        rooms = {row[0]: RoomRange(*row[1:6]) for row in rows}
+        logger.info(f"PostgreSQL event backend opened ({len(rooms)} rooms)")
+        return last_sequence or 0, rooms
+
+    async def reserve_sequences(self, count: int) -> int:
+        async with self._pool.acquire() as conn:
+            next_sequence = await conn.fetchval(
+                """
+                UPDATE event_sequence_allocator
+                SET next_sequence = next_sequence + $1
+                WHERE id = 1
+                RETURNING next_sequence
+                """,
+                count,
+            )
+        return next_sequence - count
+
+    async def reserve_room_sequence(self, room_id: str) -> int:
+        # One number at a time: a reserved block would leave gaps in the
+        # room's sequence whenever a process stops serving the room
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval(
+                """
+                INSERT INTO room_sequence_allocator (room_id, last_room_sequence)
+                VALUES ($1, 1)
+                ON CONFLICT (room_id) DO UPDATE
+                SET last_room_sequence = room_sequence_allocator.last_room_sequence + 1
+                RETURNING last_room_sequence
+                """,
+                room_id,
+            )
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+    def append(self, row: EventRow) -> None:
+        payload = row[3]
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        self._rows.append(row[:3] + (payload,) + row[4:])
+        self.events_queued += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _execute(self, sql: str, *args: Any) -> None:
+        """Queue a non-event write for the next commit."""
+        self._statements.append((sql, args))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        if self._writer_task is None or self._writer_task.done():
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._flush_waiters.append(future)
+        self._wakeup.set()
+        await future
+
+    async def close(self) -> None:
+        if self._writer_task is not None:
+            self._closing = True
+            self._wakeup.set()
+            await self._writer_task
+            self._writer_task = None
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def _run_writer(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if (
+                not self._closing
+                and not self._flush_waiters
+                and len(self._rows) < self.batch_size
+            ):
+                # Let a batch build up
+                await asyncio.sleep(self.batch_interval)
+
+            rows, self._rows = self._rows, []
+            statements, self._statements = self._statements, []
+            waiters, self._flush_waiters = self._flush_waiters, []
+            error = await self._commit(rows, statements)
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(None)
+
+            if self._closing and not self._rows and not self._statements:
+                return
+
+    async def _commit(
+        self, rows: List[Tuple], statements: List[Tuple[str, Tuple]]
+    ) -> Optional[Exception]:
+        if not rows and not statements:
+            return None
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    if rows:
+                        await conn.copy_records_to_table(
+                            "game_events", records=rows, columns=list(EVENT_COLUMNS)
+                        )
+                    for sql, args in statements:
+                        await conn.execute(sql, *args)
+        except Exception as e:
+            self.events_failed += len(rows)
+            logger.error(
+                f"Failed to commit {len(rows)} events "
+                f"and {len(statements)} other writes: {e}"
+            )
+            return e
+        self.commits += 1
+        self.events_committed += len(rows)
+        return None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    async def read_events(
+        self,
+        room_id: str,
+        after_sequence: int,
+        event_type: Optional[str],
+        limit: int,
+    ) -> List[EventRow]:
+        query = _SELECT_EVENTS + " WHERE room_id = $1 AND sequence > $2"
+        args: List[Any] = [room_id, after_sequence]
+        if event_type:
+            query += " AND event_type = $3"
+            args.append(event_type)
+        query += f" ORDER BY sequence ASC LIMIT ${len(args) + 1}"
+        args.append(limit)
+
+        async with self._pool.acquire() as conn:
+            records = await conn.fetch(query, *args)
+        return [
+            tuple(record[:3]) + (decode_payload(bytes(record[3])),) + tuple(record[4:])
+            for record in records
+        ]
+
+    async def read_payload(self, sequence: int) -> Optional[Any]:
+        async with self._pool.acquire() as conn:
+            payload = await conn.fetchval(
+                "SELECT payload FROM game_events WHERE sequence = $1", sequence
+            )
+        return decode_payload(bytes(payload)) if payload is not None else None
+
+    async def stored_room_range(self, room_id: str) -> Optional[RoomRange]:
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT MIN(sequence), MAX(sequence), COUNT(*),
+                       MIN(room_sequence), MAX(room_sequence)
+                FROM game_events WHERE room_id = $1
+                """,
+                room_id,
+            )
+        if row is None or not row[2]:
+            return None
+        return RoomRange(*row)
+
+    async def room_sequences(self, room_id: str) -> List[int]:
+        async with self._pool.acquire() as conn:
+            records = await conn.fetch(
+                "SELECT room_sequence FROM game_events"
+                " WHERE room_id = $1 ORDER BY room_sequence",
+                room_id,
+            )
+        return [record[0] for record in records]
+
+    async def room_event_types(self, room_id: str) -> List[str]:
+        async with self._pool.acquire() as conn:
+            records = await conn.fetch(
+                """
+                SELECT event_type FROM game_events
+                WHERE room_id = $1
+                GROUP BY event_type
+                ORDER BY MIN(sequence)
+                """,
+                room_id,
+            )
+        return [record[0] for record in records]
+
+    async def query_stats(self, since_timestamp: float) -> Dict[str, Any]:
+        async with self._pool.acquire() as conn:
+            type_rows = await conn.fetch(
+                """
+                SELECT event_type, COUNT(*) AS event_count
+                FROM game_events
+                GROUP BY event_type
+                ORDER BY event_count DESC
+                """
+            )
+            recent_events = await conn.fetchval(
+                "SELECT COUNT(*) FROM game_events WHERE timestamp > $1",
+                since_timestamp,
+            )
+        return {
+            "events_last_24h": recent_events,
+            "event_type_stats": {row[0]: row[1] for row in type_rows},
+        }
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+    async def load_snapshot(self, room_id: str) -> Optional[str]:
+        async with self._pool.acquire() as conn:
+            return await conn.fetchval(
+                "SELECT state FROM room_snapshots WHERE room_id = $1", room_id
+            )
+
+    def save_snapshot(
+        self, room_id: str, sequence: int, state: str, timestamp: float
+    ) -> None:
+        self._execute(
+            """
+            INSERT INTO room_snapshots (room_id, sequence, state, timestamp)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (room_id) DO UPDATE SET
+                sequence = EXCLUDED.sequence,
+                state = EXCLUDED.state,
+                timestamp = EXCLUDED.timestamp
+            """,
+            room_id,
+            sequence,
+            state,
+            timestamp,
+        )
+
+    async def snapshot_rooms(self) -> List[str]:
+        async with self._pool.acquire() as conn:
+            records = await conn.fetch("SELECT room_id FROM room_snapshots")
+        return [record[0] for record in records]
+
+    def delete_snapshot(self, room_id: str) -> None:
+        self._execute("DELETE FROM room_snapshots WHERE room_id = $1", room_id)
+
+    # ------------------------------------------------------------------
+    # Retention and health
+    # ------------------------------------------------------------------
+    async def drop_before(self, cutoff_timestamp: float) -> Dict[str, int]:
+        # A plain DELETE; for very large logs, range-partition game_events by
+        # timestamp on the server and drop partitions instead
+        await self.flush()
+        async with self._pool.acquire() as conn:
+            records = await conn.fetch(
+                """
+                WITH deleted AS (
+                    DELETE FROM game_events WHERE timestamp < $1 RETURNING room_id
+                )
+                SELECT room_id, COUNT(*) FROM deleted GROUP BY room_id
+                """,
+                cutoff_timestamp,
+            )
+        return {record[0]: record[1] for record in records}
+
+    async def ping(self) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.fetchval("SELECT 1")
+
+    def get_stats(self) -> Dict[str, Any]:
+        pool_stats: Dict[str, Any] = {"max_size": self.pool_size}
+        if self._pool is not None and hasattr(self._pool, "get_size"):
+            pool_stats["size"] = self._pool.get_size()
+            pool_stats["idle"] = self._pool.get_idle_size()
+        return {
+            "backend": self.name,
+            "pool": pool_stats,
+            "write_pipeline": {
+                "running": self._writer_task is not None
+                and not self._writer_task.done(),
+                "batch_size": self.batch_size,
+                "batch_interval_ms": self.batch_interval * 1000,
+                "events_queued": self.events_queued,
+                "events_committed": self.events_committed,
+                "events_failed": self.events_failed,
+                "pending": len(self._rows),
+                "commits": self.commits,
+            },
+        }
+
+
+__all__ = ["PostgresEventBackend", "ASYNCPG_AVAILABLE"]
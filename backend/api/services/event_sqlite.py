@@ -0,0 +1,735 @@
+"""
+SQLite backend for the event store
+
+Events live in time-partitioned SQLite files (see event_partitions); the
+main database file holds room snapshots. Writes are group-committed by a
+dedicated writer thread and reads run on a small reader thread pool, so
+the event loop never waits on disk I/O.
+"""
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.api.services.event_backends import EventBackend, EventRow
+from backend.api.services.event_codec import decode_payload
+from backend.api.services.event_partitions import (
+    LEGACY_PARTITION,
+    PartitionInfo,
+    PartitionManager,
+    RoomRange,
+    init_partition_schema,
+    remove_partition_files,
+    summarize_rows,
+    write_room_ranges,
+)
+
+logger = logging.getLogger(__name__)
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO game_events
+    (sequence, room_id, event_type, payload, player_id, timestamp, created_at,
+     room_sequence)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class _FlushRequest:
+    """Writer queue marker: commit everything queued so far, then notify"""
+
+    __slots__ = ("loop", "future")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future):
+        self.loop = loop
+        self.future = future
+
+
+class _Statement:
+    """Writer queue item: a non-event write committed with the next batch"""
+
+    __slots__ = ("sql", "params")
+
+    def __init__(self, sql: str, params: Tuple):
+        self.sql = sql
+        self.params = params
+
+
+_STOP = object()  # Writer queue marker: commit and exit
+
+
+class EventWriter:
+    """
+    Write pipeline for the event store.
+
+    A dedicated thread owns long-lived SQLite connections in WAL mode: one
+    to the main database (snapshots) and one to the current time partition.
+    Events are appended to an in-memory queue from the event loop and
+    group-committed every `batch_size` events or `batch_interval_ms` after
+    the first pending event, so the event loop never waits on disk I/O.
+    Queue order is sequence order, so rows are written in sequence order.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        partitions: PartitionManager,
+        batch_size: int = 256,
+        batch_interval_ms: float = 20,
+    ):
+        self.db_path = db_path
+        self.partitions = partitions
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval_ms / 1000.0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # Statistics
+        self.events_queued = 0
+        self.events_committed = 0
+        self.events_failed = 0
+        self.commits = 0
+        self.last_committed_sequence = 0
+
+    def start(self) -> None:
+        """Start the writer thread if it isn't running."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="event-store-writer", daemon=True
+                )
+                self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def append(self, row: Tuple) -> None:
+        """Queue one event row (see _INSERT_EVENT_SQL for the column order)."""
+        if not self.running:
+            self.start()
+        self.events_queued += 1
+        self._queue.put(row)
+
+    def execute(self, sql: str, params: Tuple = ()) -> None:
+        """Queue a non-event write (e.g. a snapshot) for the next commit."""
+        if not self.running:
+            self.start()
+        self._queue.put(_Statement(sql, params))
+
+    async def flush(self) -> None:
+        """Wait until every event queued before this call is committed."""
+        if not self.running:
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put(_FlushRequest(loop, future))
+        await future
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Commit everything queued and stop the writer thread."""
+        if self.running:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, timeout=30.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: durable across process crashes, no fsync per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _partition_connection(
+        self, info: PartitionInfo, open_partitions: Dict[str, sqlite3.Connection]
+    ) -> sqlite3.Connection:
+        """Connection to a partition, closing ones for windows we've left"""
+        conn = open_partitions.get(info.name)
+        if conn is None:
+            for name in list(open_partitions):
+                open_partitions.pop(name).close()
+            conn = self._connect(info.path)
+            init_partition_schema(conn)
+            conn.commit()
+            open_partitions[info.name] = conn
+        return conn
+
+    def _run(self) -> None:
+        conn = self._connect(self.db_path)
+        open_partitions: Dict[str, sqlite3.Connection] = {}
+        batch: List[Tuple] = []
+        flushes: List[_FlushRequest] = []
+        deadline = 0.0
+        stopping = False
+
+        while not stopping:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                stopping = True
+            elif isinstance(item, _FlushRequest):
+                flushes.append(item)
+            elif item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.batch_interval
+                batch.append(item)
+
+            if (
+                stopping
+                or flushes
+                or len(batch) >= self.batch_size
+                or (batch and time.monotonic() >= deadline)
+            ):
+                error = self._commit(conn, open_partitions, batch)
+                batch = []
+                for flush in flushes:
+                    try:
+                        flush.loop.call_soon_threadsafe(
+                            _resolve_future, flush.future, error
+                        )
+                    except RuntimeError:
+                        pass  # Waiter's event loop already closed
+                flushes = []
+
+        for partition_conn in open_partitions.values():
+            partition_conn.close()
+        conn.close()
+
+    def _commit(
+        self,
+        conn: sqlite3.Connection,
+        open_partitions: Dict[str, sqlite3.Connection],
+        batch: List,
+    ) -> Optional[Exception]:
+        if not batch:
+            return None
+        rows = [item for item in batch if not isinstance(item, _Statement)]
+        statements = [item for item in batch if isinstance(item, _Statement)]
+        error = None
+
+        # Route rows to partitions by timestamp; a batch spans two partitions
+        # at most, when it crosses a window boundary
+        groups: "OrderedDict[str, Tuple[PartitionInfo, List[Tuple]]]" = OrderedDict()
+        for row in rows:
+            info = self.partitions.partition_for_write(row[5])
+            groups.setdefault(info.name, (info, []))[1].append(row)
+
+        for info, partition_rows in groups.values():
+            # Room ranges commit with the rows, so the index never disagrees
+            ranges = summarize_rows(partition_rows)
+            try:
+                partition_conn = self._partition_connection(info, open_partitions)
+                with partition_conn:
+                    partition_conn.executemany(_INSERT_EVENT_SQL, partition_rows)
+                    write_room_ranges(partition_conn, ranges)
+            except Exception as e:
+                self.events_failed += len(partition_rows)
+                logger.error(
+                    f"Failed to commit {len(partition_rows)} events "
+                    f"to partition {info.name}: {e}"
+                )
+                error = e
+                continue
+            self.partitions.record_commit(info.name, ranges)
+            self.events_committed += len(partition_rows)
+            self.last_committed_sequence = partition_rows[-1][0]
+
+        if statements:
+            try:
+                with conn:
+                    for statement in statements:
+                        conn.execute(statement.sql, statement.params)
+            except Exception as e:
+                logger.error(f"Failed to commit {len(statements)} writes: {e}")
+                error = e
+
+        self.commits += 1
+        return error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write pipeline statistics."""
+        return {
+            "running": self.running,
+            "batch_size": self.batch_size,
+            "batch_interval_ms": self.batch_interval * 1000,
+            "events_queued": self.events_queued,
+            "events_committed": self.events_committed,
+            "events_failed": self.events_failed,
+            "pending": self.events_queued - self.events_committed - self.events_failed,
+            "commits": self.commits,
+            "avg_batch_size": (
+                self.events_committed / self.commits if self.commits else 0.0
+            ),
+            "last_committed_sequence": self.last_committed_sequence,
+        }
+
+
+def _resolve_future(future: asyncio.Future, error: Optional[Exception]) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
+
+
+class EventReaderPool:
+    """
+    Read path for the event store.
+
+    Queries run on a small pool of threads, each with its own SQLite
+    connections (to the main database and to each partition it reads), so
+    large reads never block the event loop. WAL mode lets them run
+    alongside the writer.
+
+    Each query counts the partitions it reads while it runs (from when it
+    takes the partition list, see hold()), so a dropped partition's
+    connections are only closed once no query is using them.
+    """
+
+    def __init__(self, db_path: str, size: int = 2):
+        self.db_path = db_path
+        self.size = size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # (thread id, path) -> connection
+        self._connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        # path -> running queries using it; discarded paths still in use,
+        # resolved when the last of those queries finishes
+        self._in_use: Counter = Counter()
+        self._discarded: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = {}
+        self._query = threading.local()
+
+        # Statistics
+        self.queries = 0
+
+    def connection(self, path: Optional[str] = None) -> sqlite3.Connection:
+        """This reader thread's connection to `path` (default: main database)."""
+        key = (threading.get_ident(), path or self.db_path)
+        paths = getattr(self._query, "paths", None)
+        with self._connections_lock:
+            conn = self._connections.get(key)
+            if conn is None:
+                conn = sqlite3.connect(key[1], timeout=30.0, check_same_thread=False)
+                self._connections[key] = conn
+            if paths is not None and key[1] not in paths:
+                paths.add(key[1])
+                self._in_use[key[1]] += 1
+        return conn
+
+    def hold(
+        self,
+        partitions: List[PartitionInfo],
+        registered: Callable[[PartitionInfo], bool],
+    ) -> List[PartitionInfo]:
+        """
+        Mark partitions as used by the running query; return those still readable.
+
+        Marking and the `registered` check happen under the pool lock, and
+        partitions are detached before discard() checks for users, so each
+        partition is either kept open for this query or already detached and
+        skipped, never read after its file was removed.
+        """
+        paths = self._query.paths
+        held = []
+        with self._connections_lock:
+            for info in partitions:
+                if info.path not in paths:
+                    paths.add(info.path)
+                    self._in_use[info.path] += 1
+                if registered(info):
+                    held.append(info)
+        return held
+
+    async def discard(self, path: str) -> None:
+        """
+        Close every reader connection to `path` (a dropped partition).
+
+        Queries already using the file finish first; its connections are
+        closed when the last of them releases it, never under a query.
+        """
+        with self._connections_lock:
+            if not self._in_use[path]:
+                self._close_connections(path)
+                return
+            waiter = self._discarded.get(path)
+            if waiter is None:
+                loop = asyncio.get_running_loop()
+                waiter = (loop, loop.create_future())
+                self._discarded[path] = waiter
+        await waiter[1]
+
+    def _close_connections(self, path: str) -> None:
+        """Close all connections to `path` (connections lock held, none in use)."""
+        for key in [key for key in self._connections if key[1] == path]:
+            self._connections.pop(key).close()
+
+    def _call(self, fn: Callable[..., Any], args: Tuple) -> Any:
+        self._query.paths = set()
+        try:
+            return fn(self.connection(), *args)
+        finally:
+            paths, self._query.paths = self._query.paths, None
+            with self._connections_lock:
+                for path in paths:
+                    self._in_use[path] -= 1
+                    if self._in_use[path]:
+                        continue
+                    del self._in_use[path]
+                    waiter = self._discarded.pop(path, None)
+                    if waiter is not None:
+                        self._close_connections(path)
+                        loop, future = waiter
+                        loop.call_soon_threadsafe(_resolve_future, future, None)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn(connection, *args)` on a reader thread and return its result."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.size, thread_name_prefix="event-store-reader"
+            )
+        self.queries += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+
+    def close(self) -> None:
+        """Stop the reader threads and close their connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._connections_lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reader pool statistics."""
+        return {
+            "size": self.size,
+            "open_connections": len(self._connections),
+            "queries": self.queries,
+        }
+
+
+class SqliteEventBackend(EventBackend):
+    """
+    Event log in time-partitioned SQLite files on local disk.
+
+    Retention deletes whole partition files; events stored before
+    partitioning stay readable as the legacy partition of the main file.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: str = "game_events.db",
+        partition_dir: Optional[str] = None,
+        partition_window: str = "day",
+        batch_size: int = 256,
+        batch_interval_ms: float = 20,
+        reader_pool_size: int = 2,
+    ):
+        self.db_path = db_path
+        self.partitions = PartitionManager(
+            db_path,
+            partition_dir or str(Path(db_path).with_suffix("")) + "_partitions",
+            window=partition_window,
+        )
+        self._readers = EventReaderPool(db_path, size=reader_pool_size)
+        self._writer = EventWriter(
+            db_path,
+            self.partitions,
+            batch_size=batch_size,
+            batch_interval_ms=batch_interval_ms,
+        )
+
+    async def open(self) -> Tuple[int, Dict[str, RoomRange]]:
+        self._init_database()
+        return self.partitions.last_sequence(), self.partitions.room_totals()
+
+    def _init_database(self):
+        """Initialize the main SQLite database and load the event partitions"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        # Events live in partition files; the main database keeps
+        # snapshots (and any events stored before partitioning)
+
+        # Latest replayed state per room, so replay only applies the tail
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS room_snapshots (
+                room_id TEXT PRIMARY KEY,
+                sequence INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                timestamp REAL NOT NULL
+            )
+        """
+        )
+
+        conn.commit()
+        conn.close()
+
+        self.partitions.load()
+
+    def partition_key(self, timestamp: float) -> float:
+        return self.partitions.window_start(timestamp)
+
+    def append(self, row: EventRow) -> None:
+        self._writer.append(row)
+
+    async def flush(self) -> None:
+        await self._writer.flush()
+
+    async def close(self) -> None:
+        self._writer.close()
+        self._readers.close()
+
+    # ------------------------------------------------------------------
+    # Reads (each runs on a reader thread)
+    # ------------------------------------------------------------------
+    def _hold(self, partitions: List[PartitionInfo]) -> List[PartitionInfo]:
+        """Keep the query's partitions open until it ends (reader thread)"""
+        return self._readers.hold(partitions, self.partitions.is_registered)
+
+    async def read_events(
+        self,
+        room_id: str,
+        after_sequence: int,
+        event_type: Optional[str],
+        limit: int,
+    ) -> List[EventRow]:
+        return await self._readers.run(
+            self._read_page, room_id, after_sequence, event_type, limit
+        )
+
+    def _read_page(
+        self,
+        conn: sqlite3.Connection,
+        room_id: str,
+        after: int,
+        event_type: Optional[str],
+        page_size: int,
+    ) -> List[EventRow]:
+        """Fetch and decode one page of a room's events"""
+        query = """
+            SELECT sequence, room_id, event_type, payload, player_id, timestamp,
+                   created_at, room_sequence
+            FROM game_events
+            WHERE room_id = ? AND sequence > ?
+        """
+        if event_type:
+            query += " AND event_type = ?"
+        query += " ORDER BY sequence ASC LIMIT ?"
+
+        # Partitions hold disjoint, increasing sequence ranges, so reading
+        # them in order keeps the page in sequence order
+        rows: List[EventRow] = []
+        for info in self._hold(self.partitions.partitions_for_room(room_id, after)):
+            params: List[Any] = [room_id, after]
+            if event_type:
+                params.append(event_type)
+            params.append(page_size - len(rows))
+            for row in (
+                self._readers.connection(info.path).execute(query, params).fetchall()
+            ):
+                rows.append(row[:3] + (decode_payload(row[3]),) + row[4:])
+            if len(rows) >= page_size:
+                break
+        return rows
+
+    async def read_payload(self, sequence: int) -> Optional[Any]:
+        row = await self._readers.run(self._query_payload, sequence)
+        return decode_payload(row[0]) if row else None
+
+    def _query_payload(
+        self, conn: sqlite3.Connection, sequence: int
+    ) -> Optional[Tuple]:
+        """The stored payload of one event, as a row"""
+        info = self.partitions.partition_for_sequence(sequence)
+        if info is None or not self._hold([info]):
+            return None
+        return (
+            self._readers.connection(info.path)
+            .execute("SELECT payload FROM game_events WHERE sequence = ?", (sequence,))
+            .fetchone()
+        )
+
+    async def stored_room_range(self, room_id: str) -> Optional[RoomRange]:
+        ranges = self.partitions.room_ranges(room_id)
+        if not ranges:
+            return None
+        return RoomRange(
+            first_sequence=ranges[0].first_sequence,
+            last_sequence=ranges[-1].last_sequence,
+            event_count=sum(r.event_count for r in ranges),
+            first_room_sequence=ranges[0].first_room_sequence,
+            last_room_sequence=ranges[-1].last_room_sequence,
+        )
+
+    async def room_sequences(self, room_id: str) -> List[int]:
+        return await self._readers.run(self._query_room_sequences, room_id)
+
+    def _query_room_sequences(
+        self, conn: sqlite3.Connection, room_id: str
+    ) -> List[int]:
+        """All room sequence numbers of a room's events, in order"""
+        sequences: List[int] = []
+        for info in self._hold(self.partitions.partitions_for_room(room_id)):
+            sequences.extend(
+                row[0]
+                for row in self._readers.connection(info.path).execute(
+                    """
+                    SELECT room_sequence FROM game_events
+                    WHERE room_id = ?
+                    ORDER BY room_sequence ASC
+                    """,
+                    (room_id,),
+                )
+            )
+        return sequences
+
+    async def room_event_types(self, room_id: str) -> List[str]:
+        return await self._readers.run(self._query_room_event_types, room_id)
+
+    def _query_room_event_types(
+        self, conn: sqlite3.Connection, room_id: str
+    ) -> List[str]:
+        """Event types of a room in order of first appearance"""
+        first_seen: Dict[str, int] = {}
+        for info in self._hold(self.partitions.partitions_for_room(room_id)):
+            rows = self._readers.connection(info.path).execute(
+                """
+                SELECT event_type, MIN(sequence) FROM game_events
+                WHERE room_id = ?
+                GROUP BY event_type
+                """,
+                (room_id,),
+            )
+            for event_type, sequence in rows:
+                first_seen.setdefault(event_type, sequence)
+        return sorted(first_seen, key=first_seen.get)
+
+    async def query_stats(self, since_timestamp: float) -> Dict[str, Any]:
+        return await self._readers.run(self._query_stats, since_timestamp)
+
+    def _query_stats(
+        self, conn: sqlite3.Connection, since_timestamp: float
+    ) -> Dict[str, Any]:
+        """Count events per type and since a time"""
+        type_counts: Counter = Counter()
+        recent_events = 0
+        for info in self._hold(self.partitions.all_partitions()):
+            partition_conn = self._readers.connection(info.path)
+            cursor = partition_conn.execute(
+                "SELECT event_type, COUNT(*) FROM game_events GROUP BY event_type"
+            )
+            type_counts.update(dict(cursor.fetchall()))
+            if info.end_ts > since_timestamp:
+                cursor = partition_conn.execute(
+                    "SELECT COUNT(*) FROM game_events WHERE timestamp > ?",
+                    (since_timestamp,),
+                )
+                recent_events += cursor.fetchone()[0]
+
+        return {
+            "events_last_24h": recent_events,
+            "event_type_stats": dict(type_counts.most_common()),
+        }
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+    async def load_snapshot(self, room_id: str) -> Optional[str]:
+        row = await self._readers.run(
+            lambda conn: conn.execute(
+                "SELECT state FROM room_snapshots WHERE room_id = ?", (room_id,)
+            ).fetchone()
+        )
+        return row[0] if row else None
+
+    def save_snapshot(
+        self, room_id: str, sequence: int, state: str, timestamp: float
+    ) -> None:
+        # Written with the next event batch
+        self._writer.execute(
+            "INSERT OR REPLACE INTO room_snapshots (room_id, sequence, state, timestamp)"
+            " VALUES (?, ?, ?, ?)",
+            (room_id, sequence, state, timestamp),
+        )
+
+    async def snapshot_rooms(self) -> List[str]:
+        return await self._readers.run(
+            lambda conn: [
+                row[0] for row in conn.execute("SELECT room_id FROM room_snapshots")
+            ]
+        )
+
+    def delete_snapshot(self, room_id: str) -> None:
+        self._writer.execute("DELETE FROM room_snapshots WHERE room_id = ?", (room_id,))
+
+    # ------------------------------------------------------------------
+    # Retention and health
+    # ------------------------------------------------------------------
+    async def drop_before(self, cutoff_timestamp: float) -> Dict[str, int]:
+        """
+        Delete partitions whose whole window is older than the cutoff
+
+        Deleting a file takes the same time however many events it holds and
+        never touches the partition being written. Events in a partition
+        that is only partly past the cutoff are kept until it all expires.
+        """
+        await self.flush()
+
+        # Unroute first, so no new query opens a partition we're deleting
+        expired = self.partitions.detach_older_than(cutoff_timestamp)
+        dropped: Counter = Counter()
+        for info in expired:
+            await self._readers.discard(info.path)
+            remove_partition_files(info.path)
+            dropped.update({room: r.event_count for room, r in info.rooms.items()})
+
+        # Events stored before partitioning are trimmed the old way
+        legacy = self.partitions.get(LEGACY_PARTITION)
+        if legacy and legacy.start_ts < cutoff_timestamp:
+            self._writer.execute(
+                "DELETE FROM game_events WHERE timestamp < ?", (cutoff_timestamp,)
+            )
+            await self.flush()
+            await self._readers.run(lambda conn: self.partitions.refresh_legacy())
+            refreshed = self.partitions.get(LEGACY_PARTITION)
+            remaining = refreshed.rooms if refreshed else {}
+            for room_id, room_range in legacy.rooms.items():
+                left = remaining[room_id].event_count if room_id in remaining else 0
+                dropped[room_id] += room_range.event_count - left
+
+        return dict(dropped)
+
+    async def ping(self) -> None:
+        await self._readers.run(lambda conn: conn.execute("SELECT 1").fetchone())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "db_path": self.db_path,
+            "partitions": self.partitions.get_stats(),
+            "write_pipeline": self._writer.get_stats(),
+            "reader_pool": self._readers.get_stats(),
+        }
+
+
+__all__ = ["EventReaderPool", "EventWriter", "SqliteEventBackend"]
@@ -4,14 +4,25 @@ Provides persistent event storage, state reconstruction, and client recovery
 """
 
 import asyncio
+import copy
 import json
 import logging
-import sqlite3
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.api.services.event_backends import EventBackend, create_event_backend
+from backend.api.services.event_codec import (
+    DIFF_KEY,
+    apply_patch,
+    get_codec,
+    make_patch,
+)
+from backend.api.services.event_partitions import RoomRange
+from backend.config.event_store_config import get_event_store_config
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +38,7 @@ class GameEvent:
     player_id: Optional[str]
     timestamp: float
     created_at: str
+    room_sequence: Optional[int] = None  # 1, 2, 3... within the room
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -38,74 +50,159 @@ class GameEvent:
         return cls(**data)
 
 
+_MAX_DIFF_BASES = 1024  # Rooms whose last phase_change is kept for diffing
+
+
 class EventStore:
     """
     Persistent event storage for game state reconstruction and debugging
-    Uses SQLite for development, can be extended for PostgreSQL in production
+
+    Rows live in a storage backend chosen from config at startup (see
+    event_backends): time-partitioned SQLite files, an in-memory ring
+    buffer, or PostgreSQL. Writes are queued and group-committed by the
+    backend; reads flush pending writes first so they always see every
+    stored event.
+
+    Each event gets a global sequence and a per-room sequence. An in-memory
+    room index (first/last sequence and event count per room, updated on
+    write) answers "anything new?", gap validation and per-room stats
+    without touching storage.
+
+    Room state replay starts from the room's latest snapshot or from the
+    cached result of the previous replay, and only applies the events
+    after it.
     """
 
-    def __init__(self, db_path: str = "game_events.db"):
-        """Initialize EventStore with database connection"""
-        self.db_path = db_path
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        batch_interval_ms: Optional[float] = None,
+        snapshot_interval: Optional[int] = None,
+        payload_codec: Optional[str] = None,
+        partition_window: Optional[str] = None,
+        partition_dir: Optional[str] = None,
+        backend: Optional[EventBackend] = None,
+    ):
+        """Initialize EventStore (storage is opened on first use, or by open())"""
+        config = get_event_store_config()
+        self.db_path = db_path or config.db_path
         self.sequence_counter = 0
-        self._connection = None
-        self._lock = asyncio.Lock()
-
-        # Initialize database
-        self._init_database()
-
-        # Load current sequence counter
-        self._load_sequence_counter()
-
-        logger.info(f"EventStore initialized with database: {db_path}")
-
-    def _init_database(self):
-        """Initialize SQLite database with events table"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS game_events (
-                sequence INTEGER PRIMARY KEY,
-                room_id TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                payload TEXT NOT NULL,
-                player_id TEXT,
-                timestamp REAL NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """
+        self._sequence_limit = -1  # Last reserved number (shared backends)
+        self.sequence_block_size = config.sequence_block_size
+        self._reserve_lock = asyncio.Lock()
+        # room_id -> lock held from room sequence reservation to numbering
+        self._room_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
         )
 
-        # Create indexes for performance
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_room_sequence ON game_events(room_id, sequence)"
+        self._backend = backend or self._create_backend(
+            config,
+            batch_size=batch_size or config.write_batch_size,
+            batch_interval_ms=(
+                batch_interval_ms
+                if batch_interval_ms is not None
+                else config.write_batch_interval_ms
+            ),
+            partition_window=partition_window,
+            partition_dir=partition_dir,
         )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_room_timestamp ON game_events(room_id, timestamp)"
-        )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_created_at ON game_events(created_at)"
+        self._opened = False
+        self._open_lock = asyncio.Lock()
+        self.read_page_size = config.read_page_size
+
+        # Payload encoding (reads decode any codec, so switching is safe)
+        try:
+            self._codec = get_codec(payload_codec or config.payload_codec)
+        except ValueError as e:
+            logger.warning(f"{e} - storing event payloads as JSON")
+            self._codec = get_codec("json")
+        self.phase_change_diffs = config.phase_change_diffs
+        self.keyframe_interval = config.phase_change_keyframe_interval
+        # room_id -> (sequence, payload, diffs since keyframe, partition
+        # window) of the last phase_change
+        self._phase_change_bases: "OrderedDict[str, Tuple[int, Dict, int, float]]" = (
+            OrderedDict()
         )
 
-        conn.commit()
-        conn.close()
+        # Replay: latest reconstructed state per room (LRU, includes last_sequence)
+        self.snapshot_interval = snapshot_interval or config.snapshot_interval
+        self.replay_cache_size = config.replay_cache_size
+        self._replay_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._replay_events_since_snapshot: Dict[str, int] = {}
+
+        # Per-room index, loaded from storage when it is opened
+        self._room_index: Dict[str, RoomRange] = {}
+
+        logger.info(f"EventStore initialized with {self._backend.name} backend")
 
-    def _load_sequence_counter(self):
-        """Load the current sequence counter from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("SELECT MAX(sequence) FROM game_events")
-        result = cursor.fetchone()
-        self.sequence_counter = (result[0] or 0) + 1
-        conn.close()
+    def _create_backend(self, config: Any, **options: Any) -> EventBackend:
+        """Create the configured storage backend (SQLite if it can't be used)"""
+        try:
+            if config.backend == "postgres":
+                return create_event_backend(
+                    "postgres",
+                    dsn=config.postgres_dsn,
+                    pool_size=config.postgres_pool_size,
+                    batch_size=options["batch_size"],
+                    batch_interval_ms=options["batch_interval_ms"],
+                )
+            if config.backend == "memory":
+                return create_event_backend("memory", capacity=config.memory_capacity)
+        except ValueError as e:
+            logger.warning(f"{e} - storing events in SQLite")
+        return create_event_backend(
+            "sqlite",
+            db_path=self.db_path,
+            partition_dir=options["partition_dir"] or config.partition_dir or None,
+            partition_window=options["partition_window"] or config.partition_window,
+            batch_size=options["batch_size"],
+            batch_interval_ms=options["batch_interval_ms"],
+            reader_pool_size=config.reader_pool_size,
+        )
 
-        logger.info(f"Loaded sequence counter: {self.sequence_counter}")
+    async def open(self) -> None:
+        """Open storage and load the sequence counter and room index (idempotent)"""
+        if self._opened:
+            return
+        async with self._open_lock:
+            if self._opened:
+                return
+            last_sequence, rooms = await self._backend.open()
+            self._room_index = rooms
+            if not self._backend.shared:
+                self.sequence_counter = last_sequence + 1
+                logger.info(f"Loaded sequence counter: {self.sequence_counter}")
+            self._opened = True
+
+    async def _reserve_sequence(self) -> None:
+        """Make sure a reserved sequence number is available (shared backends)"""
+        if self.sequence_counter <= self._sequence_limit:
+            return
+        async with self._reserve_lock:
+            if self.sequence_counter <= self._sequence_limit:
+                return
+            first = await self._backend.reserve_sequences(self.sequence_block_size)
+            self.sequence_counter = first
+            self._sequence_limit = first + self.sequence_block_size - 1
 
     def _next_sequence(self) -> int:
-        """Generate next sequence number (thread-safe)"""
+        """Generate next sequence number (called on the event loop only)"""
         current = self.sequence_counter
         self.sequence_counter += 1
         return current
 
+    async def flush(self) -> None:
+        """Wait until every event stored so far is committed to storage"""
+        if self._opened:
+            await self._backend.flush()
+
+    async def close(self) -> None:
+        """Commit pending events and release the backend's threads and connections"""
+        if self._opened:
+            await self._backend.close()
+            self._opened = False
+
     async def store_event(
         self,
         room_id: str,
@@ -124,47 +221,267 @@ class EventStore:
 
         Returns:
             GameEvent: The stored event with sequence number
+
+        The event is queued for the next group commit; use flush() to wait
+        until it is durable.
         """
-        async with self._lock:
-            sequence = self._next_sequence()
-            timestamp = time.time()
-            created_at = datetime.now().isoformat()
-
-            event = GameEvent(
-                sequence=sequence,
-                room_id=room_id,
-                event_type=event_type,
-                payload=payload,
-                player_id=player_id,
-                timestamp=timestamp,
-                created_at=created_at,
+        await self.open()
+        if self._backend.shared:
+            # Other processes may write this room, so its numbers come from
+            # the backend. Holding the room's lock from reservation to
+            # numbering keeps its room order and global order the same.
+            async with self._room_lock(room_id):
+                room_sequence = await self._backend.reserve_room_sequence(room_id)
+                await self._reserve_sequence()
+                event = self._queue_event(
+                    room_id, event_type, payload, player_id, room_sequence
+                )
+        else:
+            event = self._queue_event(room_id, event_type, payload, player_id)
+
+        # A bounded backend may have evicted older events to make room
+        evicted = self._backend.take_evicted()
+        if evicted:
+            await self._trim_room_index(evicted)
+
+        logger.debug(
+            f"Stored event: {event.event_type} for room {room_id} "
+            f"(seq: {event.sequence})"
+        )
+        return event
+
+    def _room_lock(self, room_id: str) -> asyncio.Lock:
+        """The lock serializing a room's numbering (shared backends)"""
+        lock = self._room_locks.get(room_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._room_locks[room_id] = lock
+        return lock
+
+    def _queue_event(
+        self,
+        room_id: str,
+        event_type: str,
+        payload: Dict[str, Any],
+        player_id: Optional[str],
+        reserved_room_sequence: Optional[int] = None,
+    ) -> GameEvent:
+        """Number an event and queue it for the next commit"""
+        # No await between numbering and queueing, so rows stay in sequence order
+        sequence = self._next_sequence()
+        room_sequence = self._index_event(room_id, sequence, reserved_room_sequence)
+        timestamp = time.time()
+        created_at = datetime.now().isoformat()
+
+        event = GameEvent(
+            sequence=sequence,
+            room_id=room_id,
+            event_type=event_type,
+            payload=payload,
+            player_id=player_id,
+            timestamp=timestamp,
+            created_at=created_at,
+            room_sequence=room_sequence,
+        )
+
+        stored_payload = payload
+        if event_type == "phase_change" and self.phase_change_diffs:
+            stored_payload = self._diff_phase_change(
+                room_id, sequence, payload, self._backend.partition_key(timestamp)
             )
 
-            # Store in database
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(
-                """
-                INSERT INTO game_events 
-                (sequence, room_id, event_type, payload, player_id, timestamp, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    event.sequence,
-                    event.room_id,
-                    event.event_type,
-                    json.dumps(event.payload),
-                    event.player_id,
-                    event.timestamp,
-                    event.created_at,
-                ),
+        # Encode now: callers may keep mutating the payload after we return
+        self._backend.append(
+            (
+                event.sequence,
+                event.room_id,
+                event.event_type,
+                self._codec.encode(stored_payload),
+                event.player_id,
+                event.timestamp,
+                event.created_at,
+                event.room_sequence,
             )
-            conn.commit()
-            conn.close()
+        )
+        return event
+
+    def _index_event(
+        self, room_id: str, sequence: int, room_sequence: Optional[int] = None
+    ) -> int:
+        """
+        Record a new event in the room index and return its room sequence
 
-            logger.debug(
-                f"Stored event: {event.event_type} for room {room_id} (seq: {sequence})"
+        `room_sequence` is the number reserved from a shared backend; without
+        it the room's next number is counted locally.
+        """
+        room_range = self._room_index.get(room_id)
+        if room_range is None:
+            first_room_sequence = room_sequence if room_sequence is not None else 1
+            room_range = RoomRange(sequence, sequence, 0, first_room_sequence, 0)
+            self._room_index[room_id] = room_range
+        room_range.last_sequence = sequence
+        room_range.event_count += 1
+        if room_sequence is None:
+            room_sequence = room_range.last_room_sequence + 1
+        if room_sequence > room_range.last_room_sequence:
+            room_range.last_room_sequence = room_sequence
+        return room_sequence
+
+    def get_room_index(self, room_id: str) -> Optional[Dict[str, int]]:
+        """
+        Get a room's entry in the room index
+
+        Args:
+            room_id: The room identifier
+
+        Returns:
+            Optional[Dict]: first/last sequence, first/last room sequence and
+            event count (including events not yet committed), or None if the
+            room has no events
+        """
+        room_range = self._room_index.get(room_id)
+        return asdict(room_range) if room_range else None
+
+    def _diff_phase_change(
+        self, room_id: str, sequence: int, payload: Dict[str, Any], window: float
+    ) -> Dict[str, Any]:
+        """
+        Turn a phase_change payload into a diff against the room's previous one
+
+        Every `keyframe_interval`-th phase_change (and the first one after a
+        restart or in a new partition window) is stored in full, bounding how
+        far back a read must go and keeping diff chains inside one partition.
+        """
+        if not isinstance(payload, dict):
+            return payload
+
+        base = self._phase_change_bases.pop(room_id, None)
+        frozen = copy.deepcopy(payload)  # Diff base must not change under us
+        if (
+            base is None
+            or base[2] + 1 >= self.keyframe_interval
+            or base[3] != window
+        ):
+            stored, diffs_since_keyframe = payload, 0
+        else:
+            patch = make_patch(base[1], frozen)
+            stored = {DIFF_KEY: {"base": base[0], "patch": patch}}
+            diffs_since_keyframe = base[2] + 1
+
+        self._phase_change_bases[room_id] = (
+            sequence,
+            frozen,
+            diffs_since_keyframe,
+            window,
+        )
+        while len(self._phase_change_bases) > _MAX_DIFF_BASES:
+            self._phase_change_bases.popitem(last=False)
+        return stored
+
+    async def _build_events(
+        self,
+        rows: List[Tuple],
+        latest_phase_change: Dict[str, Tuple[int, Dict[str, Any]]],
+    ) -> List[GameEvent]:
+        """
+        Build GameEvents from rows (payloads decoded), rebuilding diff-encoded
+        phase_changes
+
+        `latest_phase_change` (room_id -> (sequence, full payload) of the last
+        phase_change seen) carries diff bases across pages of one stream.
+        """
+        events = []
+        for row in rows:
+            event = GameEvent(*row)
+            if event.event_type == "phase_change":
+                if isinstance(event.payload, dict) and DIFF_KEY in event.payload:
+                    event.payload = await self._resolve_diff(
+                        event.payload, latest_phase_change.get(event.room_id)
+                    )
+                latest_phase_change[event.room_id] = (event.sequence, event.payload)
+            events.append(event)
+        return events
+
+    async def _resolve_diff(
+        self,
+        payload: Any,
+        known_base: Optional[Tuple[int, Dict[str, Any]]],
+    ) -> Any:
+        """Rebuild a full payload from a diff chain, reading bases as needed"""
+        patches = []
+        while isinstance(payload, dict) and DIFF_KEY in payload:
+            diff = payload[DIFF_KEY]
+            patches.append(diff["patch"])
+            if known_base and known_base[0] == diff["base"]:
+                payload = known_base[1]
+                break
+            base_payload = await self._backend.read_payload(diff["base"])
+            if base_payload is None:
+                # Base removed by retention cleanup: rebuild what we can
+                logger.warning(f"Missing diff base event {diff['base']}")
+                payload = {}
+                break
+            payload = base_payload
+
+        for patch in reversed(patches):
+            payload = apply_patch(payload, patch)
+        return payload
+
+    async def iter_events(
+        self,
+        room_id: str,
+        since_sequence: int = 0,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[GameEvent]:
+        """
+        Stream a room's events in chronological order
+
+        Rows are fetched a page at a time from the backend (off the event
+        loop for SQLite), so memory stays bounded however long the game.
+
+        Args:
+            room_id: The room identifier
+            since_sequence: Only events after this sequence number
+            event_type: Optional event type filter
+            limit: Optional maximum number of events
+
+        Yields:
+            GameEvent: Events in chronological order
+
+        Rooms the room index says have nothing after `since_sequence` return
+        at once, without flushing or querying. On a shared backend the index
+        only covers this process's writes, so the backend is always queried.
+        """
+        await self.open()
+        if not self._backend.shared:
+            room_range = self._room_index.get(room_id)
+            if room_range is None or room_range.last_sequence <= since_sequence:
+                return
+
+        await self.flush()
+        remaining = limit or None
+        after = since_sequence
+        latest_phase_change: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+        while True:
+            page_size = self.read_page_size
+            if remaining is not None:
+                page_size = min(page_size, remaining)
+            rows = await self._backend.read_events(
+                room_id, after, event_type, page_size
             )
-            return event
+            events = await self._build_events(rows, latest_phase_change)
+            for event in events:
+                yield event
+
+            if len(events) < page_size:
+                return
+            after = events[-1].sequence
+            if remaining is not None:
+                remaining -= len(events)
+                if remaining <= 0:
+                    return
 
     async def get_events_since(
         self, room_id: str, since_sequence: int
@@ -179,31 +496,7 @@ class EventStore:
         Returns:
             List[GameEvent]: Events in chronological order
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            """
-            SELECT sequence, room_id, event_type, payload, player_id, timestamp, created_at
-            FROM game_events 
-            WHERE room_id = ? AND sequence > ?
-            ORDER BY sequence ASC
-        """,
-            (room_id, since_sequence),
-        )
-
-        events = []
-        for row in cursor.fetchall():
-            event = GameEvent(
-                sequence=row[0],
-                room_id=row[1],
-                event_type=row[2],
-                payload=json.loads(row[3]),
-                player_id=row[4],
-                timestamp=row[5],
-                created_at=row[6],
-            )
-            events.append(event)
-
-        conn.close()
+        events = [event async for event in self.iter_events(room_id, since_sequence)]
 
         logger.info(
             f"Retrieved {len(events)} events for room {room_id} since sequence {since_sequence}"
@@ -223,36 +516,7 @@ class EventStore:
         Returns:
             List[GameEvent]: All events for the room in chronological order
         """
-        conn = sqlite3.connect(self.db_path)
-
-        query = """
-            SELECT sequence, room_id, event_type, payload, player_id, timestamp, created_at
-            FROM game_events 
-            WHERE room_id = ?
-            ORDER BY sequence ASC
-        """
-
-        params = [room_id]
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-
-        cursor = conn.execute(query, params)
-
-        events = []
-        for row in cursor.fetchall():
-            event = GameEvent(
-                sequence=row[0],
-                room_id=row[1],
-                event_type=row[2],
-                payload=json.loads(row[3]),
-                player_id=row[4],
-                timestamp=row[5],
-                created_at=row[6],
-            )
-            events.append(event)
-
-        conn.close()
+        events = [event async for event in self.iter_events(room_id, limit=limit)]
 
         logger.info(f"Retrieved {len(events)} total events for room {room_id}")
         return events
@@ -266,45 +530,80 @@ class EventStore:
 
         Returns:
             Dict: Reconstructed room state
+
+        Starts from the cached state of the previous replay or the latest
+        snapshot, and applies only the events stored after it.
         """
-        events = await self.get_room_events(room_id)
-
-        # Initialize empty state
-        state = {
-            "room_id": room_id,
-            "phase": "waiting",
-            "players": {},
-            "game_state": {},
-            "round_number": 0,
-            "events_processed": 0,
-            "last_sequence": 0,
-        }
+        await self.open()
+        state = self._replay_cache.pop(room_id, None)
+        source = "cache"
+        if state is None:
+            snapshot = await self._backend.load_snapshot(room_id)
+            state = json.loads(snapshot) if snapshot else None
+            source = "snapshot"
+        if state is None:
+            # Initialize empty state
+            state = {
+                "room_id": room_id,
+                "phase": "waiting",
+                "players": {},
+                "game_state": {},
+                "round_number": 0,
+                "events_processed": 0,
+                "last_sequence": 0,
+            }
+            source = "empty state"
 
-        # Replay events to reconstruct state
+        events = await self.get_events_since(room_id, state["last_sequence"])
+
+        # Replay the tail of events to bring the state up to date
         for event in events:
-            state = self._apply_event_to_state(state, event)
+            self._apply_event_to_state(state, event)
             state["events_processed"] += 1
             state["last_sequence"] = event.sequence
 
-        logger.info(f"Reconstructed state for room {room_id} from {len(events)} events")
-        return state
+        # Snapshot periodically so a cold replay never starts far back
+        since_snapshot = self._replay_events_since_snapshot.get(room_id, 0) + len(
+            events
+        )
+        if since_snapshot >= self.snapshot_interval:
+            self._save_snapshot(room_id, state)
+            since_snapshot = 0
+        self._replay_events_since_snapshot[room_id] = since_snapshot
+
+        if self.replay_cache_size:
+            self._replay_cache[room_id] = state
+            while len(self._replay_cache) > self.replay_cache_size:
+                evicted, _ = self._replay_cache.popitem(last=False)
+                self._replay_events_since_snapshot.pop(evicted, None)
+
+        logger.info(
+            f"Reconstructed state for room {room_id} from {source} "
+            f"+ {len(events)} events"
+        )
+        # Callers get their own copy; the cached state keeps being updated
+        return copy.deepcopy(state)
+
+    def _save_snapshot(self, room_id: str, state: Dict[str, Any]) -> None:
+        """Store a room's replayed state (written with the next event batch)"""
+        self._backend.save_snapshot(
+            room_id, state["last_sequence"], json.dumps(state), time.time()
+        )
 
     def _apply_event_to_state(
         self, state: Dict[str, Any], event: GameEvent
     ) -> Dict[str, Any]:
         """
-        Apply a single event to the current state
+        Apply a single event to the current state, in place
 
         Args:
-            state: Current state dictionary
+            state: Current state dictionary (mutated)
             event: Event to apply
 
         Returns:
-            Dict: Updated state
+            Dict: Updated state (the same object)
         """
-        # Create a deep copy to avoid mutation of nested structures
-        import copy
-        new_state = copy.deepcopy(state)
+        new_state = state
 
         try:
             # Initialize nested structures if they don't exist
@@ -454,7 +753,7 @@ class EventStore:
 
         except Exception as e:
             logger.error(f"Error applying event {event.sequence} ({event.event_type}): {e}")
-            # Return original state on error to prevent corruption
+            # Skip the bad event rather than abort the whole replay
             return state
 
         return new_state
@@ -468,75 +767,85 @@ class EventStore:
 
         Returns:
             int: Number of events removed
+
+        Storage is trimmed at the backend's granularity: the SQLite backend
+        drops whole time partitions (deleting their files, which takes the
+        same time however many events they hold), so events in a partition
+        only partly past the cutoff are kept until its whole window expires.
         """
+        await self.open()
+        await self.flush()
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
-        cutoff_timestamp = cutoff_time.timestamp()
+        dropped = await self._backend.drop_before(cutoff_time.timestamp())
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            "DELETE FROM game_events WHERE timestamp < ?", (cutoff_timestamp,)
-        )
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        deleted_count = sum(dropped.values())
+        await self._trim_room_index(dropped)
+
+        # Snapshots of rooms with events left still describe their full state;
+        # drop the ones whose rooms were removed entirely
+        for room_id in await self._backend.snapshot_rooms():
+            if room_id not in self._room_index:
+                self._backend.delete_snapshot(room_id)
+                self._replay_cache.pop(room_id, None)
+                self._replay_events_since_snapshot.pop(room_id, None)
+        await self.flush()
 
         logger.info(
             f"Cleaned up {deleted_count} events older than {older_than_hours} hours"
         )
         return deleted_count
 
-    async def get_event_stats(self) -> Dict[str, Any]:
+    async def _trim_room_index(self, dropped: Dict[str, int]) -> None:
         """
-        Get statistics about stored events
+        Take events removed by retention (or evicted) out of the room index
 
-        Returns:
-            Dict: Event storage statistics
+        Rooms with no events left leave the index, so a room that is reused
+        after all its events expired starts again at room sequence 1.
         """
-        conn = sqlite3.connect(self.db_path)
+        for room_id, count in dropped.items():
+            room_range = self._room_index.get(room_id)
+            if room_range is None:
+                continue
+            room_range.event_count -= count
+            stored = await self._backend.stored_room_range(room_id)
+            if stored is not None:
+                room_range.first_sequence = stored.first_sequence
+                room_range.first_room_sequence = stored.first_room_sequence
+            elif room_range.event_count <= 0:
+                del self._room_index[room_id]
 
-        # Total events
-        cursor = conn.execute("SELECT COUNT(*) FROM game_events")
-        total_events = cursor.fetchone()[0]
-
-        # Events by room
-        cursor = conn.execute(
-            """
-            SELECT room_id, COUNT(*) as event_count 
-            FROM game_events 
-            GROUP BY room_id 
-            ORDER BY event_count DESC
+    async def get_event_stats(self) -> Dict[str, Any]:
         """
-        )
-        room_stats = dict(cursor.fetchall())
+        Get statistics about stored events
 
-        # Events by type
-        cursor = conn.execute(
-            """
-            SELECT event_type, COUNT(*) as event_count 
-            FROM game_events 
-            GROUP BY event_type 
-            ORDER BY event_count DESC
+        Returns:
+            Dict: Event storage statistics
         """
-        )
-        type_stats = dict(cursor.fetchall())
-
-        # Recent activity (last 24 hours)
+        # Per-room counts come from the room index; only the per-type and
+        # recent-activity counts need storage
+        await self.open()
+        room_stats = {
+            room_id: room_range.event_count
+            for room_id, room_range in sorted(
+                self._room_index.items(),
+                key=lambda item: item[1].event_count,
+                reverse=True,
+            )
+        }
+        await self.flush()
         cutoff_time = (datetime.now() - timedelta(hours=24)).timestamp()
-        cursor = conn.execute(
-            "SELECT COUNT(*) FROM game_events WHERE timestamp > ?", (cutoff_time,)
+        stats = await self._backend.query_stats(cutoff_time)
+        stats.update(
+            {
+                "total_events": sum(room_stats.values()),
+                "rooms_with_events": len(room_stats),
+                "room_stats": room_stats,
+                "current_sequence": self.sequence_counter - 1,
+                "payload_codec": self._codec.name,
+            }
         )
-        recent_events = cursor.fetchone()[0]
-
-        conn.close()
-
-        return {
-            "total_events": total_events,
-            "current_sequence": self.sequence_counter - 1,
-            "rooms_with_events": len(room_stats),
-            "events_last_24h": recent_events,
-            "room_stats": room_stats,
-            "event_type_stats": type_stats,
-        }
+        stats.update(self._backend.get_stats())
+        return stats
 
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -546,20 +855,22 @@ class EventStore:
             Dict: Health status information
         """
         try:
-            # Test database connection
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.execute("SELECT 1")
-            cursor.fetchone()
-            conn.close()
+            # Test storage connection
+            await self.open()
+            await self._backend.ping()
 
             # Get basic stats
             stats = await self.get_event_stats()
+            write_pipeline = stats.get("write_pipeline", {})
 
             return {
                 "status": "healthy",
                 "database_accessible": True,
+                "backend": stats["backend"],
                 "total_events": stats["total_events"],
                 "current_sequence": stats["current_sequence"],
+                "writer_running": write_pipeline.get("running", True),
+                "pending_writes": write_pipeline.get("pending", 0),
                 "last_check": datetime.now().isoformat(),
             }
 
@@ -586,36 +897,12 @@ class EventStore:
         Returns:
             List[GameEvent]: Filtered events in chronological order
         """
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
-            SELECT sequence, room_id, event_type, payload, player_id, timestamp, created_at
-            FROM game_events 
-            WHERE room_id = ? AND event_type = ?
-            ORDER BY sequence ASC
-        """
-        
-        params = [room_id, event_type]
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-            
-        cursor = conn.execute(query, params)
-        
-        events = []
-        for row in cursor.fetchall():
-            event = GameEvent(
-                sequence=row[0],
-                room_id=row[1],
-                event_type=row[2],
-                payload=json.loads(row[3]),
-                player_id=row[4],
-                timestamp=row[5],
-                created_at=row[6],
+        events = [
+            event
+            async for event in self.iter_events(
+                room_id, event_type=event_type, limit=limit
             )
-            events.append(event)
-            
-        conn.close()
+        ]
         
         logger.info(f"Retrieved {len(events)} {event_type} events for room {room_id}")
         return events
@@ -630,37 +917,101 @@ class EventStore:
         Returns:
             Dict: Complete room history with events and reconstructed state
         """
-        events = await self.get_room_events(room_id)
+        chunks = [chunk async for chunk in self.stream_room_history(room_id)]
+        return json.loads("".join(chunks))
+
+    async def stream_room_history(
+        self, room_id: str, chunk_size: int = 65536
+    ) -> AsyncIterator[str]:
+        """
+        Stream the export_room_history document as JSON text chunks
+
+        Events are read in pages (one pass per event type, then one for the
+        timeline), so memory stays bounded for long games.
+
+        Args:
+            room_id: The room identifier
+            chunk_size: Approximate size of each yielded chunk in characters
+
+        Yields:
+            str: Consecutive pieces of the JSON document
+        """
         state = await self.replay_room_state(room_id)
-        
+        await self.flush()
+        event_types = await self._backend.room_event_types(room_id)
+
+        buffer: List[str] = []
+        buffered = 0
+
+        def write(text: str) -> Optional[str]:
+            nonlocal buffered
+            buffer.append(text)
+            buffered += len(text)
+            if buffered < chunk_size:
+                return None
+            chunk = "".join(buffer)
+            buffer.clear()
+            buffered = 0
+            return chunk
+
+        parts = [
+            '{"room_id": ',
+            json.dumps(room_id),
+            ', "event_types": ',
+            json.dumps(event_types),
+            ', "reconstructed_state": ',
+            json.dumps(state),
+            ', "events_by_type": {',
+        ]
+        for text in parts:
+            chunk = write(text)
+            if chunk:
+                yield chunk
+
         # Group events by type for analysis
-        events_by_type = {}
-        for event in events:
-            if event.event_type not in events_by_type:
-                events_by_type[event.event_type] = []
-            events_by_type[event.event_type].append({
-                "sequence": event.sequence,
-                "timestamp": event.timestamp,
-                "player": event.player_id,
-                "payload": event.payload
-            })
-        
-        return {
-            "room_id": room_id,
-            "total_events": len(events),
-            "event_types": list(events_by_type.keys()),
-            "events_by_type": events_by_type,
-            "reconstructed_state": state,
-            "timeline": [
+        for type_index, event_type in enumerate(event_types):
+            header = (", " if type_index else "") + json.dumps(event_type) + ": ["
+            chunk = write(header)
+            if chunk:
+                yield chunk
+            first = True
+            async for event in self.iter_events(room_id, event_type=event_type):
+                entry = json.dumps(
+                    {
+                        "sequence": event.sequence,
+                        "timestamp": event.timestamp,
+                        "player": event.player_id,
+                        "payload": event.payload,
+                    }
+                )
+                chunk = write(entry if first else ", " + entry)
+                first = False
+                if chunk:
+                    yield chunk
+            chunk = write("]")
+            if chunk:
+                yield chunk
+
+        chunk = write('}, "timeline": [')
+        if chunk:
+            yield chunk
+        total_events = 0
+        async for event in self.iter_events(room_id):
+            entry = json.dumps(
                 {
-                    "sequence": e.sequence,
-                    "type": e.event_type,
-                    "timestamp": e.timestamp,
-                    "player": e.player_id
+                    "sequence": event.sequence,
+                    "type": event.event_type,
+                    "timestamp": event.timestamp,
+                    "player": event.player_id,
                 }
-                for e in events
-            ]
-        }
+            )
+            chunk = write(entry if not total_events else ", " + entry)
+            total_events += 1
+            if chunk:
+                yield chunk
+
+        write(f'], "total_events": {total_events}}}')
+        yield "".join(buffer)
 
     async def validate_event_sequence(self, room_id: str) -> Dict[str, Any]:
         """
@@ -671,43 +1022,56 @@ class EventStore:
             
         Returns:
             Dict: Validation results including any gaps or issues
+
+        Gaps are checked in the per-room sequence (the global sequence
+        interleaves rooms). When the stored event count matches the room
+        index and its room-sequence span, the room is valid without reading
+        any events; otherwise its room sequences are scanned for the gaps.
+        On a shared backend other processes write the room too, so the
+        stored events are checked against their own range instead.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            """
-            SELECT sequence FROM game_events 
-            WHERE room_id = ?
-            ORDER BY sequence ASC
-            """,
-            (room_id,)
-        )
-        
-        sequences = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        
-        if not sequences:
+        await self.open()
+        if self._backend.shared:
+            await self.flush()
+            room_range = stored = await self._backend.stored_room_range(room_id)
+        else:
+            room_range = self._room_index.get(room_id)
+            if room_range is not None:
+                # Events stored while we wait below aren't part of this check
+                room_range = copy.copy(room_range)
+                await self.flush()
+                stored = await self._backend.stored_room_range(room_id)
+        if room_range is None:
             return {
                 "valid": True,
                 "message": "No events found",
                 "gaps": [],
                 "total_events": 0
             }
-        
-        # Check for gaps
+
+        stored_count = stored.event_count if stored else 0
+        span = room_range.last_room_sequence - room_range.first_room_sequence + 1
+
         gaps = []
-        expected = sequences[0]
-        for seq in sequences:
-            if seq != expected:
-                gaps.append({"expected": expected, "found": seq})
-            expected = seq + 1
-        
+        if stored_count != room_range.event_count or stored_count != span:
+            sequences = await self._backend.room_sequences(room_id)
+            expected = room_range.first_room_sequence
+            for seq in sequences:
+                if seq != expected:
+                    gaps.append({"expected": expected, "found": seq})
+                expected = seq + 1
+            if expected <= room_range.last_room_sequence:
+                gaps.append({"expected": expected, "found": None})
+
         return {
             "valid": len(gaps) == 0,
             "message": "Sequence valid" if len(gaps) == 0 else f"Found {len(gaps)} gaps",
             "gaps": gaps,
-            "total_events": len(sequences),
-            "first_sequence": sequences[0],
-            "last_sequence": sequences[-1]
+            "total_events": stored_count,
+            "first_sequence": room_range.first_sequence,
+            "last_sequence": room_range.last_sequence,
+            "first_room_sequence": room_range.first_room_sequence,
+            "last_room_sequence": room_range.last_room_sequence,
         }
 
 
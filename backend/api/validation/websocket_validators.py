@@ -24,6 +24,7 @@ class WebSocketMessageValidator:
     MIN_DECLARATION_VALUE = 0
     MAX_SLOT_ID = 4
     MIN_SLOT_ID = 1
+    MAX_ACK_RANGES = 32
 
     # Allowed event names
     ALLOWED_EVENTS = {
@@ -417,6 +418,40 @@ class WebSocketMessageValidator:
 
         return True, None
 
+    @staticmethod
+    def validate_ack_ranges(ranges: Any) -> Tuple[bool, Optional[str]]:
+        """
+        Validate selective acknowledgment ranges.
+
+        A list of inclusive [start, end] sequence pairs the client received
+        (e.g. beyond a gap), at most MAX_ACK_RANGES of them.
+
+        Args:
+            ranges: The ranges to validate
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not isinstance(ranges, list):
+            return False, "Ack ranges must be a list"
+
+        if len(ranges) > WebSocketMessageValidator.MAX_ACK_RANGES:
+            return False, "Too many ack ranges"
+
+        for ack_range in ranges:
+            if not isinstance(ack_range, list) or len(ack_range) != 2:
+                return False, "Each ack range must be a [start, end] pair"
+            for sequence in ack_range:
+                is_valid, error = WebSocketMessageValidator.validate_sequence_number(
+                    sequence
+                )
+                if not is_valid:
+                    return False, error
+            if ack_range[0] > ack_range[1]:
+                return False, "Ack range start must not exceed its end"
+
+        return True, None
+
     @staticmethod
     def validate_client_id(client_id: Any) -> Tuple[bool, Optional[str]]:
         """
@@ -550,15 +585,25 @@ class WebSocketMessageValidator:
                 sanitized_data["player_name"] = event_data["player_name"].strip()
 
         elif event_name == "ack":
-            is_valid, error = cls.validate_sequence_number(event_data.get("sequence"))
-            if not is_valid:
-                return False, error, None
+            # One sequence, a cumulative "up_to", SACK "ranges", or a mix
+            acked_fields = [
+                key for key in ("sequence", "up_to", "ranges") if key in event_data
+            ]
+            if not acked_fields:
+                return False, "Sequence number is required", None
+            for key in acked_fields:
+                if key == "ranges":
+                    is_valid, error = cls.validate_ack_ranges(event_data[key])
+                else:
+                    is_valid, error = cls.validate_sequence_number(event_data[key])
+                if not is_valid:
+                    return False, error, None
+                sanitized_data[key] = event_data[key]
             is_valid, error = cls.validate_client_id(
                 event_data.get("client_id", "unknown")
             )
             if not is_valid:
                 return False, error, None
-            sanitized_data["sequence"] = event_data["sequence"]
             sanitized_data["client_id"] = event_data.get("client_id", "unknown")
 
         elif event_name == "sync_request":
@@ -99,15 +99,7 @@ class GameStateSync:
         for player in game.players:
             # Get hand data (only full hand for reconnecting player)
             if player.name == reconnecting_player:
-                hand_data = [
-                    {
-                        "rank": piece.rank,
-                        "suit": piece.suit,
-                        "display": str(piece),
-                        "value": piece.value,
-                    }
-                    for piece in (player.hand or [])
-                ]
+                hand_data = player.hand.to_dicts() if player.hand else []
             else:
                 # Other players just get hand size
                 hand_data = None
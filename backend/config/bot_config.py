@@ -0,0 +1,133 @@
+# backend/config/bot_config.py
+
+"""
+Bot AI configuration module.
+
+Centralizes tuning knobs for bot decision making (decision caching,
+cross-room batching and the executor that runs AI work), with support for environment-based
+configuration and runtime reloads.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+DECISION_CACHE_POLICIES = ("lru", "fifo")
+EXECUTOR_BACKENDS = ("inline", "thread", "process")
+
+
+@dataclass
+class BotConfig:
+    """Main configuration class for bot AI."""
+
+    # Decision cache
+    decision_cache_enabled: bool = field(
+        default_factory=lambda: os.getenv("BOT_DECISION_CACHE_ENABLED", "true").lower()
+        == "true"
+    )
+    decision_cache_size: int = field(
+        default_factory=lambda: int(os.getenv("BOT_DECISION_CACHE_SIZE", "4096"))
+    )
+    decision_cache_policy: str = field(
+        default_factory=lambda: os.getenv("BOT_DECISION_CACHE_POLICY", "lru").lower()
+    )
+
+    # Executor for AI decisions
+    executor_backend: str = field(
+        default_factory=lambda: os.getenv("BOT_EXECUTOR_BACKEND", "thread").lower()
+    )
+    executor_workers: int = field(
+        default_factory=lambda: int(
+            os.getenv("BOT_EXECUTOR_WORKERS", str(os.cpu_count() or 1))
+        )
+    )
+
+    # Cross-room decision batching
+    batch_enabled: bool = field(
+        default_factory=lambda: os.getenv("BOT_BATCH_ENABLED", "true").lower()
+        == "true"
+    )
+    batch_window_ms: float = field(
+        default_factory=lambda: float(os.getenv("BOT_BATCH_WINDOW_MS", "5"))
+    )
+    batch_max_size: int = field(
+        default_factory=lambda: int(os.getenv("BOT_BATCH_MAX_SIZE", "64"))
+    )
+
+    def validate(self) -> bool:
+        """Validate configuration values."""
+        errors = []
+
+        if self.decision_cache_size < 1:
+            errors.append("Decision cache size must be >= 1")
+
+        if self.decision_cache_policy not in DECISION_CACHE_POLICIES:
+            errors.append(
+                f"Decision cache policy must be one of {DECISION_CACHE_POLICIES}"
+            )
+
+        if self.executor_backend not in EXECUTOR_BACKENDS:
+            errors.append(f"Executor backend must be one of {EXECUTOR_BACKENDS}")
+
+        if self.executor_workers < 1:
+            errors.append("Executor workers must be >= 1")
+
+        if self.batch_window_ms < 0:
+            errors.append("Batch window must be >= 0ms")
+
+        if self.batch_max_size < 1:
+            errors.append("Batch max size must be >= 1")
+
+        if errors:
+            print(f"Bot configuration errors: {', '.join(errors)}")
+            return False
+
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert configuration to dictionary for API responses."""
+        return {
+            "decision_cache": {
+                "enabled": self.decision_cache_enabled,
+                "size": self.decision_cache_size,
+                "policy": self.decision_cache_policy,
+            },
+            "executor": {
+                "backend": self.executor_backend,
+                "workers": self.executor_workers,
+            },
+            "batching": {
+                "enabled": self.batch_enabled,
+                "window_ms": self.batch_window_ms,
+                "max_size": self.batch_max_size,
+            },
+        }
+
+
+# Global configuration instance
+_config: Optional[BotConfig] = None
+
+
+def get_bot_config() -> BotConfig:
+    """Get the global bot configuration instance."""
+    global _config
+    if _config is None:
+        _config = BotConfig()
+        if not _config.validate():
+            print("Warning: Bot configuration validation failed, using defaults")
+            _config = BotConfig(
+                decision_cache_size=4096,
+                decision_cache_policy="lru",
+                executor_backend="thread",
+                executor_workers=os.cpu_count() or 1,
+                batch_window_ms=5,
+                batch_max_size=64,
+            )
+    return _config
+
+
+def reload_config():
+    """Reload configuration from environment variables."""
+    global _config
+    _config = None
+    return get_bot_config()
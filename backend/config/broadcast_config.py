@@ -0,0 +1,172 @@
+# backend/config/broadcast_config.py
+
+"""
+Broadcast configuration module.
+
+Centralizes settings for WebSocket broadcasts (the versioned state
+channel used for phase_change updates, per-socket fan-out, the bounded
+per-room queues and their dispatchers), with support for
+environment-based configuration and runtime reloads.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional
+
+# What a full room queue does with a new message (see BroadcastQueue)
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "close_slow")
+
+DEFAULT_CRITICAL_EVENTS = "game_started,game_ended,room_closed,host_changed"
+
+
+def _parse_events(value: str) -> FrozenSet[str]:
+    return frozenset(event.strip() for event in value.split(",") if event.strip())
+
+
+@dataclass
+class BroadcastConfig:
+    """Main configuration class for WebSocket broadcasts."""
+
+    # Versioned state channel: send phase_change as a patch against the
+    # previous version, with the full state every `state_keyframe_interval`
+    # messages
+    state_deltas: bool = field(
+        default_factory=lambda: os.getenv("BROADCAST_STATE_DELTAS", "true").lower()
+        == "true"
+    )
+    state_keyframe_interval: int = field(
+        default_factory=lambda: int(os.getenv("BROADCAST_KEYFRAME_INTERVAL", "50"))
+    )
+
+    # Fan-out: each socket has its own writer with a buffer of at most
+    # `socket_buffer_size` frames; a socket that overflows it, or takes more
+    # than `send_timeout` seconds to accept a frame, is disconnected
+    send_timeout: float = field(
+        default_factory=lambda: float(os.getenv("BROADCAST_SEND_TIMEOUT", "5.0"))
+    )
+    socket_buffer_size: int = field(
+        default_factory=lambda: int(os.getenv("BROADCAST_SOCKET_BUFFER", "64"))
+    )
+
+    # Per-room queues: at most `queue_size` messages wait for fan-out; when
+    # full, `overflow_policy` (one of OVERFLOW_POLICIES) makes room.
+    # Critical events are only dropped if nothing else is queued
+    queue_size: int = field(
+        default_factory=lambda: int(os.getenv("BROADCAST_QUEUE_SIZE", "256"))
+    )
+    overflow_policy: str = field(
+        default_factory=lambda: os.getenv(
+            "BROADCAST_OVERFLOW_POLICY", "coalesce"
+        ).lower()
+    )
+    critical_events: FrozenSet[str] = field(
+        default_factory=lambda: _parse_events(
+            os.getenv("BROADCAST_CRITICAL_EVENTS", DEFAULT_CRITICAL_EVENTS)
+        )
+    )
+    # close_slow: a socket whose sends average at least this many seconds
+    # counts as slow
+    slow_consumer_seconds: float = field(
+        default_factory=lambda: float(
+            os.getenv("BROADCAST_SLOW_CONSUMER_SECONDS", "1.0")
+        )
+    )
+
+    # Dispatch: `dispatcher_shards` tasks serve every room's queue (rooms are
+    # assigned by hash), taking up to `dispatch_batch` messages per visit
+    dispatcher_shards: int = field(
+        default_factory=lambda: int(os.getenv("BROADCAST_DISPATCHER_SHARDS", "4"))
+    )
+    dispatch_batch: int = field(
+        default_factory=lambda: int(os.getenv("BROADCAST_DISPATCH_BATCH", "32"))
+    )
+
+    def validate(self) -> bool:
+        """Validate configuration values."""
+        errors = []
+
+        if self.state_keyframe_interval < 1:
+            errors.append("State keyframe interval must be >= 1")
+
+        if self.send_timeout <= 0:
+            errors.append("Send timeout must be positive")
+
+        if self.socket_buffer_size < 1:
+            errors.append("Socket buffer size must be >= 1")
+
+        if self.queue_size < 1:
+            errors.append("Queue size must be >= 1")
+
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            errors.append(f"Overflow policy must be one of {OVERFLOW_POLICIES}")
+
+        if self.slow_consumer_seconds <= 0:
+            errors.append("Slow consumer threshold must be positive")
+
+        if self.dispatcher_shards < 1:
+            errors.append("Dispatcher shards must be >= 1")
+
+        if self.dispatch_batch < 1:
+            errors.append("Dispatch batch must be >= 1")
+
+        if errors:
+            print(f"Broadcast configuration errors: {', '.join(errors)}")
+            return False
+
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert configuration to dictionary for API responses."""
+        return {
+            "state_channel": {
+                "deltas": self.state_deltas,
+                "keyframe_interval": self.state_keyframe_interval,
+            },
+            "fan_out": {
+                "send_timeout": self.send_timeout,
+                "socket_buffer_size": self.socket_buffer_size,
+            },
+            "queue": {
+                "size": self.queue_size,
+                "overflow_policy": self.overflow_policy,
+                "critical_events": sorted(self.critical_events),
+                "slow_consumer_seconds": self.slow_consumer_seconds,
+            },
+            "dispatch": {
+                "shards": self.dispatcher_shards,
+                "batch": self.dispatch_batch,
+            },
+        }
+
+
+# Global configuration instance
+_config: Optional[BroadcastConfig] = None
+
+
+def get_broadcast_config() -> BroadcastConfig:
+    """Get the global broadcast configuration instance."""
+    global _config
+    if _config is None:
+        _config = BroadcastConfig()
+        if not _config.validate():
+            print("Warning: Broadcast configuration validation failed, using defaults")
+            _config = BroadcastConfig(
+                state_deltas=True,
+                state_keyframe_interval=50,
+                send_timeout=5.0,
+                socket_buffer_size=64,
+                queue_size=256,
+                overflow_policy="coalesce",
+                critical_events=_parse_events(DEFAULT_CRITICAL_EVENTS),
+                slow_consumer_seconds=1.0,
+                dispatcher_shards=4,
+                dispatch_batch=32,
+            )
+    return _config
+
+
+def reload_config():
+    """Reload configuration from environment variables."""
+    global _config
+    _config = None
+    return get_broadcast_config()
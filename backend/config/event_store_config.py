@@ -0,0 +1,231 @@
+# backend/config/event_store_config.py
+
+"""
+Event store configuration module.
+
+Centralizes settings for the event sourcing store (storage backend and
+database location, time partitions and retention, payload encoding, the
+write pipeline's group-commit batching, the reader pool and state replay
+snapshots), with support for environment-based configuration and runtime
+reloads.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+EVENT_BACKENDS = ("sqlite", "memory", "postgres")
+PAYLOAD_CODECS = ("json", "msgpack", "zlib", "zstd")
+PARTITION_WINDOW_NAMES = ("hour", "day")
+
+
+@dataclass
+class EventStoreConfig:
+    """Main configuration class for the event store."""
+
+    # Storage backend (one of EVENT_BACKENDS), chosen at startup
+    backend: str = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_BACKEND", "sqlite").lower()
+    )
+
+    # Storage location (sqlite backend)
+    db_path: str = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_DB_PATH", "game_events.db")
+    )
+
+    # postgres backend: connection string, pool size, and how many global
+    # sequence numbers each process reserves at a time
+    postgres_dsn: str = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_POSTGRES_DSN", "")
+    )
+    postgres_pool_size: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_POSTGRES_POOL_SIZE", "5"))
+    )
+    sequence_block_size: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_SEQUENCE_BLOCK", "1000"))
+    )
+
+    # memory backend: events kept before the oldest are evicted
+    memory_capacity: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_MEMORY_CAPACITY", "100000"))
+    )
+
+    # Time partitions: events go to one file per `partition_window` in
+    # `partition_dir` (default: "<db_path without extension>_partitions"),
+    # and retention cleanup deletes whole partition files
+    partition_window: str = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_PARTITION_WINDOW", "day").lower()
+    )
+    partition_dir: str = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_PARTITION_DIR", "")
+    )
+
+    # Payload encoding: codec (see event_codec.PAYLOAD_CODECS) and whether
+    # phase_change payloads are stored as diffs, with a full copy every
+    # `phase_change_keyframe_interval` phase_change events per room
+    payload_codec: str = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_PAYLOAD_CODEC", "zlib").lower()
+    )
+    phase_change_diffs: bool = field(
+        default_factory=lambda: os.getenv("EVENT_STORE_PHASE_DIFFS", "true").lower()
+        == "true"
+    )
+    phase_change_keyframe_interval: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_KEYFRAME_INTERVAL", "20"))
+    )
+
+    # Write pipeline: commit every `write_batch_size` events or
+    # `write_batch_interval_ms` after the first pending event
+    write_batch_size: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_BATCH_SIZE", "256"))
+    )
+    write_batch_interval_ms: float = field(
+        default_factory=lambda: float(os.getenv("EVENT_STORE_BATCH_INTERVAL_MS", "20"))
+    )
+
+    # Read path: connections in the reader pool, and rows fetched per page
+    # when streaming events
+    reader_pool_size: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_READERS", "2"))
+    )
+    read_page_size: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_READ_PAGE_SIZE", "500"))
+    )
+
+    # Replay: snapshot a room's state every `snapshot_interval` replayed
+    # events, and keep reconstructed state for `replay_cache_size` rooms
+    snapshot_interval: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_SNAPSHOT_INTERVAL", "500"))
+    )
+    replay_cache_size: int = field(
+        default_factory=lambda: int(os.getenv("EVENT_STORE_REPLAY_CACHE_SIZE", "256"))
+    )
+
+    def validate(self) -> bool:
+        """Validate configuration values."""
+        errors = []
+
+        if self.backend not in EVENT_BACKENDS:
+            errors.append(f"Backend must be one of {EVENT_BACKENDS}")
+
+        if not self.db_path:
+            errors.append("Database path must not be empty")
+
+        if self.backend == "postgres" and not self.postgres_dsn:
+            errors.append("postgres backend requires EVENT_STORE_POSTGRES_DSN")
+
+        if self.postgres_pool_size < 1:
+            errors.append("Postgres pool size must be >= 1")
+
+        if self.sequence_block_size < 1:
+            errors.append("Sequence block size must be >= 1")
+
+        if self.memory_capacity < 1:
+            errors.append("Memory capacity must be >= 1")
+
+        if self.partition_window not in PARTITION_WINDOW_NAMES:
+            errors.append(f"Partition window must be one of {PARTITION_WINDOW_NAMES}")
+
+        if self.payload_codec not in PAYLOAD_CODECS:
+            errors.append(f"Payload codec must be one of {PAYLOAD_CODECS}")
+
+        if self.phase_change_keyframe_interval < 1:
+            errors.append("Phase change keyframe interval must be >= 1")
+
+        if self.write_batch_size < 1:
+            errors.append("Write batch size must be >= 1")
+
+        if self.write_batch_interval_ms < 0:
+            errors.append("Write batch interval must be >= 0ms")
+
+        if self.reader_pool_size < 1:
+            errors.append("Reader pool size must be >= 1")
+
+        if self.read_page_size < 1:
+            errors.append("Read page size must be >= 1")
+
+        if self.snapshot_interval < 1:
+            errors.append("Snapshot interval must be >= 1")
+
+        if self.replay_cache_size < 0:
+            errors.append("Replay cache size must be >= 0")
+
+        if errors:
+            print(f"Event store configuration errors: {', '.join(errors)}")
+            return False
+
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert configuration to dictionary for API responses."""
+        return {
+            "backend": self.backend,
+            "db_path": self.db_path,
+            "postgres": {
+                "configured": bool(self.postgres_dsn),
+                "pool_size": self.postgres_pool_size,
+                "sequence_block_size": self.sequence_block_size,
+            },
+            "memory_capacity": self.memory_capacity,
+            "partitions": {
+                "window": self.partition_window,
+                "directory": self.partition_dir or None,
+            },
+            "payload": {
+                "codec": self.payload_codec,
+                "phase_change_diffs": self.phase_change_diffs,
+                "keyframe_interval": self.phase_change_keyframe_interval,
+            },
+            "write_pipeline": {
+                "batch_size": self.write_batch_size,
+                "batch_interval_ms": self.write_batch_interval_ms,
+            },
+            "read_path": {
+                "reader_pool_size": self.reader_pool_size,
+                "page_size": self.read_page_size,
+            },
+            "replay": {
+                "snapshot_interval": self.snapshot_interval,
+                "cache_size": self.replay_cache_size,
+            },
+        }
+
+
+# Global configuration instance
+_config: Optional[EventStoreConfig] = None
+
+
+def get_event_store_config() -> EventStoreConfig:
+    """Get the global event store configuration instance."""
+    global _config
+    if _config is None:
+        _config = EventStoreConfig()
+        if not _config.validate():
+            print("Warning: Event store configuration validation failed, using defaults")
+            _config = EventStoreConfig(
+                backend="sqlite",
+                db_path="game_events.db",
+                postgres_dsn="",
+                postgres_pool_size=5,
+                sequence_block_size=1000,
+                memory_capacity=100000,
+                partition_window="day",
+                partition_dir="",
+                payload_codec="zlib",
+                phase_change_diffs=True,
+                phase_change_keyframe_interval=20,
+                write_batch_size=256,
+                write_batch_interval_ms=20,
+                reader_pool_size=2,
+                read_page_size=500,
+                snapshot_interval=500,
+                replay_cache_size=256,
+            )
+    return _config
+
+
+def reload_config():
+    """Reload configuration from environment variables."""
+    global _config
+    _config = None
+    return get_event_store_config()
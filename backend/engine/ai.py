@@ -1,23 +1,102 @@
 # backend/engine/ai.py
 
-from collections import Counter
-from itertools import combinations
+from itertools import combinations, product
 
-from backend.engine.rules import get_play_type, is_valid_play
+from backend.engine.hand import (
+    FIELD_MASK,
+    KIND_UNIT,
+    iter_sub_multisets,
+    kinds_mask,
+    pack_pieces,
+    packed_contains,
+    packed_points,
+    packed_size,
+    unpack_kinds,
+)
+from backend.engine.rules import get_play_type_for_key
+
+# ------------------------------------------------------------------
+# Every play of 2+ pieces is one color and drawn from one of these
+# groups, so the search only looks inside each (color, group) slice.
+# ------------------------------------------------------------------
+_PLAY_GROUPS = [
+    ("GENERAL", "ADVISOR", "ELEPHANT"),
+    ("CHARIOT", "HORSE", "CANNON"),
+    ("SOLDIER",),
+]
+_PLAY_GROUP_MASKS = [
+    kinds_mask(f"{name}_{color}" for name in group)
+    for color in ("RED", "BLACK")
+    for group in _PLAY_GROUPS
+]
+
+
+def _iter_valid_plays(packed, min_size=1, max_size=6):
+    """
+    Yield (key, play_type) for each distinct valid play in a packed hand.
+
+    Repeated pieces are enumerated once per distinct count, and sub-multisets
+    that mix colors or groups are never generated.
+    """
+    if min_size <= 1 <= max_size:
+        for unit in KIND_UNIT.values():
+            if (packed // unit) & FIELD_MASK:
+                yield unit, "SINGLE"
+    if max_size < 2:
+        return
+    for mask in _PLAY_GROUP_MASKS:
+        group_packed = packed & mask
+        if not group_packed:
+            continue
+        for key in iter_sub_multisets(group_packed, max(min_size, 2), max_size):
+            play_type = get_play_type_for_key(key)
+            if play_type != "INVALID":
+                yield key, play_type
+
+
+def _kind_positions(hand):
+    """Map each kind to the hand indexes holding it, in hand order."""
+    positions = {}
+    for i, piece in enumerate(hand):
+        positions.setdefault(piece.kind, []).append(i)
+    return positions
+
+
+def _first_positions(key, positions):
+    """
+    Hand indexes of the earliest combination (in itertools.combinations
+    order) that realizes the multiset `key`.
+    """
+    taken = {}
+    for kind in unpack_kinds(key):
+        taken[kind] = taken.get(kind, 0) + 1
+    return tuple(sorted(i for kind, n in taken.items() for i in positions[kind][:n]))
+
+
+def _all_positions(key, positions):
+    """Hand indexes of every combination that realizes the multiset `key`."""
+    taken = {}
+    for kind in unpack_kinds(key):
+        taken[kind] = taken.get(kind, 0) + 1
+    choices = [combinations(positions[kind], n) for kind, n in taken.items()]
+    for parts in product(*choices):
+        yield tuple(sorted(i for part in parts for i in part))
 
 
 # ------------------------------------------------------------------
 # Find all valid combinations from a hand (1 to 6 pieces per combo)
 # ------------------------------------------------------------------
 def find_all_valid_combos(hand):
-    results = []
-    for r in range(1, 7):  # Try all combination lengths from 1 to 6
-        for combo in combinations(hand, r):
-            pieces = list(combo)
-            if is_valid_play(pieces):
-                play_type = get_play_type(pieces)
-                results.append((play_type, pieces))
-    return results
+    # Same result (and order) as checking itertools.combinations(hand, r)
+    # for r = 1..6, but only distinct valid multisets are classified;
+    # duplicates are then expanded back to every matching combination.
+    positions = _kind_positions(hand)
+    found = []
+    for key, play_type in _iter_valid_plays(pack_pieces(hand)):
+        for idx in _all_positions(key, positions):
+            found.append((len(idx), idx, play_type))
+    found.sort()
+    return [(play_type, [hand[i] for i in idx]) for _, idx, play_type in found]
 
 
 # ------------------------------------------------------------------
@@ -132,9 +211,7 @@ def choose_declare(
 # (helps prevent using pieces not actually in the player's hand)
 # ------------------------------------------------------------------
 def pieces_exist_in_hand(play, hand):
-    play_counts = Counter(play)
-    hand_counts = Counter(hand)
-    return all(play_counts[p] <= hand_counts[p] for p in play)
+    return packed_contains(pack_pieces(hand), pack_pieces(play))
 
 
 # ------------------------------------------------------------------
@@ -144,21 +221,29 @@ def choose_best_play(hand: list, required_count, verbose: bool = True) -> list:
     best_play = None
     best_score = -1
     best_type = None
+    best_rank = None
 
     # Determine which sizes of combinations to check
-    play_sizes = [required_count] if required_count else range(1, 7)
-
-    for r in play_sizes:
-        for combo in combinations(hand, r):
-            pieces = list(combo)
-            if required_count and len(pieces) != required_count:
-                continue  # Skip if the size does not match required count
-            if is_valid_play(pieces):
-                total = sum(p.point for p in pieces)
-                if total > best_score:
-                    best_score = total
-                    best_play = pieces
-                    best_type = get_play_type(pieces)
+    if required_count:
+        min_size = max_size = required_count
+    else:
+        min_size, max_size = 1, 6
+
+    # Highest total wins; ties go to the smaller play, then to the
+    # earliest hand positions (the first one itertools.combinations finds)
+    positions = _kind_positions(hand)
+    for key, play_type in _iter_valid_plays(pack_pieces(hand), min_size, max_size):
+        total = packed_points(key)
+        if total < best_score:
+            continue
+        rank = (packed_size(key), _first_positions(key, positions))
+        if total > best_score or rank < best_rank:
+            best_score = total
+            best_rank = rank
+            best_type = play_type
+
+    if best_rank is not None:
+        best_play = [hand[i] for i in best_rank[1]]
 
     # Return best found play
     if best_play:
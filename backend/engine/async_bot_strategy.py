@@ -10,9 +10,12 @@ import time
 from typing import List, Optional, Dict, Any
 import logging
 
+from backend.engine.bot_decision_cache import get_decision_cache
+from backend.engine.bot_executor import DECISION_JOBS, get_bot_executor
+from backend.engine.bot_scheduler import get_decision_scheduler
+from backend.engine.hand import pack_pieces, unpack_kinds
 from backend.engine.piece import Piece
 from backend.engine.player import Player
-import backend.engine.ai as ai
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +28,24 @@ class AsyncBotStrategy:
     
     def __init__(self):
         """Initialize async bot strategy."""
-        self._decision_cache = {}  # Cache recent decisions
-        self._cache_ttl = 2.0  # Cache time-to-live in seconds
+        # Decisions are cached process-wide (see bot_decision_cache.py)
+
+    async def _decide(self, job_name: str, args: tuple) -> Any:
+        """
+        Run one AI decision job.
+
+        Goes through the cross-room batch scheduler when batching is
+        enabled, otherwise straight to the configured bot executor.
+        """
+        scheduler = get_decision_scheduler()
+        if scheduler is not None:
+            return await scheduler.submit(job_name, args)
+        return await get_bot_executor().run(DECISION_JOBS[job_name], *args)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get decision cache statistics (empty if caching is disabled)."""
+        cache = get_decision_cache()
+        return cache.get_stats() if cache else {}
         
     async def choose_declaration(
         self,
@@ -39,7 +58,8 @@ class AsyncBotStrategy:
     ) -> int:
         """
         Async version of declaration choice.
-        Runs the CPU-intensive AI decision in a thread pool.
+        Runs the CPU-intensive AI decision on the configured bot executor
+        (inline, thread pool or process pool; see bot_executor.py).
         
         Args:
             hand: Player's current hand
@@ -53,20 +73,37 @@ class AsyncBotStrategy:
             Number of piles to declare
         """
         start_time = time.time()
-        
-        # Run AI decision in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        declaration = await loop.run_in_executor(
-            None,
-            ai.choose_declare,
-            hand,
+
+        packed_hand = pack_pieces(hand)
+        cache = get_decision_cache()
+        cache_key = (
+            "declare",
+            packed_hand,
             is_first_player,
             position_in_order,
-            previous_declarations,
+            tuple(previous_declarations),
             must_declare_nonzero,
-            verbose
         )
-        
+        if cache is not None:
+            declaration = cache.get(cache_key)
+            if declaration is not None:
+                return declaration
+
+        # Run AI decision off the event loop (only the packed hand is sent)
+        declaration = await self._decide(
+            "declare",
+            (
+                packed_hand,
+                is_first_player,
+                position_in_order,
+                tuple(previous_declarations),
+                must_declare_nonzero,
+                verbose,
+            ),
+        )
+        if cache is not None:
+            cache.put(cache_key, declaration)
+
         elapsed = (time.time() - start_time) * 1000
         logger.debug(f"Async declaration choice took {elapsed:.2f}ms")
         
@@ -80,7 +117,11 @@ class AsyncBotStrategy:
     ) -> List[Piece]:
         """
         Async version of play choice.
-        Runs the CPU-intensive AI decision in a thread pool.
+        Runs the CPU-intensive AI decision on the configured bot executor.
+
+        The AI is run on the hand in canonical (strongest-first) order so
+        the chosen play depends only on the hand's pieces, not their order,
+        and can be cached by hand multiset.
         
         Args:
             hand: Player's current hand
@@ -91,17 +132,22 @@ class AsyncBotStrategy:
             List of pieces to play
         """
         start_time = time.time()
-        
-        # Run AI decision in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        pieces = await loop.run_in_executor(
-            None,
-            ai.choose_best_play,
-            hand,
-            required_count,
-            verbose
-        )
-        
+
+        packed_hand = pack_pieces(hand)
+        cache = get_decision_cache()
+        cache_key = ("play", packed_hand, required_count)
+        play_key = cache.get(cache_key) if cache is not None else None
+
+        if play_key is None:
+            # Run AI decision off the event loop (only the packed hand is sent)
+            play_key = await self._decide(
+                "play", (packed_hand, required_count, verbose)
+            )
+            if cache is not None:
+                cache.put(cache_key, play_key)
+
+        pieces = _take_from_hand(hand, play_key)
+
         elapsed = (time.time() - start_time) * 1000
         logger.debug(f"Async play choice took {elapsed:.2f}ms")
         
@@ -213,5 +259,18 @@ class AsyncBotStrategy:
         return dict(zip(bot_names, results))
 
 
+def _take_from_hand(hand: List[Piece], play_key: int) -> List[Piece]:
+    """Pick the pieces of a packed play out of `hand`, in hand order."""
+    wanted: Dict[str, int] = {}
+    for kind in unpack_kinds(play_key):
+        wanted[kind] = wanted.get(kind, 0) + 1
+    pieces = []
+    for piece in hand:
+        if wanted.get(piece.kind):
+            wanted[piece.kind] -= 1
+            pieces.append(piece)
+    return pieces
+
+
 # Global instance for reuse
 async_bot_strategy = AsyncBotStrategy()
\ No newline at end of file
@@ -13,6 +13,7 @@ from datetime import datetime
 
 from .player import Player
 from .async_game import AsyncGame
+from .game_clock import GameClock
 from .state_machine.core import GamePhase
 from .state_machine.game_state_machine import GameStateMachine
 
@@ -43,6 +44,7 @@ class AsyncRoom:
         self.started = False
         self.game: Optional[AsyncGame] = None
         self.game_state_machine: Optional[GameStateMachine] = None
+        self.clock: Optional[GameClock] = None  # None = GAME_CLOCK_MODE from env
         self.game_ended = False  # Track if game has reached GAME_OVER phase
         
         # Async locks for thread safety
@@ -268,7 +270,7 @@ class AsyncRoom:
                 
                 # Initialize state machine
                 self.game_state_machine = GameStateMachine(
-                    self.game, broadcast_callback
+                    self.game, broadcast_callback, clock=self.clock
                 )
                 self.game_state_machine.room_id = self.room_id
                 
@@ -0,0 +1,115 @@
+# backend/engine/bot_decision_cache.py
+"""
+Process-wide cache for bot AI decisions.
+
+Bot decisions are pure functions of the hand multiset and a small amount
+of context (position, previous declarations, required piece count), and
+the same inputs repeat across rooms. Keys use the packed hand encoding
+from hand.py so any ordering of the same pieces hits the same entry.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from backend.config.bot_config import get_bot_config
+
+_MISSING = object()
+
+
+class BotDecisionCache:
+    """
+    Bounded decision cache with hit/miss counters.
+
+    Eviction policies:
+    - "lru": a hit refreshes the entry; the least recently used is evicted
+    - "fifo": hits do not refresh; the oldest inserted entry is evicted
+    """
+
+    def __init__(self, max_size: int = 4096, policy: str = "lru"):
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown decision cache policy: {policy}")
+        self.max_size = max_size
+        self.policy = policy
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()  # AI may run in executor threads
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached decision for `key`, counting a hit or miss."""
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            if self.policy == "lru":
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a decision, evicting per the policy when full."""
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = value
+                if self.policy == "lru":
+                    self._entries.move_to_end(key)
+                return
+            self._entries[key] = value
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "policy": self.policy,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+_decision_cache: Optional[BotDecisionCache] = None
+
+
+def get_decision_cache() -> Optional[BotDecisionCache]:
+    """
+    Get the process-wide decision cache, created from BotConfig.
+
+    Returns:
+        The shared cache, or None if caching is disabled
+    """
+    global _decision_cache
+    config = get_bot_config()
+    if not config.decision_cache_enabled:
+        return None
+    if _decision_cache is None:
+        _decision_cache = BotDecisionCache(
+            max_size=config.decision_cache_size,
+            policy=config.decision_cache_policy,
+        )
+    return _decision_cache
+
+
+def reset_decision_cache() -> None:
+    """Discard the shared cache so the next call picks up new config."""
+    global _decision_cache
+    _decision_cache = None
@@ -0,0 +1,243 @@
+# backend/engine/bot_executor.py
+"""
+Execution backends for bot AI decisions.
+
+Bot decisions are CPU-bound. This module lets the server choose where
+that work runs:
+- "inline":  directly on the event loop (lowest latency, blocks the loop)
+- "thread":  the loop's default thread pool (previous behavior)
+- "process": a warm ProcessPoolExecutor for real CPU parallelism
+
+Jobs only exchange packed hands (ints, see hand.py) and plain values,
+so nothing engine-specific has to be pickled across processes.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import backend.engine.ai as ai
+from backend.config.bot_config import get_bot_config
+from backend.engine.hand import pack_pieces, unpack_kinds
+from backend.engine.piece import Piece
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------
+# Jobs (module-level so they can be sent to worker processes)
+# ------------------------------------------------------------------
+def declare_job(
+    packed_hand: int,
+    is_first_player: bool,
+    position_in_order: int,
+    previous_declarations: List[int],
+    must_declare_nonzero: bool,
+    verbose: bool,
+) -> int:
+    """Run ai.choose_declare on a packed hand."""
+    hand = [Piece(kind) for kind in unpack_kinds(packed_hand)]
+    return ai.choose_declare(
+        hand,
+        is_first_player,
+        position_in_order,
+        previous_declarations,
+        must_declare_nonzero,
+        verbose,
+    )
+
+
+def best_play_job(
+    packed_hand: int, required_count: Optional[int], verbose: bool
+) -> int:
+    """
+    Run ai.choose_best_play on a packed hand.
+
+    The hand is rebuilt in canonical (strongest-first) order, so the
+    result depends only on the hand's pieces.
+
+    Returns:
+        int: The chosen play, packed
+    """
+    hand = [Piece(kind) for kind in unpack_kinds(packed_hand)]
+    return pack_pieces(ai.choose_best_play(hand, required_count, verbose))
+
+
+DECISION_JOBS = {
+    "declare": declare_job,
+    "play": best_play_job,
+}
+
+
+def decision_batch_job(requests: List[tuple]) -> List[Any]:
+    """
+    Run a batch of decisions in one executor call.
+
+    Args:
+        requests: (job_name, args) pairs, job_name being a DECISION_JOBS key
+
+    Returns:
+        list: One result per request, in order
+    """
+    return [DECISION_JOBS[job_name](*args) for job_name, args in requests]
+
+
+def _warm_worker() -> None:
+    """Process initializer: make sure the play table is built up front."""
+    from backend.engine.rules import ensure_play_table
+
+    ensure_play_table()
+
+
+# ------------------------------------------------------------------
+# Backends
+# ------------------------------------------------------------------
+class BotExecutor(ABC):
+    """Base class: runs a job somewhere and records its latency."""
+
+    name = "base"
+
+    def __init__(self):
+        # Statistics
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    async def run(self, job: Callable[..., Any], *args: Any) -> Any:
+        """Run `job(*args)` on this backend and return its result."""
+        start_time = time.perf_counter()
+        try:
+            return await self._run(job, *args)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            elapsed = (time.perf_counter() - start_time) * 1000
+            self.calls += 1
+            self.total_ms += elapsed
+            self.max_ms = max(self.max_ms, elapsed)
+
+    @abstractmethod
+    async def _run(self, job: Callable[..., Any], *args: Any) -> Any:
+        """Run `job(*args)` and return its result (backend-specific)."""
+
+    def warm_up(self) -> None:
+        """Prepare the backend before the first decision (optional)."""
+
+    def shutdown(self) -> None:
+        """Release backend resources (optional)."""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get latency statistics for this backend."""
+        return {
+            "backend": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": (self.total_ms / self.calls) if self.calls else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+class InlineBotExecutor(BotExecutor):
+    """Runs jobs directly on the calling (event loop) thread."""
+
+    name = "inline"
+
+    async def _run(self, job, *args):
+        return job(*args)
+
+
+class ThreadBotExecutor(BotExecutor):
+    """Runs jobs in the event loop's default thread pool."""
+
+    name = "thread"
+
+    async def _run(self, job, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, job, *args)
+
+
+class ProcessBotExecutor(BotExecutor):
+    """Runs jobs in a pool of warm worker processes."""
+
+    name = "process"
+
+    def __init__(self, workers: int):
+        super().__init__()
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # "spawn" avoids forking a process that owns an event loop and threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return self._pool
+
+    def warm_up(self) -> None:
+        pool = self._get_pool()
+        # One trivial job per worker forces every process to start now
+        for _ in range(self.workers):
+            pool.submit(len, ())
+
+    async def _run(self, job, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), job, *args)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# ------------------------------------------------------------------
+# Process-wide executor selection
+# ------------------------------------------------------------------
+_executors: Dict[str, BotExecutor] = {}
+_active_backend: Optional[str] = None
+
+
+def create_bot_executor(backend: str, workers: int = 1) -> BotExecutor:
+    """Create an executor for the named backend."""
+    if backend == "inline":
+        return InlineBotExecutor()
+    if backend == "thread":
+        return ThreadBotExecutor()
+    if backend == "process":
+        return ProcessBotExecutor(workers)
+    raise ValueError(f"Unknown bot executor backend: {backend}")
+
+
+def get_bot_executor() -> BotExecutor:
+    """Get the executor selected by BotConfig (created on first use)."""
+    global _active_backend
+    config = get_bot_config()
+    backend = config.executor_backend
+    if backend not in _executors:
+        _executors[backend] = create_bot_executor(backend, config.executor_workers)
+        logger.info(f"Bot AI executor: {backend}")
+    _active_backend = backend
+    return _executors[backend]
+
+
+def get_executor_stats() -> Dict[str, Any]:
+    """Get latency statistics for every backend used in this process."""
+    return {
+        "active_backend": _active_backend,
+        "backends": {name: ex.get_stats() for name, ex in _executors.items()},
+    }
+
+
+def shutdown_bot_executors() -> None:
+    """Shut down all executors (called on application shutdown)."""
+    for executor in _executors.values():
+        executor.shutdown()
+    _executors.clear()
@@ -7,6 +7,7 @@ import time
 from typing import Dict, List, Optional, Set, Any
 
 import backend.engine.ai as ai
+from backend.engine.game_clock import GameClock, get_default_clock
 from backend.engine.player import Player
 from backend.engine.state_machine.core import ActionType, GameAction
 
@@ -128,6 +129,11 @@ class GameBotHandler:
             set()
         )  # Bot names triggered this cycle
 
+    @property
+    def clock(self) -> GameClock:
+        """Clock pacing bot delays - the room's clock when there is one"""
+        return getattr(self.state_machine, "clock", None) or get_default_clock()
+
     def _get_game_state(self):
         """Get current game state from state machine or fallback to direct game access"""
         if self.state_machine:
@@ -261,7 +267,7 @@ class GameBotHandler:
                     return
 
                 # Small delay to ensure phase data is ready
-                await asyncio.sleep(0.1)
+                await self.clock.sleep(0.1)
                 print(f"🔍 BOT_HANDLER: Calling _handle_round_start")
                 await self._handle_round_start()
             # 🔧 FIX: Add validation feedback events
@@ -421,7 +427,7 @@ class GameBotHandler:
             import random
 
             delay = random.uniform(0.5, 1.5)
-            await asyncio.sleep(delay)
+            await self.clock.sleep(delay)
 
             try:
                 await self._bot_declare(player_obj, i)
@@ -432,7 +438,7 @@ class GameBotHandler:
                 raise
 
             # Small delay for UI processing
-            await asyncio.sleep(0.2)
+            await self.clock.sleep(0.2)
 
     async def _bot_declare(self, bot: Player, position: int):
         """Make a bot declaration"""
@@ -497,7 +503,7 @@ class GameBotHandler:
                 result = await self.state_machine.handle_action(action)
 
                 # Wait a moment for action to be fully processed
-                await asyncio.sleep(0.05)
+                await self.clock.sleep(0.05)
             else:
                 # Fallback to direct game call
                 result = self.game.declare(bot.name, value)
@@ -561,7 +567,7 @@ class GameBotHandler:
         
         if starter and getattr(starter, 'is_bot', False):
             print(f"🤖 Round starter is bot: {starter.name}")
-            await asyncio.sleep(1)
+            await self.clock.sleep(1)
             await self._handle_declaration_phase(
                 ""
             )  # Empty string to start from beginning
@@ -570,7 +576,7 @@ class GameBotHandler:
                 f"👤 Round starter is human or None: {starter.name if starter else 'None'}"
             )
             # Still need to handle bot declarations even if human starts
-            await asyncio.sleep(0.5)
+            await self.clock.sleep(0.5)
             await self._handle_declaration_phase("")  # Check for bot declarations
 
     async def _handle_turn_play_phase(self, last_player: str):
@@ -620,7 +626,7 @@ class GameBotHandler:
             import random
 
             delay = random.uniform(0.5, 1.5)
-            await asyncio.sleep(delay)
+            await self.clock.sleep(delay)
 
             try:
                 await self._bot_play(player_obj)
@@ -633,7 +639,7 @@ class GameBotHandler:
                 continue
 
             # Small delay for UI processing
-            await asyncio.sleep(0.2)
+            await self.clock.sleep(0.2)
 
     async def _bot_play(self, bot: Player):
         """Make a bot play"""
@@ -675,7 +681,10 @@ class GameBotHandler:
                     selected = selected[:required_piece_count]
                 else:
                     # Add more pieces if needed (should not happen with proper AI)
-                    remaining = [p for p in bot.hand if p not in selected]
+                    # Pieces are shared per kind, so subtract by count
+                    remaining = list(bot.hand)
+                    for p in selected:
+                        remaining.remove(p)
                     selected.extend(remaining[: required_piece_count - len(selected)])
 
             # Get indices and play type
@@ -760,7 +769,7 @@ class GameBotHandler:
             import random
 
             delay = random.uniform(0.5, 1.5)
-            await asyncio.sleep(delay)
+            await self.clock.sleep(delay)
 
             try:
                 await self._bot_redeal_decision(player)
@@ -777,7 +786,7 @@ class GameBotHandler:
                 continue
 
             # Small delay for UI processing
-            await asyncio.sleep(0.2)
+            await self.clock.sleep(0.2)
 
     async def _handle_turn_resolved(self, result: dict):
         """Handle end of turn"""
@@ -792,7 +801,7 @@ class GameBotHandler:
             await self._handle_round_complete()
         elif result["winner"]:
             # Start next turn with winner
-            await asyncio.sleep(0.5)
+            await self.clock.sleep(0.5)
             await self._handle_turn_start(result["winner"])
 
     async def _handle_round_complete(self):
@@ -935,7 +944,7 @@ class GameBotHandler:
                 print(
                     f"🎯 Waiting for other players to respond with {len(selected)} pieces"
                 )
-                await asyncio.sleep(0.5)
+                await self.clock.sleep(0.5)
                 await self._handle_play_phase(bot.name)
 
         except Exception as e:
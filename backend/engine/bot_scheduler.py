@@ -0,0 +1,159 @@
+# backend/engine/bot_scheduler.py
+"""
+Cross-room batching for bot AI decisions.
+
+Each GameBotHandler asks for one decision at a time. With many bot rooms
+on one worker those requests arrive close together, so instead of one
+executor round-trip per decision the scheduler collects every request
+made within a short window (across all rooms), drops exact duplicates,
+and evaluates the batch in one executor call (one per worker for the
+process backend). Each caller then gets its own result back and
+dispatches it to its room's state machine as before.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from backend.config.bot_config import get_bot_config
+from backend.engine.bot_executor import decision_batch_job, get_bot_executor
+
+logger = logging.getLogger(__name__)
+
+DecisionRequest = Tuple[str, tuple]  # (job_name, args) - see DECISION_JOBS
+
+
+class BotDecisionScheduler:
+    """
+    Collects bot decision requests and evaluates them in batches.
+
+    A batch is flushed when `window_ms` has passed since its first request
+    or when it reaches `max_batch_size`, whichever comes first.
+    """
+
+    def __init__(self, window_ms: float = 5.0, max_batch_size: int = 64):
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[DecisionRequest, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self.requests = 0
+        self.deduplicated = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    async def submit(self, job_name: str, args: tuple) -> Any:
+        """
+        Queue one decision and wait for its result.
+
+        Args:
+            job_name: DECISION_JOBS key ("declare" or "play")
+            args: Hashable, picklable job arguments
+
+        Returns:
+            The job's result
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # New event loop (e.g. after a restart): start from a clean slate
+            self._loop = loop
+            self._pending = {}
+            self._flush_handle = None
+
+        self.requests += 1
+        request = (job_name, args)
+        future = self._pending.get(request)
+        if future is None:
+            future = loop.create_future()
+            self._pending[request] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        else:
+            # Same decision already queued by another room
+            self.deduplicated += 1
+
+        # Shield so one cancelled waiter doesn't cancel a shared result
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Hand the current batch to a task and start a new one."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            self._loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: Dict[DecisionRequest, asyncio.Future]) -> None:
+        requests = list(batch)
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(requests))
+
+        # Split the batch so a process pool can spread it over its workers
+        executor = get_bot_executor()
+        chunk_count = min(getattr(executor, "workers", 1), len(requests))
+        chunk_size = -(-len(requests) // chunk_count)  # ceil division
+        chunks = [
+            requests[i : i + chunk_size] for i in range(0, len(requests), chunk_size)
+        ]
+
+        try:
+            chunk_results = await asyncio.gather(
+                *(executor.run(decision_batch_job, chunk) for chunk in chunks)
+            )
+            results = [result for chunk in chunk_results for result in chunk]
+        except Exception as e:
+            logger.error(f"Bot decision batch of {len(requests)} failed: {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for request, result in zip(requests, results):
+            future = batch[request]
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch_size": self.max_batch_size,
+            "requests": self.requests,
+            "deduplicated": self.deduplicated,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "avg_batch_size": (
+                (self.requests - self.deduplicated) / self.batches
+                if self.batches
+                else 0.0
+            ),
+            "pending": len(self._pending),
+        }
+
+
+_scheduler: Optional[BotDecisionScheduler] = None
+
+
+def get_decision_scheduler() -> Optional[BotDecisionScheduler]:
+    """
+    Get the process-wide decision scheduler, created from BotConfig.
+
+    Returns:
+        The shared scheduler, or None if batching is disabled
+    """
+    global _scheduler
+    config = get_bot_config()
+    if not config.batch_enabled:
+        return None
+    if _scheduler is None:
+        _scheduler = BotDecisionScheduler(
+            window_ms=config.batch_window_ms,
+            max_batch_size=config.batch_max_size,
+        )
+    return _scheduler
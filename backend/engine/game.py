@@ -131,9 +131,7 @@ class Game:
         Create new cards for redeal
         TODO: Implement proper redeal logic based on game rules
         """
-        deck = Piece.build_deck()
-        random.shuffle(deck)
-        return deck[:8]  # Take the first 8 cards
+        return random.sample(Piece.build_deck(), 8)  # Take 8 random cards
 
     def get_game_phase_info(self) -> dict:
         """Information for controllers to decide next phase"""
@@ -0,0 +1,106 @@
+# backend/engine/game_clock.py
+"""
+Game clock for presentation delays.
+
+Game flow pauses so players can watch animations and read results
+(turn flips, scores, dealing) and bots wait a moment before acting.
+Every such pause goes through a GameClock so a room can run:
+- "realtime": delays as written (normal play)
+- "scaled":   delays multiplied by `scale` (e.g. 0.01 for load tests)
+- "instant":  no delays at all (headless bot games, replay validation)
+
+The clock also provides `time()`, which advances consistently with the
+mode, so timeouts measured in game time scale along with the delays.
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+CLOCK_MODES = ("realtime", "scaled", "instant")
+
+
+class GameClock:
+    """Per-room pacing service used by the state machine and bot handler."""
+
+    def __init__(self, mode: str = "realtime", scale: float = 1.0):
+        self._anchor_real = time.time()
+        self._anchor_game = self._anchor_real
+        self._skipped = 0.0  # Game seconds skipped by instant sleeps
+        self.mode = "realtime"
+        self.scale = 1.0
+        self.set_mode(mode, scale)
+
+    @classmethod
+    def from_env(cls) -> "GameClock":
+        """Create a clock from GAME_CLOCK_MODE / GAME_CLOCK_SCALE."""
+        return cls(
+            mode=os.getenv("GAME_CLOCK_MODE", "realtime").lower(),
+            scale=float(os.getenv("GAME_CLOCK_SCALE", "1.0")),
+        )
+
+    def set_mode(self, mode: str, scale: Optional[float] = None) -> None:
+        """
+        Switch pacing mode; safe to call while a game is running.
+
+        Args:
+            mode: One of CLOCK_MODES
+            scale: Delay multiplier for "scaled" mode (keeps current if None)
+        """
+        if mode not in CLOCK_MODES:
+            raise ValueError(f"Unknown clock mode: {mode}")
+        if scale is None:
+            scale = self.scale
+        if mode == "scaled" and scale <= 0:
+            raise ValueError("Scaled clock needs a positive scale")
+
+        # Re-anchor so game time stays continuous across the switch
+        now = time.time()
+        self._anchor_game = self.time()
+        self._anchor_real = now
+        self._skipped = 0.0
+        self.mode = mode
+        self.scale = scale
+
+    def scale_delay(self, seconds: float) -> float:
+        """Convert a delay in game seconds to real seconds."""
+        if self.mode == "instant":
+            return 0.0
+        if self.mode == "scaled":
+            return seconds * self.scale
+        return seconds
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        Wait `seconds` of game time.
+
+        Always yields to the event loop, even in instant mode, so tasks
+        keep running in the same order as with real delays.
+        """
+        delay = self.scale_delay(seconds)
+        if self.mode == "instant":
+            self._skipped += seconds
+        await asyncio.sleep(delay)
+
+    def time(self) -> float:
+        """Current game time in seconds (comparable to time.time() values)."""
+        real_elapsed = time.time() - self._anchor_real
+        if self.mode == "scaled":
+            return self._anchor_game + real_elapsed / self.scale
+        return self._anchor_game + real_elapsed + self._skipped
+
+    def to_dict(self) -> dict:
+        """Convert clock settings to dictionary for API responses."""
+        return {"mode": self.mode, "scale": self.scale}
+
+
+_default_clock: Optional[GameClock] = None
+
+
+def get_default_clock() -> GameClock:
+    """Get the shared clock used when a room has no clock of its own."""
+    global _default_clock
+    if _default_clock is None:
+        _default_clock = GameClock.from_env()
+    return _default_clock
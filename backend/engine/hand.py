@@ -0,0 +1,275 @@
+# backend/engine/hand.py
+# -------------------------------------------------
+# Packed hand encoding
+# -------------------------------------------------
+# A multiset of pieces is packed into one integer with a 4-bit count
+# field per piece kind (14 kinds → 56 bits). The same encoding is used
+# as the play-table key in rules.py, so a hand's sub-multisets can be
+# looked up directly without building Piece lists.
+# -------------------------------------------------
+
+from backend.engine.constants import PIECE_POINTS
+
+KIND_ORDER = tuple(PIECE_POINTS)  # Field order of the packed encoding
+FIELD_BITS = 4
+FIELD_MASK = (1 << FIELD_BITS) - 1
+KIND_UNIT = {kind: 1 << (FIELD_BITS * i) for i, kind in enumerate(KIND_ORDER)}
+
+
+def pack_pieces(pieces):
+    """
+    Pack a list of pieces into per-kind counts.
+
+    Args:
+        pieces: Iterable of Piece objects
+
+    Returns:
+        int: Packed per-kind counts
+
+    Raises:
+        KeyError: If a piece kind is not in PIECE_POINTS
+    """
+    packed = 0
+    for p in pieces:
+        packed += KIND_UNIT[p.kind]
+    return packed
+
+
+def packed_count(packed, kind):
+    """Return how many pieces of `kind` are in a packed multiset."""
+    return (packed >> (FIELD_BITS * KIND_ORDER.index(kind))) & FIELD_MASK
+
+
+def packed_size(packed):
+    """Return the total number of pieces in a packed multiset."""
+    size = 0
+    while packed:
+        size += packed & FIELD_MASK
+        packed >>= FIELD_BITS
+    return size
+
+
+def packed_points(packed):
+    """Return the total point value of a packed multiset."""
+    total = 0
+    for kind in KIND_ORDER:
+        total += (packed & FIELD_MASK) * PIECE_POINTS[kind]
+        packed >>= FIELD_BITS
+    return total
+
+
+def kinds_mask(kinds):
+    """
+    Build a mask selecting the count fields of the given kinds.
+
+    `packed & kinds_mask(kinds)` keeps only those kinds' counts.
+    """
+    mask = 0
+    for kind in kinds:
+        mask |= FIELD_MASK * KIND_UNIT[kind]
+    return mask
+
+
+def packed_contains(packed, sub):
+    """
+    Check whether multiset `sub` is contained in multiset `packed`.
+
+    Args:
+        packed: Packed counts of the containing multiset (e.g. a hand)
+        sub: Packed counts of the candidate subset (e.g. a play)
+
+    Returns:
+        bool: True if every kind count in `sub` is <= the count in `packed`
+    """
+    while sub:
+        if (sub & FIELD_MASK) > (packed & FIELD_MASK):
+            return False
+        sub >>= FIELD_BITS
+        packed >>= FIELD_BITS
+    return True
+
+
+def unpack_kinds(packed):
+    """
+    Expand a packed multiset into a list of kind strings.
+
+    Returns:
+        list: Kind strings in KIND_ORDER (strongest first)
+    """
+    kinds = []
+    for kind in KIND_ORDER:
+        count = packed & FIELD_MASK
+        if count:
+            kinds.extend([kind] * count)
+        packed >>= FIELD_BITS
+    return kinds
+
+
+def iter_sub_multisets(packed, min_size=1, max_size=6):
+    """
+    Enumerate the distinct sub-multisets of a packed multiset.
+
+    Unlike itertools.combinations over a list, repeated pieces (e.g. three
+    SOLDIER_RED) produce each distinct count only once.
+
+    Args:
+        packed: Packed counts to enumerate
+        min_size: Smallest sub-multiset size to yield
+        max_size: Largest sub-multiset size to yield
+
+    Yields:
+        int: Packed counts of each sub-multiset with min_size <= size <= max_size
+    """
+    fields = []
+    for i in range(len(KIND_ORDER)):
+        count = (packed >> (FIELD_BITS * i)) & FIELD_MASK
+        if count:
+            fields.append((1 << (FIELD_BITS * i), count))
+
+    def walk(index, key, size):
+        if index == len(fields):
+            if size >= min_size:
+                yield key
+            return
+        unit, count = fields[index]
+        for taken in range(min(count, max_size - size) + 1):
+            yield from walk(index + 1, key + unit * taken, size + taken)
+
+    yield from walk(0, 0, 0)
+
+
+class Hand(list):
+    """
+    A player's hand of Piece objects with a packed per-kind count.
+
+    Behaves like the plain list the engine has always used (indexing,
+    pop by index, shuffle, len), while keeping `packed` in sync so that
+    membership checks and multiset containment are O(1) in hand size.
+    Pieces of the same kind are interchangeable: `piece in hand` and
+    `hand.remove(piece)` match by kind, not by object identity.
+    """
+
+    __slots__ = ("packed",)
+
+    def __init__(self, pieces=()):
+        super().__init__(pieces)
+        self.packed = pack_pieces(self)
+
+    # ------------------------------------------------------------------
+    # List mutators (kept in sync with the packed counts)
+    # ------------------------------------------------------------------
+    def append(self, piece):
+        self.packed += KIND_UNIT[piece.kind]
+        super().append(piece)
+
+    def extend(self, pieces):
+        pieces = list(pieces)
+        self.packed += pack_pieces(pieces)
+        super().extend(pieces)
+
+    def __iadd__(self, pieces):
+        self.extend(pieces)
+        return self
+
+    def insert(self, index, piece):
+        self.packed += KIND_UNIT[piece.kind]
+        super().insert(index, piece)
+
+    def pop(self, index=-1):
+        piece = super().pop(index)
+        self.packed -= KIND_UNIT[piece.kind]
+        return piece
+
+    def remove(self, piece):
+        """
+        Remove `piece`, or another piece of the same kind if that exact
+        object is not in the hand.
+
+        Raises:
+            ValueError: If no piece of that kind is in the hand
+        """
+        try:
+            super().remove(piece)
+        except ValueError:
+            for i, held in enumerate(self):
+                if held.kind == piece.kind:
+                    super().__delitem__(i)
+                    break
+            else:
+                raise
+        self.packed -= KIND_UNIT[piece.kind]
+
+    def clear(self):
+        super().clear()
+        self.packed = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            # Slice assignment can change the length, so recount
+            super().__setitem__(index, value)
+            self.packed = pack_pieces(self)
+            return
+        replaced = self[index]
+        super().__setitem__(index, value)
+        self.packed += KIND_UNIT[value.kind] - KIND_UNIT[replaced.kind]
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.packed = pack_pieces(self)
+
+    def copy(self):
+        return Hand(self)
+
+    def __reduce__(self):
+        # Rebuild from the pieces so pickle/deepcopy restore `packed` too
+        return (Hand, (list(self),))
+
+    # ------------------------------------------------------------------
+    # Packed queries
+    # ------------------------------------------------------------------
+    def __contains__(self, piece):
+        unit = KIND_UNIT.get(getattr(piece, "kind", None))
+        if unit is None:
+            return super().__contains__(piece)
+        return (self.packed // unit) & FIELD_MASK > 0
+
+    def count_kind(self, kind):
+        """Return how many pieces of `kind` are in the hand."""
+        return packed_count(self.packed, kind)
+
+    def contains_all(self, pieces):
+        """
+        Check that the hand holds every piece of `pieces`, counting
+        duplicates (two SOLDIER_REDs require two in hand).
+        """
+        try:
+            return packed_contains(self.packed, pack_pieces(pieces))
+        except (AttributeError, KeyError):
+            return False
+
+    def discard_pieces(self, pieces):
+        """
+        Remove each of `pieces` that is in the hand, ignoring the rest.
+
+        Returns:
+            int: Number of pieces removed
+        """
+        removed = 0
+        for piece in pieces:
+            if piece in self:
+                self.remove(piece)
+                removed += 1
+        return removed
+
+    def sub_multisets(self, min_size=1, max_size=6):
+        """Enumerate the distinct sub-multisets of the hand (packed)."""
+        return iter_sub_multisets(self.packed, min_size, max_size)
+
+    def to_dicts(self):
+        """
+        Convert the hand to JSON-serializable dictionaries.
+
+        Returns:
+            list: One Piece.to_dict() entry per piece, in hand order
+        """
+        return [piece.to_dict() for piece in self]
@@ -2,39 +2,51 @@
 
 from backend.engine.constants import PIECE_POINTS
 
+# How many copies of each piece type are in the deck
+# (all types not listed default to 2)
+DECK_COUNTS = {
+    "GENERAL": 1,  # Only one of each GENERAL (RED and BLACK)
+    "SOLDIER": 5,  # Five of each SOLDIER (RED and BLACK)
+}
+
 
 class Piece:
-    def __init__(self, kind):
+    """
+    A game piece, e.g. GENERAL_RED(14).
+
+    Pieces are immutable flyweights: there is exactly one instance per
+    kind, so `Piece("SOLDIER_RED") is Piece("SOLDIER_RED")`. Dealing a
+    deck therefore only copies references instead of allocating new
+    objects, and name/color/point are plain attributes computed once.
+    """
+
+    __slots__ = ("kind", "name", "color", "point")
+
+    _pool = {}  # kind -> the shared Piece instance
+
+    def __new__(cls, kind):
         """
-        Create a piece from a given kind string, e.g. "GENERAL_RED", "CANNON_BLACK"
+        Return the piece for a given kind string, e.g. "GENERAL_RED", "CANNON_BLACK"
         Assigns point value using PIECE_POINTS from constants.py
         """
-        self.kind = kind  # Combined string identifier, e.g., "GENERAL_RED"
-        self.point = PIECE_POINTS[kind]  # Point value for scoring and comparison
+        piece = cls._pool.get(kind)
+        if piece is None:
+            parts = kind.split("_")
+            piece = super().__new__(cls)
+            piece.kind = kind  # Combined string identifier, e.g., "GENERAL_RED"
+            piece.name = parts[0]  # Piece type, e.g., "GENERAL", "SOLDIER", "HORSE"
+            piece.color = parts[1]  # "RED" or "BLACK"
+            piece.point = PIECE_POINTS[kind]  # Point value for scoring and comparison
+            cls._pool[kind] = piece
+        return piece
 
     def __repr__(self):
         # Display format, e.g., GENERAL_RED(14)
         return f"{self.kind}({self.point})"
 
-    @property
-    def name(self):
-        """
-        Get the piece type name.
-
-        Returns:
-            str: The piece type (e.g., "GENERAL", "SOLDIER", "HORSE")
-        """
-        return self.kind.split("_")[0]
-
-    @property
-    def color(self):
-        """
-        Get the piece color.
-
-        Returns:
-            str: The piece color ("RED" or "BLACK")
-        """
-        return self.kind.split("_")[1]
+    def __reduce__(self):
+        # Unpickling/deepcopy goes back through the pool
+        return (Piece, (self.kind,))
 
     def to_dict(self):
         """
@@ -56,22 +68,23 @@ class Piece:
         Create the full deck of 32 pieces.
 
         Rules:
-        - Some piece types (e.g., SOLDIER) appear more often.
+        - Some piece types (e.g., SOLDIER) appear more often (see DECK_COUNTS).
         - Use PIECE_POINTS to determine available kinds (e.g., GENERAL_RED, HORSE_BLACK, etc.)
-        - Default count per kind = 2, unless overridden below.
+        - Default count per kind = 2.
+
+        Returns a new list each call, but the pieces in it are the shared
+        per-kind instances, so callers are free to shuffle or slice it.
         """
+        return list(_DECK)
+
+
+def _build_full_deck():
+    deck = []
+    for kind in PIECE_POINTS:
+        name = kind.split("_")[0]
+        count = DECK_COUNTS.get(name, 2)  # Use default = 2 if not in DECK_COUNTS
+        deck.extend([Piece(kind)] * count)
+    return tuple(deck)
 
-        # How many copies of each piece type to include in the deck
-        counts = {
-            "GENERAL": 1,  # Only one of each GENERAL (RED and BLACK)
-            "SOLDIER": 5,  # Five of each SOLDIER (RED and BLACK)
-            # All others default to 2
-        }
 
-        deck = []
-        for kind in PIECE_POINTS:
-            name = kind.split("_")[0]
-            count = counts.get(name, 2)  # Use default = 2 if not in `counts`
-            for _ in range(count):
-                deck.append(Piece(kind))
-        return deck
+_DECK = _build_full_deck()
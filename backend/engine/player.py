@@ -2,13 +2,15 @@
 
 import random
 
+from backend.engine.hand import Hand
+
 
 class Player:
     def __init__(self, name, is_bot=False, available_colors=None):
         self.name = name  # Player's name (e.g., "P1", "P2", etc.)
         self.hand = (
             []
-        )  # List of current pieces in hand (max 8 at the start of each round)
+        )  # Current pieces in hand as a Hand (max 8 at the start of each round)
         self.score = 0  # Total score accumulated throughout the game
         self.declared = 0  # Number of piles the player declared for this round
         self.captured_piles = (
@@ -31,6 +33,18 @@ class Player:
         self.disconnect_time = None  # When player disconnected
         self.original_is_bot = is_bot  # Store original bot state for reconnection
 
+    @property
+    def hand(self):
+        """
+        The player's pieces as a Hand (a list with packed per-kind counts).
+        """
+        return self._hand
+
+    @hand.setter
+    def hand(self, pieces):
+        # Accept plain lists from dealing code and wrap them once
+        self._hand = pieces if isinstance(pieces, Hand) else Hand(pieces)
+
     def _assign_avatar_color(self, available_colors=None):
         """Assign a random avatar color to human players"""
         if self.is_bot:
@@ -12,6 +12,7 @@ from backend.engine.game import Game  # Import the Game class, representing the
 from backend.engine.player import (  # Import the Player class, representing a player in the game.
     Player,
 )
+from backend.engine.game_clock import GameClock
 from backend.engine.state_machine.core import GamePhase
 from backend.engine.state_machine.game_state_machine import GameStateMachine
 
@@ -48,6 +49,9 @@ class Room:
         self.game_state_machine: Optional[GameStateMachine] = (
             None  # State machine for game logic
         )
+        self.clock: Optional[GameClock] = (
+            None  # Presentation pacing; None = GAME_CLOCK_MODE from env
+        )
 
         self._assign_lock = asyncio.Lock()  # Prevent concurrent slot assignments
         self._join_lock = asyncio.Lock()  # Prevent concurrent room joins
@@ -218,7 +222,7 @@ class Room:
 
                 # Initialize GameStateMachine with WebSocket broadcasting
                 self.game_state_machine = GameStateMachine(
-                    self.game, broadcast_callback
+                    self.game, broadcast_callback, clock=self.clock
                 )
                 self.game_state_machine.room_id = (
                     self.room_id
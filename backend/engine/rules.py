@@ -13,6 +13,11 @@
 # DOUBLE_STRAIGHT     → 2 CHARIOTs, 2 HORSEs, 2 CANNONs (same color)
 
 from collections import Counter
+from itertools import combinations_with_replacement
+
+from backend.engine.constants import PIECE_POINTS
+from backend.engine.hand import pack_pieces
+from backend.engine.piece import Piece
 
 # -------------------------------------------------
 # Priority order of play types (used for comparison)
@@ -31,6 +36,30 @@ PLAY_TYPE_PRIORITY = [
 ]
 
 
+# -------------------------------------------------
+# Canonical multiset key for a play
+# -------------------------------------------------
+# A play's key is its packed per-kind counts (see hand.py), so a play of
+# up to 6 pieces maps to a single integer regardless of piece order.
+MAX_PLAY_SIZE = 6
+
+
+def play_key(pieces):
+    """
+    Compute the canonical multiset key of a play.
+
+    Args:
+        pieces: List of Piece objects (at most MAX_PLAY_SIZE)
+
+    Returns:
+        int: Packed per-kind counts; equal for any ordering of the same pieces
+
+    Raises:
+        KeyError: If a piece kind is not in PIECE_POINTS
+    """
+    return pack_pieces(pieces)
+
+
 # -------------------------------------------------
 # Determine the type of a given play
 # -------------------------------------------------
@@ -38,8 +67,8 @@ def get_play_type(pieces):
     """
     Determine the type of play from a list of pieces.
 
-    Analyzes the combination of pieces to identify valid play types
-    according to game rules.
+    Looks the play up in the precomputed play table, so the cost does
+    not depend on which play type is being checked.
 
     Args:
         pieces: List of Piece objects to analyze
@@ -49,6 +78,16 @@ def get_play_type(pieces):
              'FOUR_OF_A_KIND', 'EXTENDED_STRAIGHT', 'FIVE_OF_A_KIND',
              'EXTENDED_STRAIGHT_5', 'DOUBLE_STRAIGHT', or 'INVALID'
     """
+    return _lookup_play(pieces)[0]
+
+
+def _classify_play(pieces):
+    """
+    Classify a play by running the rule predicates directly.
+
+    Used to build the play table and as a fallback for pieces whose
+    kind is not part of the standard deck.
+    """
     if len(pieces) == 1:
         return "SINGLE"
     if len(pieces) == 2 and is_pair(pieces):
@@ -284,32 +323,12 @@ def compare_plays(p1, p2):
         int: 1 if p1 wins, 2 if p2 wins, 0 if tie, -1 if invalid comparison
     """
 
-    type1 = get_play_type(p1)
-    type2 = get_play_type(p2)
+    type1, sum1 = _lookup_play(p1)
+    type2, sum2 = _lookup_play(p2)
 
     if type1 != type2:
         return -1  # Cannot compare different play types
 
-    if type1 in ["EXTENDED_STRAIGHT", "EXTENDED_STRAIGHT_5"]:
-        # Compare based only on top 3 highest-value unique piece types
-        def core_sum(pieces):
-            names_seen = set()
-            total = 0
-            for p in sorted(pieces, key=lambda x: -x.point):
-                if p.name not in names_seen:
-                    names_seen.add(p.name)
-                    total += p.point
-                if len(names_seen) == 3:
-                    break
-            return total
-
-        sum1 = core_sum(p1)
-        sum2 = core_sum(p2)
-    else:
-        # Other types: compare total point values
-        sum1 = sum(p.point for p in p1)
-        sum2 = sum(p.point for p in p2)
-
     if sum1 > sum2:
         return 1
     elif sum2 > sum1:
@@ -318,6 +337,110 @@ def compare_plays(p1, p2):
         return 0
 
 
+def _play_strength(play_type, pieces):
+    """
+    Compute the comparison strength of a play of the given type.
+
+    For EXTENDED_STRAIGHT and EXTENDED_STRAIGHT_5 only the top 3
+    highest-value unique piece types count; every other type (including
+    INVALID) uses the total point value.
+    """
+    if play_type in ["EXTENDED_STRAIGHT", "EXTENDED_STRAIGHT_5"]:
+        names_seen = set()
+        total = 0
+        for p in sorted(pieces, key=lambda x: -x.point):
+            if p.name not in names_seen:
+                names_seen.add(p.name)
+                total += p.point
+            if len(names_seen) == 3:
+                break
+        return total
+    return sum(p.point for p in pieces)
+
+
+# -------------------------------------------------
+# Precomputed play table
+# -------------------------------------------------
+def _build_play_table():
+    """
+    Classify every valid play ahead of time.
+
+    Every play of two or more pieces must be a single color, so it is
+    enough to enumerate the multisets of each color's 7 kinds (plus
+    singles). Keys missing from the table are INVALID plays.
+
+    Returns:
+        dict: play_key -> (play_type, strength) for every valid play
+    """
+    table = {}
+    for color in ("RED", "BLACK"):
+        kinds = [kind for kind in PIECE_POINTS if kind.endswith("_" + color)]
+        for size in range(1, MAX_PLAY_SIZE + 1):
+            for combo in combinations_with_replacement(kinds, size):
+                pieces = [Piece(kind) for kind in combo]
+                play_type = _classify_play(pieces)
+                if play_type != "INVALID":
+                    table[play_key(pieces)] = (
+                        play_type,
+                        _play_strength(play_type, pieces),
+                    )
+    return table
+
+
+_PLAY_TABLE = _build_play_table()
+
+
+def ensure_play_table():
+    """
+    Make sure the precomputed play table is built.
+
+    The table is built when this module is imported; calling this from a
+    worker process initializer moves that cost out of the first decision.
+
+    Returns:
+        int: Number of valid plays in the table
+    """
+    return len(_PLAY_TABLE)
+
+
+def _lookup_play(pieces):
+    """
+    Look up the (play_type, strength) pair of a play.
+
+    Args:
+        pieces: List of Piece objects
+
+    Returns:
+        tuple: (play_type, strength) where strength is the value used by
+        compare_plays for plays of that type
+    """
+    if not 1 <= len(pieces) <= MAX_PLAY_SIZE:
+        return "INVALID", sum(p.point for p in pieces)
+    try:
+        entry = _PLAY_TABLE.get(play_key(pieces))
+    except KeyError:
+        # Non-standard piece kind: classify it the slow way
+        play_type = _classify_play(pieces)
+        return play_type, _play_strength(play_type, pieces)
+    if entry is None:
+        return "INVALID", sum(p.point for p in pieces)
+    return entry
+
+
+def get_play_type_for_key(key):
+    """
+    Look up the play type of a packed play key (see play_key).
+
+    Lets callers that already hold packed counts, such as the AI's
+    sub-multiset search, classify plays without building Piece lists.
+
+    Returns:
+        str: The play type, or 'INVALID'
+    """
+    entry = _PLAY_TABLE.get(key)
+    return entry[0] if entry else "INVALID"
+
+
 # -------------------------------------------------
 # Determine valid declaration options for a player
 # -------------------------------------------------
@@ -4,8 +4,10 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 
+from ..piece import Piece
 from .core import ActionType, GameAction, GamePhase
 
 
@@ -21,6 +23,14 @@ class GameState(ABC):
         self._sequence_number = 0
         self._change_history = []
 
+        # Coalesced updates (see batch_updates)
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_depth = 0
+        self._batched_old_data: Optional[Dict[str, Any]] = None
+        self._batched_updates: Dict[str, Any] = {}
+        self._batched_reasons: List[str] = []
+        self._batched_broadcast = False
+
     @property
     @abstractmethod
     def phase_name(self) -> GamePhase:
@@ -39,6 +49,7 @@ class GameState(ABC):
 
     async def on_exit(self) -> None:
         self.logger.info(f"Exiting {self.phase_name.value} phase")
+        await self.flush_updates()
         await self._cleanup_phase()
         self.phase_data.clear()
 
@@ -50,6 +61,12 @@ class GameState(ABC):
     async def _cleanup_phase(self) -> None:
         pass
 
+    def request_transition_check(self) -> None:
+        """Ask the state machine to re-evaluate check_transition_conditions()"""
+        request = getattr(self.state_machine, "request_transition_check", None)
+        if request:
+            request()
+
     # Action handling
     async def handle_action(self, action: GameAction) -> Optional[Dict[str, Any]]:
         if action.action_type not in self.allowed_actions:
@@ -100,12 +117,85 @@ class GameState(ABC):
             updates: Dictionary of phase data updates
             reason: Human-readable reason for the change (for debugging)
             broadcast: Whether to automatically broadcast (default True)
+
+        Inside batch_updates() the changes are applied to phase_data at once,
+        but recorded, stored and broadcast together when the batch ends.
         """
+        if self._batch_depth and self._batch_task is asyncio.current_task():
+            if self._batched_old_data is None:
+                self._batched_old_data = self.phase_data.copy()
+            self.phase_data.update(updates)
+            self._batched_updates.update(updates)
+            if reason:
+                self._batched_reasons.append(reason)
+            self._batched_broadcast = self._batched_broadcast or broadcast
+            return
+
+        # Another task's batch goes out first, so events stay in apply order
+        await self.flush_updates()
+
         old_data = self.phase_data.copy()
 
         # Apply updates
         self.phase_data.update(updates)
 
+        await self._commit_phase_data_update(
+            old_data, updates.copy(), reason, broadcast
+        )
+
+    @asynccontextmanager
+    async def batch_updates(self) -> AsyncIterator[None]:
+        """
+        Merge update_phase_data() calls into one stored event and broadcast
+
+        Usage:
+            async with state.batch_updates():
+                await state.update_phase_data({...}, "first change")
+                await state.update_phase_data({...}, "second change")
+
+        Batches nest; the outermost one sends the merged update when it ends
+        (broadcast if any of the calls asked for it). Only updates made by
+        the task that opened the batch are held back. Don't keep a batch open
+        across a deliberate pause (clock.sleep): clients see nothing until
+        it ends.
+        """
+        task = asyncio.current_task()
+        if self._batch_depth and self._batch_task is not task:
+            # Another task owns the open batch - run this block unbatched
+            yield
+            return
+
+        self._batch_task = task
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._batch_task = None
+                await self.flush_updates()
+
+    async def flush_updates(self) -> None:
+        """Record, store and broadcast the updates batched so far (if any)"""
+        if self._batched_old_data is None:
+            return
+        old_data, updates = self._batched_old_data, self._batched_updates
+        reason = "; ".join(self._batched_reasons)
+        broadcast = self._batched_broadcast
+        self._batched_old_data = None
+        self._batched_updates = {}
+        self._batched_reasons = []
+        self._batched_broadcast = False
+        await self._commit_phase_data_update(old_data, updates, reason, broadcast)
+
+    async def _commit_phase_data_update(
+        self,
+        old_data: Dict[str, Any],
+        updates: Dict[str, Any],
+        reason: str,
+        broadcast: bool,
+    ) -> None:
+        """Record an applied update, store it and broadcast the new phase data"""
         # Track change for debugging/event sourcing
         self._sequence_number += 1
         change_record = {
@@ -114,7 +204,7 @@ class GameState(ABC):
             "reason": reason or f"Phase data updated: {list(updates.keys())}",
             "old_data": old_data,
             "new_data": self.phase_data.copy(),
-            "updates": updates.copy(),
+            "updates": updates,
         }
         self._change_history.append(change_record)
 
@@ -133,6 +223,9 @@ class GameState(ABC):
         if broadcast and self._auto_broadcast_enabled:
             await self._auto_broadcast_phase_change(reason)
 
+        # Phase data changed - transition conditions may now be met
+        self.request_transition_check()
+
     async def _auto_broadcast_phase_change(self, reason: str) -> None:
         """
         🚀 ENTERPRISE: Automatic phase change broadcasting
@@ -145,7 +238,7 @@ class GameState(ABC):
         try:
             # Import here to avoid circular imports
             try:
-                from backend.socket_manager import broadcast
+                from backend.socket_manager import broadcast_state
             except ImportError:
                 # Handle different import paths
                 import os
@@ -154,7 +247,7 @@ class GameState(ABC):
                 sys.path.append(
                     os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
                 )
-                from socket_manager import broadcast
+                from socket_manager import broadcast_state
 
             room_id = getattr(self.state_machine, "room_id", None)
             if not room_id:
@@ -163,8 +256,11 @@ class GameState(ABC):
                 )
                 return
 
-            # Get player data if available (JSON-safe)
+            # Get player data if available (JSON-safe). Hands are private:
+            # each player is sent only their own (see broadcast_state)
             players_data = {}
+            shared_players = {}
+            private_hands = {}
             if hasattr(self.state_machine, "game") and self.state_machine.game:
                 game = self.state_machine.game
                 if hasattr(game, "players") and game.players:
@@ -205,6 +301,13 @@ class GameState(ABC):
                             f"   Final player data: {players_data[player_name]}"
                         )
 
+                        shared_players[player_name] = {
+                            key: value
+                            for key, value in players_data[player_name].items()
+                            if key != "hand"
+                        }
+                        private_hands[player_name] = {"hand": hand_strings}
+
             # Convert phase_data to JSON-safe format with recursive handling
             json_safe_phase_data = self._make_json_safe(self.phase_data)
 
@@ -218,7 +321,7 @@ class GameState(ABC):
                 "phase": self.phase_name.value,
                 "allowed_actions": [action.value for action in self.allowed_actions],
                 "phase_data": json_safe_phase_data,
-                "players": players_data,
+                "players": shared_players,
                 "round": current_round,  # 🔢 ROUND_FIX: Add round number to broadcast data
                 "reason": reason,
                 "sequence": self._sequence_number,
@@ -229,12 +332,16 @@ class GameState(ABC):
             self.logger.debug("📡 Broadcasting phase_change with data:")
             self.logger.debug(f"   Phase: {broadcast_data['phase']}")
             self.logger.debug(f"   Players data: {broadcast_data['players']}")
-            for player_name, player_info in broadcast_data["players"].items():
+            for player_name, player_info in players_data.items():
                 self.logger.debug(
                     f"   {player_name} hand: {player_info.get('hand', [])} (length: {player_info.get('hand_size', 0)})"
                 )
 
-            await broadcast(room_id, "phase_change", broadcast_data)
+            # Sent as a delta against the room's previous phase_change, with
+            # each player's hand added for that player's sockets only
+            await broadcast_state(
+                room_id, "phase_change", broadcast_data, private=private_hands
+            )
 
             self.logger.info(
                 f"📤 Auto-broadcast: phase_change to room {room_id} - {reason}"
@@ -290,10 +397,11 @@ class GameState(ABC):
         elif isinstance(data, datetime):
             # Convert datetime objects to timestamps
             return data.timestamp()
-        elif hasattr(data, "__dict__") and not isinstance(
-            data, (str, int, float, bool, type(None))
+        elif isinstance(data, Piece) or (
+            hasattr(data, "__dict__")
+            and not isinstance(data, (str, int, float, bool, type(None)))
         ):
-            # Convert objects with attributes (like Piece objects) to string
+            # Convert Piece objects (slotted) and other objects with attributes to string
             return str(data)
         else:
             # Already JSON-safe (str, int, float, bool, None)
@@ -312,6 +420,9 @@ class GameState(ABC):
 
         Use this instead of manual broadcast calls to maintain enterprise architecture.
         """
+        # Clients must see batched phase data before the event that follows it
+        await self.flush_updates()
+
         try:
             try:
                 from backend.socket_manager import broadcast
@@ -15,6 +15,8 @@ from .states.turn_results_state import TurnResultsState
 from .states.waiting_state import WaitingState
 from .async_game_adapter import AsyncGameAdapter, wrap_game_for_async
 from ..bot_manager import BotManager
+from ..game_clock import GameClock
+from ..piece import Piece
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +25,16 @@ class GameStateMachine:
     """
     Central coordinator for game state management.
     Manages phase transitions and delegates action handling to appropriate states.
+
+    The processing loop is event-driven: it sleeps until an action is queued
+    or a state calls request_transition_check(). Polling every
+    FALLBACK_POLL_INTERVAL seconds remains only as a safety net for
+    conditions that change without signalling.
     """
 
-    def __init__(self, game, broadcast_callback=None):
+    FALLBACK_POLL_INTERVAL = 5.0
+
+    def __init__(self, game, broadcast_callback=None, clock: Optional[GameClock] = None):
         # Wrap game with AsyncGameAdapter for unified async interface
         from backend.engine.async_game import AsyncGame
         from backend.engine.game import Game
@@ -48,7 +57,11 @@ class GameStateMachine:
         self.current_phase: Optional[GamePhase] = None
         self.is_running = False
         self._process_task: Optional[asyncio.Task] = None
+        # Set when there is work for the process loop (action or transition check)
+        self._wakeup = asyncio.Event()
         self.broadcast_callback = broadcast_callback  # For WebSocket broadcasting
+        # Paces all presentation delays in this room (realtime/scaled/instant)
+        self.clock: GameClock = clock or GameClock.from_env()
 
         # Initialize all available states
         self.states: Dict[GamePhase, GameState] = {
@@ -122,6 +135,7 @@ class GameStateMachine:
         """
         logger.info("🛑 Stopping state machine")
         self.is_running = False
+        self._wakeup.set()
 
         # Cancel processing task
         if self._process_task:
@@ -152,31 +166,56 @@ class GameStateMachine:
             return {"success": False, "error": "State machine not running"}
 
         await self.action_queue.add_action(action)
+        self._wakeup.set()
         return {"success": True, "queued": True}
 
+    def request_transition_check(self) -> None:
+        """
+        Wake the processing loop to re-check transition conditions.
+
+        States call this whenever something that check_transition_conditions()
+        depends on changes outside of action handling (timers, delays).
+        Safe to call from any coroutine or callback on the event loop.
+        """
+        self._wakeup.set()
+
+    async def _wait_for_work(self) -> None:
+        """Block until woken or until the fallback poll interval elapses."""
+        if self.action_queue and self.action_queue.has_pending_actions():
+            return
+        try:
+            await asyncio.wait_for(
+                self._wakeup.wait(), timeout=self.FALLBACK_POLL_INTERVAL
+            )
+        except asyncio.TimeoutError:
+            pass
+
     async def _process_loop(self):
         """
-        Main processing loop for queued actions and polling-based transitions.
+        Main processing loop for queued actions and phase transitions.
 
-        Continuously processes pending actions and checks for phase transitions
-        while the state machine is running. Uses 0.5s polling interval.
+        Waits for a queued action or a transition request, then processes
+        pending actions and checks for phase transitions. Falls back to
+        polling every FALLBACK_POLL_INTERVAL seconds if nothing signals.
         """
         logger.info("State machine process loop started")
         while self.is_running:
             try:
+                await self._wait_for_work()
+                if not self.is_running:
+                    break
+                # Clear before processing so signals raised meanwhile aren't lost
+                self._wakeup.clear()
 
                 # Process any pending actions
                 await self.process_pending_actions()
 
-                # Check for phase transitions (polling-based approach)
+                # Check for phase transitions
                 if self.current_state:
                     next_phase = await self.current_state.check_transition_conditions()
                     if next_phase:
                         await self._transition_to(next_phase)
 
-                # Improved delay: 0.5s instead of original 100ms for better performance
-                await asyncio.sleep(0.5)
-
             except Exception as e:
                 print(f"❌ STATE_MACHINE_DEBUG: Error in process loop: {e}")
                 logger.error(f"Error in process loop: {e}", exc_info=True)
@@ -261,6 +300,9 @@ class GameStateMachine:
         # 🤖 Trigger bot manager for phase changes
         await self._notify_bot_manager(new_phase)
 
+        # The new state may be ready to move on immediately
+        self.request_transition_check()
+
     def get_current_phase(self) -> Optional[GamePhase]:
         """
         Get the current game phase.
@@ -309,8 +351,8 @@ class GameStateMachine:
                 serializable_data[key] = [
                     getattr(player, "name", str(player)) for player in value
                 ]
-            elif hasattr(value, "__dict__"):
-                # Convert complex objects to string representation
+            elif isinstance(value, Piece) or hasattr(value, "__dict__"):
+                # Convert complex objects (including slotted Pieces) to string representation
                 serializable_data[key] = str(value)
             else:
                 serializable_data[key] = value
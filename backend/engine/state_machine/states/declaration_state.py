@@ -39,23 +39,25 @@ class DeclarationState(GameState):
         declaration_order = game.get_player_order_from(round_starter)
 
         # 🚀 ENTERPRISE: Use automatic broadcasting system instead of manual phase_data updates
-        # First set basic data
-        await self.update_phase_data(
-            {
-                "declaration_order": [p.name for p in declaration_order],
-                "current_declarer_index": 0,
-                "declarations": {},
-                "declaration_total": 0,
-            },
-            "Declaration phase setup - basic data",
-        )
+        # Both steps go out as one phase_change
+        async with self.batch_updates():
+            # First set basic data
+            await self.update_phase_data(
+                {
+                    "declaration_order": [p.name for p in declaration_order],
+                    "current_declarer_index": 0,
+                    "declarations": {},
+                    "declaration_total": 0,
+                },
+                "Declaration phase setup - basic data",
+            )
 
-        # Then set current declarer after the order is established
-        current_declarer = self._get_current_declarer()
-        await self.update_phase_data(
-            {"current_declarer": current_declarer},
-            f"Declaration phase setup complete - current declarer: {current_declarer}",
-        )
+            # Then set current declarer after the order is established
+            current_declarer = self._get_current_declarer()
+            await self.update_phase_data(
+                {"current_declarer": current_declarer},
+                f"Declaration phase setup complete - current declarer: {current_declarer}",
+            )
 
     async def _cleanup_phase(self) -> None:
         # FIX: Copy declarations to game object during cleanup
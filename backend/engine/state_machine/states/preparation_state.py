@@ -2,7 +2,6 @@
 
 import asyncio
 import random
-import time
 from typing import Any, Dict, List, Optional, Set
 
 from ..base_state import GameState
@@ -186,7 +185,7 @@ class PreparationState(GameState):
 
             # Set up simultaneous decision system
             self.weak_players_awaiting = self.weak_players.copy()
-            self.decision_start_time = time.time()
+            self.decision_start_time = self.state_machine.clock.time()
             self.warning_sent = False
 
             # Notify about weak hands (frontend will prompt players)
@@ -220,7 +219,7 @@ class PreparationState(GameState):
                     f"✅ No weak hands - keeping existing starter: {starter} (reason: {game.starter_reason})"
                 )
                 # Allow time for dealing animation to complete
-                await asyncio.sleep(2.0)
+                await self.state_machine.clock.sleep(2.0)
             else:
                 # No starter set, determine one
                 starter = self._determine_starter()
@@ -230,7 +229,7 @@ class PreparationState(GameState):
                     f"✅ No weak hands - determined new starter: {starter}"
                 )
                 # Allow time for dealing animation to complete
-                await asyncio.sleep(2.0)
+                await self.state_machine.clock.sleep(2.0)
 
         # Signal that dealing is complete
         final_multiplier = getattr(game, "redeal_multiplier", 1)
@@ -346,7 +345,7 @@ class PreparationState(GameState):
                             self.logger.info(
                                 "🎴 Waiting for dealing animation to complete..."
                             )
-                            await asyncio.sleep(4.0)
+                            await self.state_machine.clock.sleep(4.0)
                         await self.state_machine._transition_to(GamePhase.ROUND_START)
 
                     return result
@@ -400,7 +399,7 @@ class PreparationState(GameState):
 
                 # Set up new decision cycle
                 self.weak_players_awaiting = self.weak_players.copy()
-                self.decision_start_time = time.time()
+                self.decision_start_time = self.state_machine.clock.time()
                 self.warning_sent = False
 
                 # Notify about new weak hands
@@ -453,12 +452,12 @@ class PreparationState(GameState):
     async def _monitor_decision_timeout(self) -> None:
         """Monitor and handle decision timeouts"""
         while not self._all_weak_decisions_received():
-            await asyncio.sleep(1.0)
+            await self.state_machine.clock.sleep(1.0)
 
             if not self.weak_players:  # Phase changed
                 return
 
-            elapsed = time.time() - self.decision_start_time
+            elapsed = self.state_machine.clock.time() - self.decision_start_time
 
             # Warning at 20 seconds
             if elapsed > 20 and not self.warning_sent:
@@ -1,6 +1,6 @@
 # backend/engine/state_machine/states/round_start_state.py
 
-import time
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from ..base_state import GameState
@@ -36,7 +36,8 @@ class RoundStartState(GameState):
 
         # Phase-specific state
         self.display_duration: float = 5.0  # 5 seconds
-        self.start_time: Optional[float] = None
+        self.start_time: Optional[float] = None  # Game clock time
+        self._display_timer: Optional[asyncio.Task] = None
 
     async def _setup_phase(self) -> None:
         """Initialize round start display"""
@@ -64,14 +65,24 @@ class RoundStartState(GameState):
             f"Round {game.round_number} starting with {starter}",
         )
 
-        # Record start time for auto-transition
-        self.start_time = time.time()
+        # Record start time for auto-transition and wake the state machine when it's due
+        self.start_time = self.state_machine.clock.time()
+        self._display_timer = asyncio.create_task(self._wake_after_display())
+
+    async def _wake_after_display(self) -> None:
+        """Request a transition check once the display duration has passed"""
+        await self.state_machine.clock.sleep(self.display_duration)
+        self.request_transition_check()
 
     async def _cleanup_phase(self) -> None:
         """Clean up before transitioning to Declaration"""
         self.logger.info(
             "🎯 Round start display complete - transitioning to Declaration"
         )
+        if self._display_timer and not self._display_timer.done():
+            self._display_timer.cancel()
+        self._display_timer = None
+        self.start_time = None
 
     async def _validate_action(self, action: GameAction) -> bool:
         """Validate action for round start phase"""
@@ -103,7 +114,7 @@ class RoundStartState(GameState):
         if self.start_time is None:
             return None
 
-        elapsed = time.time() - self.start_time
+        elapsed = self.state_machine.clock.time() - self.start_time
 
         if elapsed >= self.display_duration:
             return GamePhase.DECLARATION
@@ -147,6 +158,10 @@ class RoundStartState(GameState):
                 "current_starter": game.current_player,
                 "starter_reason": getattr(game, "starter_reason", "default"),
                 "display_duration": self.display_duration,
-                "elapsed": time.time() - self.start_time if self.start_time else 0,
+                "elapsed": (
+                    self.state_machine.clock.time() - self.start_time
+                    if self.start_time
+                    else 0
+                ),
             },
         }
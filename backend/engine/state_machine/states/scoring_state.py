@@ -437,11 +437,12 @@ class ScoringState(GameState):
 
     async def _start_display_delay(self) -> None:
         """Give users 7 seconds to view scoring results before transitioning"""
-        import asyncio
-
         print(f"⏰ SCORING_DELAY_DEBUG: Starting 7-second display delay...")
-        await asyncio.sleep(7.0)  # 7 second delay for users to see scores
+        await self.state_machine.clock.sleep(
+            7.0
+        )  # 7 second delay for users to see scores
         self.display_delay_complete = True
+        self.request_transition_check()
         print(
             f"⏰ SCORING_DELAY_DEBUG: 7-second delay complete - setting display_delay_complete = True"
         )
@@ -138,6 +138,10 @@ class TurnResultsState(GameState):
             self.auto_transition_task = asyncio.create_task(
                 self._auto_transition_after_delay()
             )
+            # Transition fires once the task is done (see check_transition_conditions)
+            self.auto_transition_task.add_done_callback(
+                lambda _: self.request_transition_check()
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to start auto transition: {e}", exc_info=True)
@@ -146,7 +150,7 @@ class TurnResultsState(GameState):
         """Handle automatic transition after display period"""
         try:
             # Wait for display duration
-            await asyncio.sleep(self.display_duration)
+            await self.state_machine.clock.sleep(self.display_duration)
 
             # 🚀 ENTERPRISE: Update phase data for transition
             await self.update_phase_data(
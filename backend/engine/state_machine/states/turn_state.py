@@ -1,6 +1,5 @@
 # backend/engine/state_machine/states/turn_state.py
 
-import asyncio
 from typing import Any, Dict, List, Optional, Set
 
 from ...constants import PIECE_POINTS
@@ -282,15 +281,14 @@ class TurnState(GameState):
         game = self.state_machine.game
         player = next((p for p in game.players if p.name == action.player_name), None)
         if player:
-            for piece in pieces:
-                if piece not in player.hand:
-                    self.logger.warning(
-                        f"Player {action.player_name} doesn't have piece: {piece}"
-                    )
-                    self._last_validation_error = (
-                        f"You don't have one or more of the selected pieces"
-                    )
-                    return False
+            if not player.hand.contains_all(pieces):
+                self.logger.warning(
+                    f"Player {action.player_name} doesn't have pieces: {pieces}"
+                )
+                self._last_validation_error = (
+                    f"You don't have one or more of the selected pieces"
+                )
+                return False
         else:
             self.logger.error(f"Player {action.player_name} not found in game")
             self._last_validation_error = "Player not found"
@@ -342,9 +340,7 @@ class TurnState(GameState):
         game = self.state_machine.game
         player = next((p for p in game.players if p.name == action.player_name), None)
         if player:
-            for piece in pieces:
-                if piece in player.hand:
-                    player.hand.remove(piece)
+            player.hand.discard_pieces(pieces)
             self.logger.info(
                 f"Removed {len(pieces)} pieces from {action.player_name}'s hand"
             )
@@ -443,7 +439,7 @@ class TurnState(GameState):
 
         delay_start = time.time()
         self.logger.info("🎮 Waiting 5s for piece flip animation to complete...")
-        await asyncio.sleep(
+        await self.state_machine.clock.sleep(
             5.0
         )  # Give frontend plenty of time for 800ms delay + 600ms animation
         delay_end = time.time()
@@ -659,7 +655,7 @@ class TurnState(GameState):
                 self.logger.info(
                     f"🎯 Turn complete - auto-starting next turn in 7 seconds"
                 )
-                await asyncio.sleep(7.0)
+                await self.state_machine.clock.sleep(7.0)
                 turn_started = await self.start_next_turn_if_needed()
 
                 # 🚀 ENTERPRISE: New turn auto-start automatically broadcasts via update_phase_data
@@ -1,14 +1,49 @@
 # backend/socket_manager.py
 
 import asyncio
+import bisect
+import heapq
+import itertools
 import json
 import time
+import weakref
+import zlib
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Set
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from fastapi.websockets import WebSocket
 
+from backend.api.services.event_codec import make_patch
+from backend.api.websocket.connection_manager import connection_manager
+from backend.config.broadcast_config import get_broadcast_config
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def encode_json(value: Any) -> str:
+    """Encode a message as compact JSON text (orjson if installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, separators=(",", ":"))
+
 
 @dataclass
 class PendingMessage:
@@ -21,6 +56,9 @@ class PendingMessage:
     max_retries: int = 3
     timeout_seconds: float = 30.0
     room_id: str = ""
+    retry_base_delay: float = 5.0  # Backoff doubles per retry from here...
+    retry_max_delay: float = 30.0  # ...up to this
+    deadline: float = 0.0  # When the retry scheduler next looks at it
 
     def is_expired(self) -> bool:
         """Check if message has exceeded timeout"""
@@ -30,6 +68,25 @@ class PendingMessage:
         """Check if message should be retried"""
         return self.retry_count < self.max_retries and not self.is_expired()
 
+    def retry_delay(self) -> float:
+        """Backoff before the next retry, counted from the last send"""
+        return min(
+            self.retry_base_delay * (2**self.retry_count), self.retry_max_delay
+        )
+
+    def can_retry(self) -> bool:
+        """Check if another retry is due before the message times out"""
+        return (
+            self.retry_count < self.max_retries
+            and self.retry_delay() <= self.timeout_seconds
+        )
+
+    def next_deadline(self) -> float:
+        """Time of the next retry, or of expiry once retries are used up"""
+        if self.can_retry():
+            return self.timestamp + self.retry_delay()
+        return self.timestamp + self.timeout_seconds
+
 
 @dataclass
 class MessageStats:
@@ -44,11 +101,177 @@ class MessageStats:
     last_activity: float = field(default_factory=time.time)
 
 
+@dataclass
+class StateChannel:
+    """A room's versioned state channel: the last state sent and its version"""
+
+    event: str = ""
+    version: int = 0
+    state: Optional[Dict[str, Any]] = None
+    private: Optional[Dict[str, Dict[str, Any]]] = None  # player -> section
+    deltas_since_full: int = 0
+
+
+class BroadcastQueue:
+    """
+    A room's bounded queue of broadcasts waiting for fan-out.
+
+    put() never blocks or grows past `maxsize`; a full queue makes room
+    according to its overflow policy:
+    - "drop_oldest": drop the oldest message that isn't a critical event
+    - "coalesce": if the newest queued message and the new one are both
+      state channel messages for the same event, replace the queued one
+      with the new state in full; otherwise drop_oldest
+    - "close_slow": SocketManager closes the room's slowest socket (which
+      reconnects and resyncs), then drop_oldest
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str = "coalesce",
+        critical_events: FrozenSet[str] = frozenset(),
+    ):
+        self.maxsize = maxsize
+        self.policy = policy
+        self.critical_events = critical_events
+        self._messages: Deque[Dict[str, Any]] = deque()
+
+        self.peak_depth = 0
+        self.overflows = 0
+        self.dropped = 0
+        self.dropped_critical = 0
+        self.coalesced = 0
+
+    def qsize(self) -> int:
+        return len(self._messages)
+
+    def full(self) -> bool:
+        return len(self._messages) >= self.maxsize
+
+    def put(self, message: Dict[str, Any]):
+        """Queue a message, making room first if the queue is full"""
+        if self.full():
+            self.overflows += 1
+            if self.policy == "coalesce" and self._coalesce(message):
+                return
+            self._drop_oldest()
+        self._messages.append(message)
+        self.peak_depth = max(self.peak_depth, len(self._messages))
+
+    def pop(self) -> Dict[str, Any]:
+        """Remove and return the oldest message"""
+        return self._messages.popleft()
+
+    def _coalesce(self, message: Dict[str, Any]) -> bool:
+        newest = self._messages[-1] if self._messages else None
+        if (
+            newest is None
+            or "keyframe" not in message
+            or "keyframe" not in newest
+            or newest["event"] != message["event"]
+        ):
+            return False
+        full_message = {
+            **message,
+            "data": {
+                **message["keyframe"],
+                "timestamp": message["data"]["timestamp"],
+                "room_id": message["data"]["room_id"],
+            },
+        }
+        self._messages[-1] = full_message
+        self.coalesced += 1
+        return True
+
+    def _drop_oldest(self):
+        for index, queued in enumerate(self._messages):
+            if queued["event"] not in self.critical_events:
+                del self._messages[index]
+                self.dropped += 1
+                return
+        self._messages.popleft()
+        self.dropped += 1
+        self.dropped_critical += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._messages),
+            "capacity": self.maxsize,
+            "peak_depth": self.peak_depth,
+            "overflow_policy": self.policy,
+            "overflows": self.overflows,
+            "dropped": self.dropped,
+            "dropped_critical": self.dropped_critical,
+            "coalesced": self.coalesced,
+        }
+
+
+class SocketWriter:
+    """
+    A websocket's outbound buffer, drained by its own task.
+
+    Room broadcasts only append pre-encoded frames with offer(), so a slow
+    client fills its own buffer instead of holding up everyone else in the
+    room. offer() refuses frames once the buffer is full or the writer has
+    failed; the writer fails (and calls on_failure) when a send doesn't go
+    through.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        room_id: str,
+        maxsize: int,
+        send: Callable[[WebSocket, str], Awaitable[bool]],
+        on_failure: Callable[["SocketWriter"], Awaitable[None]],
+    ):
+        self.websocket = websocket
+        self.room_id = room_id
+        self.maxsize = maxsize
+        self.closed = False
+        self.sent = 0
+        self._frames: Deque[str] = deque()
+        self._ready = asyncio.Event()
+        self._send = send
+        self._on_failure = on_failure
+        self._task = asyncio.create_task(self._run())
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+    def offer(self, frame: str) -> bool:
+        """Buffer a frame; False if the buffer is full or the writer failed"""
+        if self.closed or len(self._frames) >= self.maxsize:
+            return False
+        self._frames.append(frame)
+        self._ready.set()
+        return True
+
+    def stop(self):
+        """Discard buffered frames and stop the writer task"""
+        self.closed = True
+        self._frames.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    async def _run(self):
+        while not self.closed:
+            if not self._frames:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            if not await self._send(self.websocket, self._frames.popleft()):
+                self.stop()
+                await self._on_failure(self)
+                return
+            self.sent += 1
+
+
 class SocketManager:
     def __init__(self):
         self.room_connections: Dict[str, Set[WebSocket]] = {}
-        self.broadcast_queues: Dict[str, asyncio.Queue] = {}
-        self.broadcast_tasks: Dict[str, asyncio.Task] = {}
+        self.broadcast_queues: Dict[str, BroadcastQueue] = {}
         self.lock = asyncio.Lock()
 
         self.queue_stats = {}
@@ -65,8 +288,52 @@ class SocketManager:
             {}
         )  # room_id -> {client_id -> sequence}
 
-        # Background retry task (will be created when needed)
+        # Versioned state channel (phase_change deltas)
+        config = get_broadcast_config()
+        self.state_deltas = config.state_deltas
+        self.state_keyframe_interval = config.state_keyframe_interval
+        self.state_channels: Dict[str, StateChannel] = {}  # room_id -> channel
+
+        # Broadcast fan-out: every socket has a SocketWriter; one that
+        # overflows its buffer or times out on a send is disconnected
+        self.send_timeout = config.send_timeout
+        self.socket_buffer_size = config.socket_buffer_size
+        self.socket_writers: Dict[WebSocket, SocketWriter] = {}
+        self.stalled_disconnects = 0
+        self._closing: Set[asyncio.Task] = set()
+
+        # Bounded per-room queues (see BroadcastQueue)
+        self.queue_size = config.queue_size
+        self.overflow_policy = config.overflow_policy
+        self.critical_events = config.critical_events
+        self.slow_consumer_seconds = config.slow_consumer_seconds
+        self.slow_consumers_closed = 0
+
+        # Dispatchers: a fixed set of tasks, each serving the rooms that hash
+        # to it. A room is put on its dispatcher's ready queue when it gets a
+        # message (or a connection while messages wait); idle rooms cost nothing
+        self.dispatcher_shards = config.dispatcher_shards
+        self.dispatch_batch = config.dispatch_batch
+        self._ready_rooms: List[asyncio.Queue] = []
+        self._scheduled_rooms: Set[str] = set()
+        self._dispatch_tasks: List[asyncio.Task] = []
+        # Moving average of each socket's send time, and when its send in
+        # progress started, for close_slow
+        self.send_latency: "weakref.WeakKeyDictionary[WebSocket, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.send_started: "weakref.WeakKeyDictionary[WebSocket, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Background retry task (will be created when needed). It sleeps
+        # until the earliest deadline in _retry_heap; entries for messages
+        # acked or removed meanwhile are skipped when they come up
         self._retry_task = None
+        self._retry_heap: List[Tuple[float, int, PendingMessage]] = []
+        self._retry_order = itertools.count()  # Tie-breaker for equal deadlines
+        self._retry_wakeup = asyncio.Event()
+        self._retry_compact_at = 64
 
     def _ensure_retry_task(self):
         """Ensure the retry task is running"""
@@ -82,130 +349,128 @@ class SocketManager:
         """Cleanup background tasks"""
         if hasattr(self, "_retry_task") and self._retry_task:
             self._retry_task.cancel()
+        for task in getattr(self, "_dispatch_tasks", []):
+            task.cancel()
+
+    def _ensure_dispatchers(self):
+        """Start (or restart) the dispatcher tasks"""
+        if not self._ready_rooms:
+            self._ready_rooms = [asyncio.Queue() for _ in range(self.dispatcher_shards)]
+        for shard, ready_rooms in enumerate(self._ready_rooms):
+            if shard < len(self._dispatch_tasks):
+                if not self._dispatch_tasks[shard].done():
+                    continue
+                self._dispatch_tasks[shard] = asyncio.create_task(
+                    self._dispatch_broadcasts(ready_rooms)
+                )
+            else:
+                self._dispatch_tasks.append(
+                    asyncio.create_task(self._dispatch_broadcasts(ready_rooms))
+                )
 
-    async def _process_broadcast_queue(self, room_id: str):
-        """
-        Enhanced broadcast queue processor with monitoring
-        """
-        queue = self.broadcast_queues.get(room_id)
-        if not queue:
+    def _schedule_room(self, room_id: str):
+        """Put a room with queued messages on its dispatcher's ready queue"""
+        if room_id in self._scheduled_rooms:
             return
+        self._ensure_dispatchers()
+        self._scheduled_rooms.add(room_id)
+        shard = zlib.crc32(room_id.encode()) % len(self._ready_rooms)
+        self._ready_rooms[shard].put_nowait(room_id)
 
-        # Initialize stats
-        self.queue_stats[room_id] = {
-            "messages_processed": 0,
-            "average_latency": 0,
-            "last_error": None,
-            "start_time": time.time(),
-        }
-
+    async def _dispatch_broadcasts(self, ready_rooms: asyncio.Queue):
+        """Dispatcher loop: fan out queued messages of rooms as they get ready"""
         while True:
+            room_id = await ready_rooms.get()
+            self._scheduled_rooms.discard(room_id)
             try:
-                start_time = time.time()
-                # ✅ FIXED: Reduce timeout for lobby to make it more responsive
-                timeout = 0.5 if room_id == "lobby" else 1.0
-                message = await asyncio.wait_for(queue.get(), timeout=timeout)
-
-                event = message["event"]
-                data = message["data"]
-                operation_id = data.get("operation_id", "unknown")
-
-                # Get active WebSocket connections with lock
-                async with self.lock:
-                    active_websockets = list(self.room_connections.get(room_id, set()))
-
-                if not active_websockets:
-                    # Wait for connections to return instead of re-queueing
-                    await asyncio.sleep(0.5)  # Wait for potential reconnection
-
-                    # Check again for connections
-                    async with self.lock:
-                        active_websockets = list(
-                            self.room_connections.get(room_id, set())
-                        )
-
-                    if not active_websockets:
-                        await self.broadcast_queues[room_id].put(message)
-                        continue
-
-                # Send to all active websockets with error tracking
-                failed_websockets = []
-                success_count = 0
-
-                for ws in active_websockets:
-                    try:
-                        # Check if WebSocket is still active before sending
-                        if hasattr(ws, "client_state") and ws.client_state.name in [
-                            "DISCONNECTED",
-                            "CLOSED",
-                        ]:
-                            failed_websockets.append(ws)
-                            continue
-
-                        await ws.send_json({"event": event, "data": data})
-                        success_count += 1
-                    except Exception as e:
-                        if "not JSON serializable" in str(e):
-                            # Try to identify which field has the issue
-                            if isinstance(data, dict):
-                                for key, value in data.items():
-                                    try:
-                                        import json
-
-                                        json.dumps(value)
-                                    except:
-                                        pass
-                        failed_websockets.append(ws)
-
-                # Clean up failed connections
-                if failed_websockets:
-                    async with self.lock:
-                        for ws in failed_websockets:
-                            if room_id in self.room_connections:
-                                self.room_connections[room_id].discard(ws)
-
-                # Update stats
-                processing_time = time.time() - start_time
-                stats = self.queue_stats[room_id]
-                stats["messages_processed"] += 1
-                stats["average_latency"] = (
-                    stats["average_latency"] + processing_time
-                ) / 2
-                stats["last_success"] = time.time()
-                stats["last_success_count"] = success_count
-                stats["last_failure_count"] = len(failed_websockets)
-
-            except asyncio.TimeoutError:
-                # Only log timeouts for debugging specific issues, not normal operation
-                # For lobby, be more aggressive about keeping the processor alive
-                if room_id == "lobby":
-                    continue  # Keep processing for lobby even if no messages
-
-                # Check if we should continue processing
-                async with self.lock:
-                    connections_exist = room_id in self.room_connections and bool(
-                        self.room_connections[room_id]
-                    )
-                    queue_has_messages = queue.qsize() > 0
-
-                    if not connections_exist and not queue_has_messages:
-                        break
-                    elif not connections_exist:
-                        pass
-                continue
+                await self._dispatch_room(room_id)
             except Exception as e:
                 if room_id in self.queue_stats:
                     self.queue_stats[room_id]["last_error"] = str(e)
                     self.queue_stats[room_id]["last_error_time"] = time.time()
 
-        # Cleanup when the processor stops
-        async with self.lock:
-            if room_id in self.broadcast_queues:
-                del self.broadcast_queues[room_id]
-            if room_id in self.broadcast_tasks:
-                del self.broadcast_tasks[room_id]
-            if room_id in self.queue_stats:
-                del self.queue_stats[room_id]
+    async def _dispatch_room(self, room_id: str):
+        """Fan out up to dispatch_batch of a room's queued messages"""
+        queue = self.broadcast_queues.get(room_id)
+        if not queue:
+            return
+
+        for _ in range(min(queue.qsize(), self.dispatch_batch)):
+            # Get active WebSocket connections with lock
+            async with self.lock:
+                active_websockets = list(self.room_connections.get(room_id, set()))
+
+            if not active_websockets:
+                # Keep messages (in order) until someone connects; register()
+                # schedules the room again and the queue's bound caps the backlog
+                return
+
+            await self._fan_out(room_id, queue.pop(), active_websockets)
+
+        # Let other rooms go first, then continue with the rest
+        if queue.qsize():
+            self._schedule_room(room_id)
+
+    async def _fan_out(
+        self, room_id: str, message: Dict[str, Any], active_websockets: List[WebSocket]
+    ):
+        """Encode a message once and hand it to each socket's writer"""
+        start_time = time.time()
+        event = message["event"]
+        data = message["data"]
+        private = message.get("private")
+
+        # Encode once for every recipient; only per-player sections
+        # are encoded per socket
+        try:
+            frame_prefix = self._encode_frame_prefix(event, data)
+        except (TypeError, ValueError) as e:
+            self._record_encode_error(room_id, event, data, e)
+            return
+
+        if private:
+            frames = [
+                self._close_frame(frame_prefix, private.get(self._recipient_name(ws)))
+                for ws in active_websockets
+            ]
+        else:
+            frames = [self._close_frame(frame_prefix, None)] * len(active_websockets)
+
+        # Hand each socket its frame; writers send them concurrently
+        failed_websockets = []
+        for ws, frame in zip(active_websockets, frames):
+            writer = self.socket_writers.get(ws)
+            if writer is None or not writer.offer(frame):
+                failed_websockets.append(ws)
+        success_count = len(active_websockets) - len(failed_websockets)
+
+        # Disconnect clients that stalled (full buffer) or failed
+        for ws in failed_websockets:
+            writer = self.socket_writers.get(ws)
+            if writer and not writer.closed:
+                self.stalled_disconnects += 1
+                print(f"🐢 BROADCAST: Send buffer full in room {room_id}")
+            await self._drop_socket(room_id, ws)
+
+        # Update stats (unless dropping the last socket removed the room)
+        if room_id not in self.broadcast_queues:
+            return
+        processing_time = time.time() - start_time
+        stats = self.queue_stats.setdefault(room_id, self._new_queue_stats())
+        stats["messages_processed"] += 1
+        stats["average_latency"] = (stats["average_latency"] + processing_time) / 2
+        stats["last_success"] = time.time()
+        stats["last_success_count"] = success_count
+        stats["last_failure_count"] = len(failed_websockets)
+
+    @staticmethod
+    def _new_queue_stats() -> Dict[str, Any]:
+        return {
+            "messages_processed": 0,
+            "average_latency": 0,
+            "last_error": None,
+            "start_time": time.time(),
+        }
 
     async def register(self, room_id: str, websocket: WebSocket) -> WebSocket:
         """
@@ -224,8 +489,16 @@ class SocketManager:
                     "first_connection": time.time(),
                 }
 
-            # Add the connection
+            # Add the connection and its writer
             self.room_connections[room_id].add(websocket)
+            if websocket not in self.socket_writers:
+                self.socket_writers[websocket] = SocketWriter(
+                    websocket,
+                    room_id,
+                    self.socket_buffer_size,
+                    self._send_frame,
+                    self._on_writer_failure,
+                )
 
             # Update stats
             stats = self.connection_stats[room_id]
@@ -236,20 +509,12 @@ class SocketManager:
             )
             stats["last_connection"] = time.time()
 
-            # Create broadcast queue and task if they don't exist
-            if room_id not in self.broadcast_queues:
-                self.broadcast_queues[room_id] = asyncio.Queue()
-                self.broadcast_tasks[room_id] = asyncio.create_task(
-                    self._process_broadcast_queue(room_id)
-                )
+            # Create broadcast queue if it doesn't exist
+            queue = self._get_queue(room_id)
 
-            # IMPORTANT: Ensure lobby broadcast processor is always running
-            elif room_id == "lobby" and room_id in self.broadcast_tasks:
-                task = self.broadcast_tasks[room_id]
-                if task.done() or task.cancelled():
-                    self.broadcast_tasks[room_id] = asyncio.create_task(
-                        self._process_broadcast_queue(room_id)
-                    )
+        # Messages kept while the room had no connections can go out now
+        if queue.qsize():
+            self._schedule_room(room_id)
 
         return websocket
 
@@ -261,38 +526,58 @@ class SocketManager:
 
     async def _unregister_async(self, room_id: str, websocket: WebSocket):
         async with self.lock:
-            if room_id not in self.room_connections:
-                return
+            await self._remove_socket(room_id, websocket)
 
-            self.room_connections[room_id].discard(websocket)
+    async def _remove_socket(self, room_id: str, websocket: WebSocket):
+        """Take a socket out of its room and stop its writer (lock held)"""
+        writer = self.socket_writers.pop(websocket, None)
+        if writer:
+            writer.stop()
 
-            # Update connection stats
-            if room_id in self.connection_stats:
-                self.connection_stats[room_id]["current_connections"] = len(
-                    self.room_connections[room_id]
-                )
-                self.connection_stats[room_id]["last_disconnection"] = time.time()
+        if room_id not in self.room_connections:
+            return
+        self.room_connections[room_id].discard(websocket)
 
-            # Clean up empty rooms - BUT PROTECT ACTIVE GAMES
-            if not self.room_connections[room_id]:
-                # Check if room has an active game before cleanup
-                from backend.shared_instances import shared_room_manager
+        # Update connection stats
+        if room_id in self.connection_stats:
+            self.connection_stats[room_id]["current_connections"] = len(
+                self.room_connections[room_id]
+            )
+            self.connection_stats[room_id]["last_disconnection"] = time.time()
 
-                room = await shared_room_manager.get_room(room_id)
+        # Clean up empty rooms - BUT PROTECT ACTIVE GAMES
+        if not self.room_connections[room_id]:
+            # Check if room has an active game before cleanup
+            from backend.shared_instances import shared_room_manager
 
-                if room and room.game and not room.game._is_game_over():
-                    # Keep the room in connections dict but empty, so queue stays alive
-                    # Don't delete the broadcast task
-                    return
+            room = await shared_room_manager.get_room(room_id)
 
-                # Safe to clean up - no active game
-                del self.room_connections[room_id]
-                if room_id in self.broadcast_tasks:
-                    self.broadcast_tasks[room_id].cancel()
+            if room and room.game and not room.game._is_game_over():
+                # Keep the room in connections dict but empty, so queue stays alive
+                # Don't delete the broadcast queue
+                return
 
-    async def broadcast(self, room_id: str, event: str, data: dict):
+            # Safe to clean up - no active game
+            del self.room_connections[room_id]
+            self.state_channels.pop(room_id, None)
+            self.broadcast_queues.pop(room_id, None)
+            self.queue_stats.pop(room_id, None)
+
+    async def broadcast(
+        self,
+        room_id: str,
+        event: str,
+        data: dict,
+        private: Optional[Dict[str, Dict[str, Any]]] = None,
+        keyframe: Optional[dict] = None,
+    ):
         """
         Enhanced broadcast with debugging specifically for lobby
+
+        `private` maps player names to a section only that player's sockets
+        receive, as data["private"]; everyone else gets the shared data only.
+        `keyframe` is the full form of a state channel message, sent instead
+        if the room's queue coalesces it with the next one.
         """
         # Add extra debugging for lobby
         if room_id == "lobby":
@@ -326,20 +611,182 @@ class SocketManager:
         enhanced_data = {**data, "timestamp": time.time(), "room_id": room_id}
 
         # Add message to queue
+        message = {"event": event, "data": enhanced_data}
+        if private:
+            message["private"] = private
+        if keyframe is not None:
+            message["keyframe"] = keyframe
+        queue = self.broadcast_queues[room_id]
+        if queue.full() and queue.policy == "close_slow":
+            await self._close_slowest(room_id)
+        queue.put(message)
+        self._schedule_room(room_id)
+
+        # Give the queue processor a chance to run
+        await asyncio.sleep(0)
+
+    async def _send_frame(self, websocket: WebSocket, frame: str) -> bool:
+        """
+        Send one encoded frame, giving up after send_timeout.
+
+        Returns:
+            bool: False if the socket is closed, failed or timed out
+        """
+        # Check if WebSocket is still active before sending
+        if hasattr(websocket, "client_state") and websocket.client_state.name in [
+            "DISCONNECTED",
+            "CLOSED",
+        ]:
+            return False
+        started = self.send_started[websocket] = time.time()
         try:
-            await self.broadcast_queues[room_id].put(
-                {"event": event, "data": enhanced_data}
+            await asyncio.wait_for(websocket.send_text(frame), self.send_timeout)
+            sent = True
+        except asyncio.TimeoutError:
+            print(f"⏱️ BROADCAST: Send timed out after {self.send_timeout}s")
+            sent = False
+        except Exception:
+            return False
+        finally:
+            self.send_started.pop(websocket, None)
+        elapsed = time.time() - started
+        self.send_latency[websocket] = (
+            self.send_latency.get(websocket, elapsed) + elapsed
+        ) / 2
+        return sent
+
+    def _get_queue(self, room_id: str) -> BroadcastQueue:
+        """A room's broadcast queue, created if needed"""
+        queue = self.broadcast_queues.get(room_id)
+        if queue is None:
+            queue = self.broadcast_queues[room_id] = BroadcastQueue(
+                self.queue_size, self.overflow_policy, self.critical_events
             )
+            self.queue_stats[room_id] = self._new_queue_stats()
+        return queue
 
-            if room_id == "lobby":
-                pass
+    async def _close_slowest(self, room_id: str):
+        """Close the room's slowest socket, if any is slow (close_slow policy)"""
+        now = time.time()
 
-        except Exception as e:
-            if room_id == "lobby":
-                pass
+        def slowness(websocket: WebSocket) -> float:
+            # Average send time, or how long a send has been in progress
+            in_progress = now - self.send_started.get(websocket, now)
+            return max(self.send_latency.get(websocket, 0.0), in_progress)
 
-        # Give the queue processor a chance to run
-        await asyncio.sleep(0)
+        connections = self.room_connections.get(room_id, set())
+        slowest = max(connections, key=slowness, default=None)
+        if slowest is None or slowness(slowest) < self.slow_consumer_seconds:
+            return
+        self.slow_consumers_closed += 1
+        print(f"🐢 BROADCAST: Closing slow consumer in room {room_id}")
+        await self._drop_socket(room_id, slowest)
+
+    async def _on_writer_failure(self, writer: SocketWriter):
+        await self._drop_socket(writer.room_id, writer.websocket)
+
+    async def _drop_socket(self, room_id: str, websocket: WebSocket):
+        """Remove a socket from its room and close it (in the background)"""
+        async with self.lock:
+            await self._remove_socket(room_id, websocket)
+        task = asyncio.create_task(self._close_socket(websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_socket(self, websocket: WebSocket):
+        try:
+            # 1013: try again later; the client reconnects and resyncs
+            await asyncio.wait_for(websocket.close(code=1013), self.send_timeout)
+        except Exception:
+            pass
+
+    def _record_encode_error(
+        self, room_id: str, event: str, data: dict, error: Exception
+    ):
+        """Log a message that can't be encoded (and which fields break it)"""
+        bad_fields = []
+        for key, value in data.items():
+            try:
+                encode_json(value)
+            except (TypeError, ValueError):
+                bad_fields.append(key)
+        print(
+            f"❌ BROADCAST: Dropped {event} for room {room_id}, "
+            f"cannot encode fields {bad_fields}: {error}"
+        )
+        if room_id in self.queue_stats:
+            self.queue_stats[room_id]["last_error"] = str(error)
+            self.queue_stats[room_id]["last_error_time"] = time.time()
+
+    @staticmethod
+    def _recipient_name(websocket: WebSocket) -> Optional[str]:
+        """Name of the player a websocket belongs to (None if not registered)"""
+        entry = connection_manager.websocket_to_player.get(
+            getattr(websocket, "_ws_id", None)
+        )
+        return entry[1] if entry else None
+
+    @staticmethod
+    def _encode_frame_prefix(event: str, data: dict) -> str:
+        """Encode a message once, leaving its data object open for _close_frame"""
+        return '{"event":%s,"data":%s' % (encode_json(event), encode_json(data)[:-1])
+
+    @staticmethod
+    def _close_frame(prefix: str, section: Optional[Dict[str, Any]]) -> str:
+        """Finish an encoded message, adding a recipient's private section"""
+        if section is None:
+            return prefix + "}}"
+        separator = "" if prefix.endswith("{") else ","
+        return f'{prefix}{separator}"private":{encode_json(section)}}}}}'
+
+    async def broadcast_state(
+        self,
+        room_id: str,
+        event: str,
+        state: dict,
+        private: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """
+        Broadcast a room's latest state on its versioned state channel
+
+        Every call bumps the room's state version. Clients get a patch
+        against the previous version ({"version", "base_version", "delta"},
+        see event_codec.make_patch); the first message, and every
+        `state_keyframe_interval`-th one, carries the full state with its
+        "version". A client that misses a version sends sync_request and
+        gets the full state back (see request_client_sync).
+
+        `private` (player -> section, e.g. that player's hand) is not part of
+        the versioned state: each player's sockets get their own section in
+        full with every message.
+        """
+        channel = self.state_channels.get(room_id)
+        if channel is None or channel.event != event:
+            channel = self.state_channels[room_id] = StateChannel(event=event)
+
+        previous = channel.state
+        channel.version += 1
+        channel.state = state
+        channel.private = private
+
+        if (
+            not self.state_deltas
+            or previous is None
+            or channel.deltas_since_full + 1 >= self.state_keyframe_interval
+        ):
+            channel.deltas_since_full = 0
+            data = keyframe = {**state, "version": channel.version}
+        else:
+            channel.deltas_since_full += 1
+            data = {
+                "version": channel.version,
+                "base_version": channel.version - 1,
+                "delta": make_patch(previous, state),
+            }
+            # Sent in its place if the room's queue coalesces this message
+            keyframe = {**state, "version": channel.version}
+
+        await self.broadcast(room_id, event, data, private, keyframe)
 
     def _next_sequence(self, room_id: str) -> int:
         """Generate next sequence number for room (thread-safe)"""
@@ -392,24 +839,27 @@ class SocketManager:
             },
         }
 
+        # Store for retry before sending, so an ack that arrives while the
+        # send is in flight finds it
+        if room_id not in self.pending_messages:
+            self.pending_messages[room_id] = {}
+
+        pending_msg = PendingMessage(
+            message=message,
+            websocket=websocket,
+            timestamp=time.time(),
+            retry_count=0,
+            max_retries=max_retries,
+            timeout_seconds=timeout,
+            room_id=room_id,
+        )
+        self.pending_messages[room_id][sequence] = pending_msg
+        self._schedule_retry(pending_msg)
+
         try:
             # Send message
             await websocket.send_json(message)
 
-            # Store for retry if needed
-            if room_id not in self.pending_messages:
-                self.pending_messages[room_id] = {}
-
-            self.pending_messages[room_id][sequence] = PendingMessage(
-                message=message,
-                websocket=websocket,
-                timestamp=time.time(),
-                retry_count=0,
-                max_retries=max_retries,
-                timeout_seconds=timeout,
-                room_id=room_id,
-            )
-
             # Update stats
             self.message_stats[room_id].sent += 1
             self.message_stats[room_id].last_activity = time.time()
@@ -423,6 +873,9 @@ class SocketManager:
             print(
                 f"❌ RELIABLE_MSG: Failed to send message seq {sequence} to room {room_id}: {e}"
             )
+            room_messages = self.pending_messages.get(room_id, {})
+            if room_messages.get(sequence) is pending_msg:
+                del room_messages[sequence]
             self.message_stats[room_id].failed += 1
             return False
 
@@ -487,37 +940,152 @@ class SocketManager:
             )
             return False
 
+    async def handle_acks(
+        self,
+        room_id: str,
+        up_to: Optional[int] = None,
+        ranges: Optional[List[Tuple[int, int]]] = None,
+        client_id: Optional[str] = None,
+        websocket: Optional[WebSocket] = None,
+    ) -> int:
+        """
+        Handle a batched acknowledgment from a client in one pass
+
+        Acknowledges every pending message with sequence <= `up_to`
+        (cumulative) and every sequence inside one of `ranges` (inclusive
+        [start, end] pairs, for messages received out of order).
+
+        Args:
+            room_id: The room identifier
+            up_to: Highest sequence up to which everything was received
+            ranges: Inclusive sequence ranges received beyond `up_to`
+            client_id: Optional client identifier for tracking
+            websocket: The acknowledging connection; only messages sent to
+                it are acknowledged (sequences are shared by the whole room)
+
+        Returns:
+            int: Number of pending messages acknowledged
+        """
+        room_messages = self.pending_messages.get(room_id)
+        spans = sorted(ranges or [])
+        if up_to is not None:
+            spans.insert(0, (0, up_to))
+        if not room_messages or not spans:
+            return 0
+
+        # Merge overlapping spans, so each sequence is checked with one bisect
+        merged: List[List[int]] = []
+        for start, end in sorted(spans):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        starts = [start for start, _ in merged]
+
+        current_time = time.time()
+        acked = []
+
+        # Pending messages aren't necessarily stored in sequence order
+        for sequence, pending_msg in room_messages.items():
+            span_index = bisect.bisect_right(starts, sequence) - 1
+            if span_index < 0 or sequence > merged[span_index][1]:
+                continue  # Not received by the client yet
+            if websocket is not None and pending_msg.websocket is not websocket:
+                continue
+            acked.append((sequence, current_time - pending_msg.timestamp))
+
+        for sequence, _ in acked:
+            del room_messages[sequence]
+
+        if acked:
+            last_acked = max(sequence for sequence, _ in acked)
+            if room_id in self.message_stats:
+                stats = self.message_stats[room_id]
+                stats.acknowledged += len(acked)
+                for _, response_time in acked:
+                    stats.average_latency = (stats.average_latency + response_time) / 2
+                stats.last_activity = current_time
+
+            # Track client sequence
+            if client_id:
+                if room_id not in self.client_last_seen_sequence:
+                    self.client_last_seen_sequence[room_id] = {}
+                self.client_last_seen_sequence[room_id][client_id] = last_acked
+
+            print(
+                f"✅ RELIABLE_MSG: Acknowledged {len(acked)} messages for room "
+                f"{room_id} (up to seq {last_acked})"
+            )
+        return len(acked)
+
+    def _schedule_retry(self, pending_msg: PendingMessage):
+        """Queue a pending message for its next retry or expiry"""
+        pending_msg.deadline = pending_msg.next_deadline()
+        if not self._retry_heap or pending_msg.deadline < self._retry_heap[0][0]:
+            self._retry_wakeup.set()  # The worker is sleeping for too long
+        heapq.heappush(
+            self._retry_heap,
+            (pending_msg.deadline, next(self._retry_order), pending_msg),
+        )
+
+        # Drop entries of acked messages whenever the heap has doubled
+        if len(self._retry_heap) > self._retry_compact_at:
+            self._retry_heap = [
+                entry for entry in self._retry_heap if self._is_scheduled(entry)
+            ]
+            heapq.heapify(self._retry_heap)
+            self._retry_compact_at = 2 * len(self._retry_heap) + 64
+
+    def _is_scheduled(self, entry: Tuple[float, int, PendingMessage]) -> bool:
+        """Check that a heap entry is still the message's current deadline"""
+        deadline, _, pending_msg = entry
+        sequence = pending_msg.message["data"]["_seq"]
+        room_messages = self.pending_messages.get(pending_msg.room_id, {})
+        return (
+            room_messages.get(sequence) is pending_msg
+            and pending_msg.deadline == deadline
+        )
+
     async def _message_retry_worker(self):
-        """Background worker to retry unacknowledged messages"""
+        """Background worker to retry unacknowledged messages when they're due"""
         print("🔄 RELIABLE_MSG: Message retry worker started")
 
         while True:
             try:
-                await asyncio.sleep(5)  # Check every 5 seconds
+                # Sleep until the earliest deadline, or until one is added
+                self._retry_wakeup.clear()
+                if self._retry_heap:
+                    delay = self._retry_heap[0][0] - time.time()
+                    if delay > 0:
+                        try:
+                            await asyncio.wait_for(self._retry_wakeup.wait(), delay)
+                        except asyncio.TimeoutError:
+                            pass
+                else:
+                    await self._retry_wakeup.wait()
 
                 current_time = time.time()
                 retry_tasks = []
 
-                # Check all pending messages across all rooms
-                for room_id, room_messages in list(self.pending_messages.items()):
-                    for sequence, pending_msg in list(room_messages.items()):
-
-                        # Check if message should be retried
-                        if pending_msg.should_retry():
-                            # Check if it's time to retry (exponential backoff)
-                            retry_delay = min(5 * (2**pending_msg.retry_count), 30)
-                            if current_time - pending_msg.timestamp >= retry_delay:
-                                retry_tasks.append(
-                                    self._retry_message(room_id, sequence, pending_msg)
-                                )
-
-                        # Check if message has expired
-                        elif pending_msg.is_expired():
-                            retry_tasks.append(
-                                self._handle_expired_message(
-                                    room_id, sequence, pending_msg
-                                )
+                # Pop every message whose deadline has passed
+                while self._retry_heap and self._retry_heap[0][0] <= current_time:
+                    entry = heapq.heappop(self._retry_heap)
+                    if not self._is_scheduled(entry):
+                        continue  # Acknowledged or removed since
+                    pending_msg = entry[2]
+                    room_id = pending_msg.room_id
+                    sequence = pending_msg.message["data"]["_seq"]
+
+                    if pending_msg.can_retry():
+                        retry_tasks.append(
+                            self._retry_message(room_id, sequence, pending_msg)
+                        )
+                    else:
+                        retry_tasks.append(
+                            self._handle_expired_message(
+                                room_id, sequence, pending_msg
                             )
+                        )
 
                 # Execute retry tasks
                 if retry_tasks:
@@ -542,6 +1110,7 @@ class SocketManager:
 
             # Attempt to send
             await pending_msg.websocket.send_json(retry_message)
+            self._schedule_retry(pending_msg)
 
             # Update stats
             if room_id in self.message_stats:
@@ -623,6 +1192,21 @@ class SocketManager:
                 f"🔄 RELIABLE_MSG: Sent sync request to client {client_id} in room {room_id}"
             )
 
+            # Resend the full current state so the client can apply deltas again
+            channel = self.state_channels.get(room_id)
+            if channel and channel.state is not None:
+                data = {
+                    **channel.state,
+                    "version": channel.version,
+                    "timestamp": time.time(),
+                    "room_id": room_id,
+                }
+                private = channel.private or {}
+                section = private.get(self._recipient_name(websocket))
+                if section is not None:
+                    data["private"] = section
+                await websocket.send_json({"event": channel.event, "data": data})
+
         except Exception as e:
             print(f"❌ RELIABLE_MSG: Failed to send sync request to {client_id}: {e}")
 
@@ -676,6 +1260,21 @@ class SocketManager:
                 "connection_stats": self.connection_stats.get(room_id, {}),
                 "queue_stats": self.queue_stats.get(room_id, {}),
                 "active_connections": len(self.room_connections.get(room_id, set())),
+                "state_version": (
+                    self.state_channels[room_id].version
+                    if room_id in self.state_channels
+                    else 0
+                ),
+                "broadcast_queue": (
+                    self.broadcast_queues[room_id].get_stats()
+                    if room_id in self.broadcast_queues
+                    else {}
+                ),
+                "socket_buffers": [
+                    self.socket_writers[ws].qsize()
+                    for ws in self.room_connections.get(room_id, set())
+                    if ws in self.socket_writers
+                ],
             }
         else:
             return {
@@ -686,19 +1285,20 @@ class SocketManager:
                 "rooms": list(self.room_connections.keys()),
                 "connection_stats": self.connection_stats,
                 "queue_stats": self.queue_stats,
+                "broadcast_queues": {
+                    room: queue.get_stats()
+                    for room, queue in self.broadcast_queues.items()
+                },
+                "slow_consumers_closed": self.slow_consumers_closed,
+                "stalled_disconnects": self.stalled_disconnects,
             }
 
     def ensure_lobby_broadcast_task(self):
         """
-        Ensure lobby broadcast task is always running
+        Ensure the lobby has a broadcast queue and the dispatchers are running
         """
-        if "lobby" not in self.broadcast_queues:
-            self.broadcast_queues["lobby"] = asyncio.Queue()
-
-        if "lobby" not in self.broadcast_tasks or self.broadcast_tasks["lobby"].done():
-            self.broadcast_tasks["lobby"] = asyncio.create_task(
-                self._process_broadcast_queue("lobby")
-            )
+        self._get_queue("lobby")
+        self._ensure_dispatchers()
 
 
 # CREATE SINGLETON INSTANCE
@@ -743,6 +1343,24 @@ async def broadcast(room_id: str, event: str, data: dict):
     await _socket_manager.broadcast(room_id, event, data)
 
 
+async def broadcast_state(
+    room_id: str,
+    event: str,
+    state: dict,
+    private: Optional[Dict[str, Dict[str, Any]]] = None,
+):
+    """
+    Broadcast a room's latest state as a versioned delta.
+
+    Args:
+        room_id: The ID of the room to broadcast to
+        event: The event type to send
+        state: The full, JSON-safe state shared by every recipient
+        private: Optional per-player sections (player name -> data)
+    """
+    await _socket_manager.broadcast_state(room_id, event, state, private)
+
+
 def get_room_stats(room_id: str = None) -> dict:
     """
     Get statistics for WebSocket connections.
@@ -758,9 +1376,10 @@ def get_room_stats(room_id: str = None) -> dict:
 
 def ensure_lobby_ready():
     """
-    Ensure the lobby broadcast task is running.
+    Ensure lobby broadcasts are being dispatched.
 
-    Creates the lobby broadcast task if it doesn't exist or has completed.
-    This maintains real-time room list updates for all lobby connections.
+    Creates the lobby broadcast queue if it doesn't exist and (re)starts the
+    broadcast dispatchers. This maintains real-time room list updates for
+    all lobby connections.
     """
     _socket_manager.ensure_lobby_broadcast_task()
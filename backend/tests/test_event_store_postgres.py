@@ -0,0 +1,263 @@
+"""
+EventStore on the postgres backend, against a local stand-in pool
+
+FakePool mimics the part of asyncpg's pool API the backend uses
+(acquire, transaction, copy_records_to_table, execute/fetch/fetchrow/
+fetchval) on top of an in-memory SQLite database, so the COPY insert,
+sequence reservation, snapshot and retention paths run without a server.
+"""
+
+import asyncio
+import re
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from backend.api.services import event_postgres
+from backend.api.services.event_store import EventStore
+from backend.config.event_store_config import reload_config
+
+# Statements SQLite can't run as written
+_DELETE_CTE = re.compile(
+    r"WITH deleted AS \(\s*(DELETE .*? RETURNING room_id)\s*\)\s*"
+    r"SELECT room_id, COUNT\(\*\) FROM deleted GROUP BY room_id",
+    re.S,
+)
+# SQLite reads "FROM t ON CONFLICT" as a join constraint without a WHERE
+_UPSERT_FROM = re.compile(r"FROM game_events(\s+)(GROUP BY|ON CONFLICT)")
+
+
+def _to_sqlite(sql: str) -> str:
+    sql = re.sub(r"\$(\d+)", r"?\1", sql)
+    return _UPSERT_FROM.sub(r"FROM game_events WHERE true\1\2", sql)
+
+
+class FakeConnection:
+    """asyncpg-style connection over a shared SQLite database"""
+
+    def __init__(self, db: sqlite3.Connection):
+        self._db = db
+
+    async def execute(self, sql: str, *args):
+        self._db.execute(_to_sqlite(sql), args)
+
+    async def fetch(self, sql: str, *args):
+        match = _DELETE_CTE.search(sql)
+        if match:
+            # DML in a CTE: delete, then group the returned rows here
+            counts = {}
+            for (room_id,) in self._db.execute(_to_sqlite(match.group(1)), args):
+                counts[room_id] = counts.get(room_id, 0) + 1
+            return list(counts.items())
+        return self._db.execute(_to_sqlite(sql), args).fetchall()
+
+    async def fetchrow(self, sql: str, *args):
+        rows = await self.fetch(sql, *args)
+        return rows[0] if rows else None
+
+    async def fetchval(self, sql: str, *args):
+        row = await self.fetchrow(sql, *args)
+        return row[0] if row else None
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        placeholders = ", ".join("?" for _ in columns)
+        self._db.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            records,
+        )
+
+    @asynccontextmanager
+    async def transaction(self):
+        self._db.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+
+class FakePool:
+    """asyncpg-style pool; every pool made by one factory shares a database"""
+
+    def __init__(self, db: sqlite3.Connection):
+        self._db = db
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConnection(self._db)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def postgres_store(monkeypatch):
+    """Factory for EventStores on the postgres backend, sharing one database"""
+    db = sqlite3.connect(":memory:", isolation_level=None)
+
+    async def create_pool(dsn, min_size, max_size):
+        return FakePool(db)
+
+    monkeypatch.setenv("EVENT_STORE_BACKEND", "postgres")
+    monkeypatch.setenv("EVENT_STORE_POSTGRES_DSN", "postgresql://stand-in/events")
+    monkeypatch.setenv("EVENT_STORE_BATCH_INTERVAL_MS", "1")
+    monkeypatch.setenv("EVENT_STORE_SEQUENCE_BLOCK", "4")
+    monkeypatch.setattr(event_postgres, "ASYNCPG_AVAILABLE", True)
+    monkeypatch.setattr(
+        event_postgres,
+        "asyncpg",
+        SimpleNamespace(create_pool=create_pool),
+        raising=False,
+    )
+    reload_config()
+    yield lambda: EventStore(snapshot_interval=2)
+    monkeypatch.undo()
+    reload_config()
+    db.close()
+
+
+def test_store_read_back_and_trim(postgres_store):
+    async def scenario():
+        store = postgres_store()
+        assert store._backend.name == "postgres"
+
+        for round_number in range(1, 4):
+            await store.store_event(
+                "room-a", "phase_change", {"new_phase": "turn", "round": round_number}
+            )
+            await store.store_event(
+                "room-b", "player_declared", {"player": "p1", "value": round_number}
+            )
+        await store.flush()
+
+        events = await store.get_room_events("room-a")
+        assert [event.room_sequence for event in events] == [1, 2, 3]
+        assert [event.payload["round"] for event in events] == [1, 2, 3]
+        assert [event.sequence for event in events] == sorted(
+            event.sequence for event in events
+        )
+        assert (await store.validate_event_sequence("room-b"))["valid"]
+
+        state = await store.replay_room_state("room-a")
+        assert state["phase"] == "turn"
+        await store.flush()
+        assert await store._backend.snapshot_rooms() == ["room-a"]
+
+        # Everything is older than "now"
+        await asyncio.sleep(0.01)
+        assert await store.cleanup_old_events(older_than_hours=0) == 6
+        assert await store.get_room_events("room-a") == []
+        assert await store._backend.snapshot_rooms() == []
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_processes_share_room_numbering(postgres_store):
+    async def scenario():
+        first, second = postgres_store(), postgres_store()
+
+        for index in range(3):
+            await first.store_event("room-a", "action", {"index": index})
+            await second.store_event("room-a", "action", {"index": index})
+        await first.flush()
+        await second.flush()
+
+        # Each process reads the other's events, numbered in one room sequence
+        for store in (first, second):
+            events = await store.get_room_events("room-a")
+            assert len(events) == 6
+            assert sorted(event.room_sequence for event in events) == list(range(1, 7))
+            assert (await store.validate_event_sequence("room-a"))["valid"]
+
+        # A reopened process continues the room's numbering
+        await first.close()
+        last_sequence = max(event.sequence for event in events)
+        third = postgres_store()
+        event = await third.store_event("room-a", "action", {"index": 3})
+        assert event.room_sequence == 7
+        assert event.sequence > last_sequence
+        await second.close()
+        await third.close()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_events_keep_room_and_global_order(postgres_store):
+    async def scenario():
+        store = postgres_store()
+        await store.open()
+        store.sequence_block_size = 2
+        backend = store._backend
+        reserve_room_sequence = backend.reserve_room_sequence
+        reserve_sequences = backend.reserve_sequences
+        room_replies = [asyncio.Event() for _ in range(3)]
+        block_reply = asyncio.Event()
+        calls = []
+
+        async def gated_room_sequence(room_id):
+            reply = room_replies[len(calls)]
+            calls.append(room_id)
+            await reply.wait()
+            return await reserve_room_sequence(room_id)
+
+        async def gated_block(count):
+            await block_reply.wait()
+            return await reserve_sequences(count)
+
+        backend.reserve_room_sequence = gated_room_sequence
+        backend.reserve_sequences = gated_block
+        tasks = [
+            asyncio.create_task(store.store_event("room-a", "action", {"index": i}))
+            for i in range(3)
+        ]
+
+        # The first event waits for a block of global sequence numbers, the
+        # second queues behind it, and the third's room sequence arrives
+        # just as the block does
+        room_replies[0].set()
+        await asyncio.sleep(0.01)
+        room_replies[1].set()
+        await asyncio.sleep(0.01)
+        block_reply.set()
+        room_replies[2].set()
+
+        events = await asyncio.gather(*tasks)
+        by_sequence = sorted(events, key=lambda event: event.sequence)
+        assert [event.room_sequence for event in by_sequence] == [1, 2, 3]
+        await store.close()
+
+    asyncio.run(scenario())
+
+
+def test_seeds_allocators_from_stored_events(postgres_store):
+    async def scenario():
+        store = postgres_store()
+        await store.store_event("room-a", "action", {})
+        await store.close()
+
+        # Events written before the room allocator existed
+        pool = await event_postgres.asyncpg.create_pool("", 1, 1)
+        async with pool.acquire() as conn:
+            await conn.execute("DROP TABLE room_sequence_allocator")
+            await conn.execute(
+                "INSERT INTO game_events VALUES"
+                " (100, 'room-b', 'action', x'7b7d', NULL, $1, '', 9)",
+                time.time(),
+            )
+            await conn.execute(
+                "UPDATE event_sequence_allocator SET next_sequence = 101"
+            )
+
+        store = postgres_store()
+        event = await store.store_event("room-b", "action", {})
+        assert (event.sequence, event.room_sequence) == (101, 10)
+        assert (await store.store_event("room-a", "action", {})).room_sequence == 2
+        await store.close()
+
+    asyncio.run(scenario())
@@ -28,6 +28,10 @@ import type {
   NetworkEventDetail,
 } from './types';
 import { parsePieces } from '../utils/pieceParser';
+import { applyStatePatch } from '../utils/statePatch';
+
+// Resend sync_request if no full state arrived within this time
+const STATE_SYNC_RETRY_MS = 2000;
 
 export class GameService extends EventTarget {
   // Singleton instance
@@ -49,6 +53,13 @@ export class GameService extends EventTarget {
   private readonly eventHistory: StateChangeEvent[] = [];
   private sequenceNumber = 0;
 
+  // Versioned state channel: last full phase_change data and its version
+  private stateChannel: {
+    version: number;
+    state: Record<string, any> | null;
+    syncRequestedAt: number;
+  } = { version: 0, state: null, syncRequestedAt: 0 };
+
   private constructor() {
     super();
 
@@ -444,6 +455,9 @@ export class GameService extends EventTarget {
   private handleNetworkConnection(): void {
     // Connection established - update state
 
+    // Versions restart with the server, so start the state channel over
+    this.stateChannel = { version: 0, state: null, syncRequestedAt: 0 };
+
     this.setState(
       {
         ...this.state,
@@ -530,7 +544,15 @@ export class GameService extends EventTarget {
     }
 
     try {
-      const newState = this.processGameEvent(event.type, data);
+      let eventData = data;
+      if (event.type === 'phase_change') {
+        eventData = this.resolveStateChannel(data);
+        if (!eventData) {
+          return; // Stale, or waiting for a full state after a missed version
+        }
+      }
+
+      const newState = this.processGameEvent(event.type, eventData);
       this.setState(newState, `NETWORK_EVENT:${event.type.toUpperCase()}`);
     } catch (error) {
       const errorMessage =
@@ -546,6 +568,78 @@ export class GameService extends EventTarget {
     }
   }
 
+  /**
+   * Rebuild full phase_change data from the versioned state channel
+   *
+   * The backend sends phase_change either in full ("version") or as a delta
+   * against the previous version ("version", "base_version", "delta").
+   * Returns the full data, or null if the message is stale or its base
+   * version is missing (a sync_request for the full state is sent then).
+   *
+   * "private" (this player's own hand) comes in full with every message and
+   * is kept out of the channel state that later deltas are applied to.
+   */
+  private resolveStateChannel(data: any): any | null {
+    const { private: privateSection, ...shared } = data || {};
+    const resolved = this.applyStateChannel(shared);
+    if (!resolved || privateSection === undefined) {
+      return resolved;
+    }
+    return { ...resolved, private: privateSection };
+  }
+
+  private applyStateChannel(data: any): any | null {
+    if (typeof data.version !== 'number') {
+      return data; // Unversioned full state (e.g. sent on reconnect)
+    }
+
+    const channel = this.stateChannel;
+    if (data.version <= channel.version) {
+      return null;
+    }
+
+    if (data.delta === undefined) {
+      this.stateChannel = {
+        version: data.version,
+        state: data,
+        syncRequestedAt: 0,
+      };
+      return data;
+    }
+
+    if (data.base_version !== channel.version || !channel.state) {
+      this.requestStateSync();
+      return null;
+    }
+
+    const state = {
+      ...applyStatePatch(channel.state, data.delta),
+      version: data.version,
+      timestamp: data.timestamp,
+      room_id: data.room_id,
+    };
+    this.stateChannel = { version: data.version, state, syncRequestedAt: 0 };
+    return state;
+  }
+
+  /**
+   * Ask the backend for the full current state (at most once per retry window)
+   */
+  private requestStateSync(): void {
+    const { roomId, playerName } = this.state;
+    const now = Date.now();
+    if (
+      !roomId ||
+      now - this.stateChannel.syncRequestedAt < STATE_SYNC_RETRY_MS
+    ) {
+      return;
+    }
+    this.stateChannel.syncRequestedAt = now;
+    networkService.send(roomId, 'sync_request', {
+      client_id: playerName || 'unknown',
+    });
+  }
+
   /**
    * Process game events from backend
    */
@@ -645,12 +739,12 @@ export class GameService extends EventTarget {
     newState.phase = data.phase;
     newState.currentRound = data.round || state.currentRound;
 
-    // Extract my hand from players data (sent by backend)
+    // Extract my hand (sent by backend to this player only, as "private")
     if (data.players && state.playerName && data.players[state.playerName]) {
-      const myPlayerData = data.players[state.playerName];
-      if (myPlayerData.hand) {
+      const myHand = data.private?.hand;
+      if (myHand) {
         // Convert string pieces back to objects for frontend with original indices
-        const unsortedHand = myPlayerData.hand.map(
+        const unsortedHand = myHand.map(
           (pieceStr: string, index: number) => {
             // Parse piece strings like "ELEPHANT_RED(10)" into objects
             const match = pieceStr.match(/^(.+)\((\d+)\)$/);
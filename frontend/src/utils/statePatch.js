@@ -0,0 +1,36 @@
+/**
+ * State Patch Utility
+ *
+ * Applies the state deltas the backend sends on its versioned state channel
+ * (phase_change broadcasts). A patch has the shape built by the backend's
+ * event_codec.make_patch:
+ *   { set: {key: value}, unset: [key], patch: {key: nestedPatch} }
+ * with empty parts omitted.
+ */
+
+/**
+ * Return a new object: `base` with `patch` applied (base is not modified)
+ * @param {Object} base - Previous full state
+ * @param {Object} patch - Delta from the backend
+ * @returns {Object} Updated state
+ */
+export function applyStatePatch(base, patch) {
+  const result = { ...(base || {}) };
+
+  (patch.unset || []).forEach((key) => {
+    delete result[key];
+  });
+
+  Object.entries(patch.patch || {}).forEach(([key, nested]) => {
+    const oldValue = result[key];
+    const isObject =
+      oldValue !== null &&
+      typeof oldValue === 'object' &&
+      !Array.isArray(oldValue);
+    result[key] = applyStatePatch(isObject ? oldValue : {}, nested);
+  });
+
+  return Object.assign(result, patch.set || {});
+}
+
+export default applyStatePatch;